@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Asset manifest: logical asset names -> content-hashed files in the deploy dir.
+
+Build stages (build_css.py, ...) write entries such as
+    {"tailwind.css": "tailwind.3f2a9c1b7d.css"}
+to asset_manifest.json; page_layout reads it to link the current file.
+An entry whose file is missing is ignored, so pages fall back to their
+non-hashed/CDN markup instead of linking a 404.
+"""
+
+import os
+import json
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_FILE = "asset_manifest.json"
+
+
+def load_asset_manifest(deploy_dir=DEPLOY_DIR):
+    path = os.path.join(deploy_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def asset_path(name, deploy_dir=DEPLOY_DIR):
+    """Hashed filename for a logical asset name, or None if it was not built."""
+    filename = load_asset_manifest(deploy_dir).get(name)
+    if filename and os.path.exists(os.path.join(deploy_dir, filename)):
+        return filename
+    return None
+
+
+def asset_text(name, deploy_dir=DEPLOY_DIR):
+    """Contents of a built text asset (e.g. critical CSS to inline), or None if it was not built."""
+    filename = asset_path(name, deploy_dir)
+    if not filename:
+        return None
+    with open(os.path.join(deploy_dir, filename), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def update_asset_manifest(entries, writer):
+    """Merge entries into asset_manifest.json through an OutputWriter."""
+    manifest = load_asset_manifest(writer.output_dir)
+    manifest.update(entries)
+    writer.write(MANIFEST_FILE, json.dumps(dict(sorted(manifest.items())), indent=2) + "\n")
+    return manifest
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: JSON-LD generation for 10k pSEO pages.
+
+Compares the old build_schema_json() (builds the schema dicts and runs
+json.dumps over all of them per page) with the precompiled blocks in
+pseo_html_template, and checks both produce identical output.
+
+Usage:
+    python3 bench_schema_json.py
+    python3 bench_schema_json.py --pages 50000
+"""
+
+import sys
+import json
+import time
+
+from pseo_config import BASE_URL, PRODUCTS
+from pseo_html_template import build_schema_json, WEBPAGE_TYPES
+
+
+def legacy_build_schema_json(slug, title, meta_desc, h1, breadcrumb_category, playbook_type="", products=None):
+    """build_schema_json() before the precompiled blocks, kept as the reference."""
+    canonical = f"{BASE_URL}/{slug}.html"
+    schemas = [{
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": 1, "name": "Úvod", "item": f"{BASE_URL}/index.html"},
+            {"@type": "ListItem", "position": 2, "name": breadcrumb_category, "item": f"{BASE_URL}/katalog.html"},
+            {"@type": "ListItem", "position": 3, "name": h1},
+        ]
+    }]
+    if playbook_type in WEBPAGE_TYPES:
+        schemas.append({
+            "@context": "https://schema.org",
+            "@type": "WebPage",
+            "name": title,
+            "description": meta_desc,
+            "url": canonical,
+            "inLanguage": "cs",
+            "isPartOf": {"@type": "WebSite", "name": "Bazarovyregal.cz", "url": BASE_URL},
+            "publisher": {"@type": "Organization", "name": "Bazarovyregal.cz", "url": BASE_URL,
+                          "email": "info@bazarovyregal.cz"}
+        })
+    if playbook_type == "conversions" and products:
+        offers = [{
+            "@type": "Offer",
+            "name": p.name,
+            "price": p.price,
+            "priceCurrency": "CZK",
+            "availability": "https://schema.org/InStock",
+            "url": f"{BASE_URL}/{p.url}"
+        } for p in products[:6]]
+        if offers:
+            schemas.append({
+                "@context": "https://schema.org",
+                "@type": "OfferCatalog",
+                "name": h1,
+                "description": meta_desc,
+                "itemListElement": offers
+            })
+    tags = ""
+    for s in schemas:
+        tags += f'\n    <script type="application/ld+json">{json.dumps(s, ensure_ascii=False)}</script>'
+    return tags
+
+
+def make_pages(count):
+    """count synthetic pages cycling through the playbook types (every 12th is a conversion page)."""
+    types = sorted(WEBPAGE_TYPES) + [""]
+    pages = []
+    for i in range(count):
+        playbook_type = types[i % len(types)]
+        pages.append({
+            "slug": f"kovove-regaly-{i}",
+            "title": f"Kovové regály č. {i} – \"výprodej\" skladu | Bazarovyregal.cz",
+            "meta_desc": f"Regál {i}: nosnost až 875 kg, doprava od 99 Kč, záruka 7 let.\tSkladem.",
+            "h1": f"Kovové regály {i}",
+            "breadcrumb_category": "Regály podle města",
+            "playbook_type": playbook_type,
+            "products": PRODUCTS if playbook_type == "conversions" else None,
+        })
+    return pages
+
+
+def timed(fn, pages, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in pages:
+            fn(**p)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = 10000
+    if "--pages" in sys.argv:
+        count = int(sys.argv[sys.argv.index("--pages") + 1])
+    pages = make_pages(count)
+    for p in pages:
+        assert build_schema_json(**p) == legacy_build_schema_json(**p), p["slug"]
+
+    print(f"JSON-LD benchmark ({count:,} pages)")
+    old = timed(legacy_build_schema_json, pages)
+    new = timed(build_schema_json, pages)
+    for label, elapsed in (("dicts + json.dumps", old), ("precompiled blocks", new)):
+        print(f"    {label:<20} {elapsed * 1000:>8.1f} ms total  {elapsed / count * 1e6:>6.2f} us/page")
+    print(f"    speedup              {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
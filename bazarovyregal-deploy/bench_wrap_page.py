@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-page cost of the pSEO layout.
+
+Compares formatting the whole document per page (str.format_map over
+page_layout.layout_template(), the cost profile of the old one-f-string
+wrap_page) and joining the layout pieces per page with the precompiled chunk
+join in wrap_page(), for small and large page bodies. Every case starts from
+the same page arguments, so slot values (head_meta, breadcrumb, main, ...)
+are computed inside each timed call, and every case ends in UTF-8 bytes as
+written by the generators.
+
+Usage:
+    python3 bench_wrap_page.py
+    python3 bench_wrap_page.py --number 20000
+"""
+
+import sys
+import timeit
+
+from page_layout import layout_template, DOCUMENT, DOCUMENT_SLOTS, Slot
+from pseo_html_template import wrap_page, build_schema_json, _layout_values
+
+LAYOUT_TEMPLATE = layout_template()
+EMPTY_SLOTS = dict.fromkeys(DOCUMENT_SLOTS, "")
+
+
+def format_document(**values):
+    """The whole document formatted per page (unspecified slots are empty)."""
+    return LAYOUT_TEMPLATE.format_map(dict(EMPTY_SLOTS, **values))
+
+
+def join_pieces(**values):
+    """The uncompiled layout pieces joined per page."""
+    return "".join(values.get(piece.name, "") if isinstance(piece, Slot) else piece for piece in DOCUMENT)
+
+
+PAGE = {
+    "slug": "kovove-regaly-praha",
+    "title": "Kovové regály Praha – likvidace skladu | Bazarovyregal.cz",
+    "meta_desc": "Kovové regály v Praze se slevou až 75 %. Doprava od 99 Kč, záruka 7 let.",
+    "h1": "Kovové regály Praha",
+    "breadcrumb_category": "Regály podle města",
+}
+
+
+def bench(body_html, number):
+    schema = build_schema_json(playbook_type="locations", **PAGE)
+    args = dict(PAGE, body_html=body_html, schema_json=schema)
+
+    def values():
+        return _layout_values(canonical_url="", **args)
+
+    assert format_document(**values()) == join_pieces(**values()) == wrap_page(family=None, **args)
+
+    cases = [
+        ("format_map", lambda: format_document(**values()).encode("utf-8")),
+        ("join layout pieces", lambda: join_pieces(**values()).encode("utf-8")),
+        ("wrap_page (chunk join)", lambda: wrap_page(family=None, **args).encode("utf-8")),
+    ]
+    print(f"\n  body_html: {len(body_html):,} chars, {number:,} pages")
+    for label, fn in cases:
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"    {label:<26} {best * 1e6:>8.2f} us/page")
+
+
+def main():
+    number = 5000
+    if "--number" in sys.argv:
+        number = int(sys.argv[sys.argv.index("--number") + 1])
+    paragraph = "<p>Kovové regály s nosností až 875 kg, bezšroubová montáž za 10 minut.</p>\n"
+    print("wrap_page layout benchmark")
+    # 120 paragraphs ~ the median pSEO body (9 KB)
+    for repeat in (0, 10, 120, 200):
+        bench(paragraph * repeat, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Content-hash fingerprinting of static assets, plus cache headers in vercel.json.
+
+Every asset in the deploy dir (FINGERPRINT_GLOBS) that a page references by a
+fixed name (chatbot.js, home.png, ...) is copied to <name>.<hash>.<ext> and
+recorded in asset_manifest.json; quoted references in all pages ("chatbot.js",
+'chatbot.js', and fingerprints of an earlier build) are rewritten to the
+current file. page_layout loads chatbot.js through the manifest, so generated
+pages pick it up on their next run. Outputs of the other build stages
+(tailwind.<hash>.css, inter.<hash>.woff2, image variants) are already hashed.
+
+vercel.json gets HEADERS: hashed files are cached for a year as immutable,
+everything else (pages, sitemap, unhashed files) revalidates after a few
+minutes, so a deploy is picked up quickly while assets are never re-fetched.
+The committed vercel.json already carries HEADERS, so a deploy without this
+step keeps the cache policy; the build only keeps it in sync.
+
+Run it after the generators and the other build_*.py stages.
+
+Usage:
+    python3 build_assets.py             # fingerprint, rewrite pages, update vercel.json
+    python3 build_assets.py --dry-run   # report what would change
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import hashlib
+
+from asset_manifest import update_asset_manifest
+from build_output import OutputWriter
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+FINGERPRINT_GLOBS = ("*.js", "*.css", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.avif", "*.ico", "*.woff2")
+HASHED_RE = re.compile(r"\.([0-9a-f]{10})(\.\w+)$")
+HASHED_EXTENSIONS = "js|css|png|jpe?g|gif|svg|webp|avif|ico|woff2"
+
+# Later rules override earlier ones for the same header, so the immutable rule comes last
+HEADERS = [
+    {"source": "/(.*)",
+     "headers": [{"key": "Cache-Control", "value": "public, max-age=300, must-revalidate"}]},
+    {"source": f"/:file([^/]+\\.[0-9a-f]{{10}}\\.(?:{HASHED_EXTENSIONS}))",
+     "headers": [{"key": "Cache-Control", "value": "public, max-age=31536000, immutable"}]},
+]
+
+
+def unhashed(name):
+    """chatbot.3f2a9c1b7d.js -> chatbot.js"""
+    return HASHED_RE.sub(r"\2", name)
+
+
+def fingerprint_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}"
+
+
+def asset_sources(deploy_dir=DEPLOY_DIR):
+    """Unhashed asset files that can be fingerprinted."""
+    names = set()
+    for pattern in FINGERPRINT_GLOBS:
+        names.update(os.path.basename(p) for p in glob.glob(os.path.join(deploy_dir, pattern)))
+    return sorted(n for n in names if not HASHED_RE.search(n))
+
+
+def _reference_re(names):
+    # A quoted asset name or an earlier fingerprint of it; build_images' data-image keeps the source name
+    alternatives = "|".join(re.escape(os.path.splitext(n)[0]) + r"(?:\.[0-9a-f]{10})?" + re.escape(os.path.splitext(n)[1])
+                            for n in names)
+    return re.compile(r"""(?<!data-image=)(["'])(""" + alternatives + r")\1")
+
+
+def referenced_assets(pages, names):
+    """Asset names (unhashed) quoted in the given page texts."""
+    if not names:
+        return set()
+    pattern = _reference_re(names)
+    return {unhashed(m.group(2)) for html in pages for m in pattern.finditer(html)}
+
+
+def rewrite_page(html, fingerprints):
+    """Point quoted asset references at their current fingerprinted file."""
+    if not fingerprints:
+        return html
+    return _reference_re(sorted(fingerprints)).sub(
+        lambda m: m.group(1) + fingerprints[unhashed(m.group(2))] + m.group(1), html)
+
+
+def vercel_config(config):
+    """vercel.json with the cache HEADERS (other settings and header rules kept)."""
+    ours = {rule["source"] for rule in HEADERS}
+    rules = [rule for rule in config.get("headers", []) if rule["source"] not in ours and
+             not rule["source"].startswith("/:file(")]
+    return dict(config, headers=rules + HEADERS)
+
+
+def build(deploy_dir=DEPLOY_DIR, writer=None):
+    writer = writer or OutputWriter(deploy_dir)
+    page_paths = sorted(glob.glob(os.path.join(deploy_dir, "*.html")))
+    pages = {}
+    for path in page_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+
+    sources = asset_sources(deploy_dir)
+    fingerprints = {}
+    for name in sorted(referenced_assets(pages.values(), sources)):
+        with open(os.path.join(deploy_dir, name), "rb") as f:
+            data = f.read()
+        fingerprints[name] = fingerprint_name(name, data)
+        writer.write(fingerprints[name], data)
+
+    # Earlier fingerprints of these assets
+    for name in sources:
+        stem, ext = os.path.splitext(name)
+        for old in glob.glob(os.path.join(deploy_dir, f"{glob.escape(stem)}.*{ext}")):
+            old = os.path.basename(old)
+            if HASHED_RE.search(old) and unhashed(old) == name and old != fingerprints.get(name):
+                writer.remove(old)
+    update_asset_manifest(fingerprints, writer)
+
+    rewritten = 0
+    for filename, html in pages.items():
+        if writer.write(filename, rewrite_page(html, fingerprints)) == "changed":
+            rewritten += 1
+
+    config_path = os.path.join(deploy_dir, "vercel.json")
+    config = {}
+    if os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    writer.write("vercel.json", json.dumps(vercel_config(config), indent=2, ensure_ascii=False) + "\n")
+    return fingerprints, rewritten
+
+
+def main():
+    writer = OutputWriter(DEPLOY_DIR, dry_run="--dry-run" in sys.argv)
+    fingerprints, rewritten = build(writer=writer)
+    for name, hashed in fingerprints.items():
+        print(f"  {name:<25} -> {hashed}")
+    print(f"Fingerprinted {len(fingerprints)} assets, rewrote references in {rewritten} pages")
+    if writer.dry_run:
+        writer.report("Asset build output")
+
+
+if __name__ == "__main__":
+    main()
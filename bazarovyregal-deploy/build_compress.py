@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Precompressed siblings (.gz, .br) of the deploy dir's text files, plus a transfer-size report.
+
+For every *.html, *.js, *.css, *.xml and *.txt file, writes <file>.gz
+(gzip -9) and <file>.br (Brotli quality 11) next to it. A sibling newer than
+its source is kept, so re-runs only compress what the generators rewrote.
+The siblings this stage wrote are listed in .compress_siblings.json, and
+only those are removed once their source is gone; other .gz files (the
+sitemap-N.xml.gz shards from sitemap_writer.py) are left alone. dev_server.py serves the siblings
+with Content-Encoding when the client accepts them, so local measurements
+see real transfer sizes. Vercel compresses on its own; .vercelignore keeps
+the siblings out of deploys.
+
+The report lists raw vs. compressed bytes per file type, and how much of the
+HTML is template boilerplate: lines that repeat on at least
+BOILERPLATE_SHARE of all pages (header, footer, chat, head tags, ...).
+
+Brotli is optional (pip install brotli); without it only .gz is written.
+
+Usage:
+    python3 build_compress.py             # compress changed files and print the report
+    python3 build_compress.py --force     # recompress everything
+    python3 build_compress.py --dry-run   # report what would change
+"""
+
+import os
+import sys
+import gzip
+import json
+import zlib
+from collections import Counter
+
+from build_output import OutputWriter
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPRESS_EXTENSIONS = (".html", ".js", ".css", ".xml", ".txt")
+# Siblings written by this stage (local build state, not deployed)
+STATE_FILE = ".compress_siblings.json"
+# A line on at least this share of HTML pages counts as template boilerplate
+BOILERPLATE_SHARE = 0.1
+
+
+def encodings():
+    """[(sibling extension, compress function)] for the available encoders."""
+    # mtime=0: identical input gives identical .gz bytes
+    result = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli:
+        result.append((".br", lambda data: brotli.compress(data, quality=11)))
+    return result
+
+
+def text_files(deploy_dir=DEPLOY_DIR):
+    return sorted(name for name in os.listdir(deploy_dir)
+                  if name.endswith(COMPRESS_EXTENSIONS) and os.path.isfile(os.path.join(deploy_dir, name)))
+
+
+def load_siblings(deploy_dir=DEPLOY_DIR):
+    path = os.path.join(deploy_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def _fresh(source, sibling):
+    return os.path.exists(sibling) and os.path.getmtime(sibling) >= os.path.getmtime(source)
+
+
+def boilerplate_report(pages):
+    """(raw HTML bytes, raw boilerplate bytes, deflated HTML bytes, deflated boilerplate bytes) for {name: bytes}."""
+    if not pages:
+        return 0, 0, 0, 0
+    lines = {name: data.splitlines(keepends=True) for name, data in pages.items()}
+    counts = Counter(line.strip() for page_lines in lines.values() for line in set(page_lines) if line.strip())
+    shared = {line for line, n in counts.items() if n >= max(2, BOILERPLATE_SHARE * len(pages))}
+    raw = raw_shared = packed = packed_shared = 0
+    for name, page_lines in lines.items():
+        boilerplate = b"".join(line for line in page_lines if line.strip() in shared)
+        raw += len(pages[name])
+        raw_shared += len(boilerplate)
+        # Same (fast) compressor for both, so the ratio estimates the share of transferred bytes
+        packed += len(zlib.compress(pages[name], 6))
+        packed_shared += len(zlib.compress(boilerplate, 6))
+    return raw, raw_shared, packed, min(packed_shared, packed)
+
+
+def build(deploy_dir=DEPLOY_DIR, writer=None, force=False):
+    """Write siblings; returns ({type: [files, raw, {ext: bytes}]}, {html name: bytes}, compressed count)."""
+    writer = writer or OutputWriter(deploy_dir)
+    totals = {}
+    pages = {}
+    compressed = 0
+    siblings = []
+    names = text_files(deploy_dir)
+    for name in names:
+        path = os.path.join(deploy_dir, name)
+        with open(path, "rb") as f:
+            data = f.read()
+        file_type = os.path.splitext(name)[1][1:]
+        entry = totals.setdefault(file_type, [0, 0, {}])
+        entry[0] += 1
+        entry[1] += len(data)
+        if file_type == "html":
+            pages[name] = data
+        for ext, compress in encodings():
+            sibling = path + ext
+            siblings.append(name + ext)
+            if not force and _fresh(path, sibling):
+                size = os.path.getsize(sibling)
+            else:
+                packed = compress(data)
+                writer.write(name + ext, packed)
+                size = len(packed)
+                compressed += 1
+            entry[2][ext] = entry[2].get(ext, 0) + size
+
+    # Only siblings this stage wrote: sitemap shards are .xml.gz files without an .xml source
+    for stale in sorted(set(load_siblings(deploy_dir)) - set(siblings)):
+        writer.remove(stale)
+    writer.write(STATE_FILE, json.dumps(siblings, indent=2) + "\n")
+    return totals, pages, compressed
+
+
+def print_report(totals, pages):
+    exts = [ext for ext, _ in encodings()]
+    print(f"  {'type':<6} {'files':>6} {'raw':>12}" + "".join(f" {ext[1:]:>18}" for ext in exts))
+    all_raw = 0
+    all_packed = dict.fromkeys(exts, 0)
+    for file_type, (files, raw, packed) in sorted(totals.items(), key=lambda t: -t[1][1]):
+        cells = "".join(f" {packed[ext]:>11,} ({packed[ext] / raw:>4.0%})" if raw else f" {0:>18}" for ext in exts)
+        print(f"  {file_type:<6} {files:>6} {raw:>12,}{cells}")
+        all_raw += raw
+        for ext in exts:
+            all_packed[ext] += packed[ext]
+    cells = "".join(f" {all_packed[ext]:>11,} ({all_packed[ext] / all_raw:>4.0%})" if all_raw else "" for ext in exts)
+    print(f"  {'total':<6} {sum(t[0] for t in totals.values()):>6} {all_raw:>12,}{cells}")
+
+    raw, raw_shared, packed, packed_shared = boilerplate_report(pages)
+    if raw:
+        print(f"\n  HTML boilerplate (lines on >= {BOILERPLATE_SHARE:.0%} of {len(pages)} pages): "
+              f"{raw_shared:,} of {raw:,} B raw ({raw_shared / raw:.0%}), "
+              f"~{packed_shared / packed:.0%} of compressed bytes")
+
+
+def main():
+    writer = OutputWriter(DEPLOY_DIR, dry_run="--dry-run" in sys.argv)
+    totals, pages, compressed = build(writer=writer, force="--force" in sys.argv)
+    print(f"Compressed {compressed} siblings" + ("" if brotli else " (gzip only: pip install brotli for .br)"))
+    print_report(totals, pages)
+    if writer.dry_run:
+        writer.report("Compression output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1042 @@
+#!/usr/bin/env python3
+"""
+Build-time Tailwind: a purged static stylesheet instead of cdn.tailwindcss.com.
+
+Scans the deploy directory (*.html, *.js and the generator sources *.py)
+for class candidates the same way Tailwind's content scanner does, generates
+CSS only for the utilities that occur, and writes tailwind.<hash>.css plus
+an "tailwind.css" entry in asset_manifest.json. page_layout links that file
+instead of the CDN script; without a built stylesheet it keeps the CDN.
+
+Supports the Tailwind v3 subset used on the site: layout, flex/grid,
+spacing, sizing, typography, colors (default palette plus the primary/danger
+theme from the inline tailwind.config), borders, shadows, rings, gradients,
+transforms, transitions, arbitrary values (max-w-[80%]), opacity modifiers
+(bg-white/20), the typography plugin's prose/prose-lg/prose-gray/not-prose
+and the sm/md/lg/xl, hover, focus and group-hover variants. A class name in
+a class="..." attribute that is neither generated, defined in a page <style>
+block nor a known JS hook (HOOK_CLASSES) fails the build, so a page never
+ships with utilities that have no CSS.
+
+An older tailwind.<hash>.css is kept while any page still links it (generated
+pages are relinked only when their generator runs again) and removed by the
+first build after the last reference is gone.
+
+Critical CSS: for each layout family (page_layout.FAMILIES) the classes of
+its pages from <body> down to the fold (the first element below the fold in
+that template, see CRITICAL_FOLD) plus the fixed chat widget are collected,
+and their CSS is written to critical-<family>.<hash>.css ("critical-<family>.css"
+in the manifest). page_layout inlines it in <head> and preloads the full
+stylesheet, so first paint does not wait on a stylesheet request. Families
+whose pages have not been generated yet are skipped; run the generators,
+then build_css.py again.
+
+Usage:
+    python3 build_css.py             # build the stylesheet, then run the generators
+    python3 build_css.py --static    # ... and relink hand-written pages (index.html, katalog.html, ...)
+    python3 build_css.py --dry-run   # report what would change
+"""
+
+import os
+import re
+import sys
+import glob
+import hashlib
+
+from asset_manifest import load_asset_manifest, update_asset_manifest
+from build_output import OutputWriter
+from page_layout import FAMILIES, fragment, stylesheet_tags
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_GLOBS = ("*.html", "*.js", "*.py")
+ASSET_NAME = "tailwind.css"
+
+# First element below the fold per layout family; CSS for everything before it (and for it) is inlined
+CRITICAL_FOLD = {
+    "article": r"<h2\b",                          # heading, intro paragraphs
+    "landing": r"<h2\b",
+    "product": r'\bdata-tab="',                    # gallery, price and cart; tabs are below
+    "catalog": r'\bid="productGrid"|<section\b',   # filters and the first row of the grid
+}
+# Families whose above-the-fold content is rendered by inline scripts (catalog product cards)
+CRITICAL_SCRIPTS = {"catalog"}
+# Characters of <main> treated as above the fold when a page has no fold marker
+FOLD_FALLBACK = 6000
+# Hand-written pages that use a layout family's critical CSS
+STATIC_FAMILIES = {"katalog.html": "catalog"}
+
+SCREENS = [("sm", "640px"), ("md", "768px"), ("lg", "1024px"), ("xl", "1280px"), ("2xl", "1536px")]
+STATE_VARIANTS = ["group-hover", "hover", "focus"]
+
+# Tailwind v3 default palette (50-900) plus the theme.extend.colors of the inline config
+COLORS = {
+    "slate": "f8fafc f1f5f9 e2e8f0 cbd5e1 94a3b8 64748b 475569 334155 1e293b 0f172a",
+    "gray": "f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827",
+    "red": "fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d",
+    "orange": "fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12",
+    "amber": "fffbeb fef3c7 fde68a fcd34d fbbf24 f59e0b d97706 b45309 92400e 78350f",
+    "yellow": "fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12",
+    "lime": "f7fee7 ecfccb d9f99d bef264 a3e635 84cc16 65a30d 4d7c0f 3f6212 365314",
+    "green": "f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d",
+    "emerald": "ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b",
+    "teal": "f0fdfa ccfbf1 99f6e4 5eead4 2dd4bf 14b8a6 0d9488 0f766e 115e59 134e4a",
+    "cyan": "ecfeff cffafe a5f3fc 67e8f9 22d3ee 06b6d4 0891b2 0e7490 155e75 164e63",
+    "sky": "f0f9ff e0f2fe bae6fd 7dd3fc 38bdf8 0ea5e9 0284c7 0369a1 075985 0c4a6e",
+    "blue": "eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a",
+    "indigo": "eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81",
+    "violet": "f5f3ff ede9fe ddd6fe c4b5fd a78bfa 8b5cf6 7c3aed 6d28d9 5b21b6 4c1d95",
+    "purple": "faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87",
+    "pink": "fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843",
+    "rose": "fff1f2 ffe4e6 fecdd3 fda4af fb7185 f43f5e e11d48 be123c 9f1239 881337",
+}
+PALETTE = {
+    name: dict(zip(("50", "100", "200", "300", "400", "500", "600", "700", "800", "900"),
+                   ("#" + c for c in shades.split())))
+    for name, shades in COLORS.items()
+}
+PALETTE["primary"] = dict(PALETTE["orange"])
+PALETTE["danger"] = {"500": "#ef4444", "600": "#dc2626", "700": "#b91c1c"}
+SPECIAL_COLORS = {"white": "#fff", "black": "#000", "transparent": "transparent",
+                  "current": "currentColor", "inherit": "inherit"}
+
+FONT_FAMILY = {
+    "sans": "Inter, sans-serif",
+    "serif": 'ui-serif, Georgia, Cambria, "Times New Roman", Times, serif',
+    "mono": 'ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace',
+}
+FONT_SIZE = {
+    "xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+    "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"), "5xl": ("3rem", "1"),
+    "6xl": ("3.75rem", "1"), "7xl": ("4.5rem", "1"), "8xl": ("6rem", "1"), "9xl": ("8rem", "1"),
+}
+FONT_WEIGHT = {"thin": 100, "extralight": 200, "light": 300, "normal": 400, "medium": 500,
+               "semibold": 600, "bold": 700, "extrabold": 800, "black": 900}
+LINE_HEIGHT = {"none": "1", "tight": "1.25", "snug": "1.375", "normal": "1.5", "relaxed": "1.625", "loose": "2"}
+LETTER_SPACING = {"tighter": "-0.05em", "tight": "-0.025em", "normal": "0em", "wide": "0.025em",
+                  "wider": "0.05em", "widest": "0.1em"}
+RADIUS = {"none": "0px", "sm": "0.125rem", "": "0.25rem", "md": "0.375rem", "lg": "0.5rem",
+          "xl": "0.75rem", "2xl": "1rem", "3xl": "1.5rem", "full": "9999px"}
+MAX_WIDTH = {"none": "none", "xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem", "xl": "36rem",
+             "2xl": "42rem", "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem", "7xl": "80rem",
+             "full": "100%", "min": "min-content", "max": "max-content", "fit": "fit-content",
+             "prose": "65ch", "screen-sm": "640px", "screen-md": "768px", "screen-lg": "1024px",
+             "screen-xl": "1280px"}
+SHADOW = {
+    "sm": "0 1px 2px 0 {c05}",
+    "": "0 1px 3px 0 {c1}, 0 1px 2px -1px {c1}",
+    "md": "0 4px 6px -1px {c1}, 0 2px 4px -2px {c1}",
+    "lg": "0 10px 15px -3px {c1}, 0 4px 6px -4px {c1}",
+    "xl": "0 20px 25px -5px {c1}, 0 8px 10px -6px {c1}",
+    "2xl": "0 25px 50px -12px {c25}",
+    "inner": "inset 0 2px 4px 0 {c05}",
+    "none": "0 0 #0000",
+}
+TRANSITION = {
+    "": "color, background-color, border-color, text-decoration-color, fill, stroke, opacity, box-shadow, "
+        "transform, filter, backdrop-filter",
+    "all": "all",
+    "colors": "color, background-color, border-color, text-decoration-color, fill, stroke",
+    "opacity": "opacity",
+    "shadow": "box-shadow",
+    "transform": "transform",
+}
+KEYFRAMES = {
+    "spin": ("@keyframes spin{to{transform:rotate(360deg)}}", "spin 1s linear infinite"),
+    "ping": ("@keyframes ping{75%,100%{transform:scale(2);opacity:0}}", "ping 1s cubic-bezier(0, 0, 0.2, 1) infinite"),
+    "pulse": ("@keyframes pulse{50%{opacity:.5}}", "pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite"),
+    "bounce": ("@keyframes bounce{0%,100%{transform:translateY(-25%);animation-timing-function:cubic-bezier(0.8,0,1,1)}"
+               "50%{transform:none;animation-timing-function:cubic-bezier(0,0,0.2,1)}}", "bounce 1s infinite"),
+}
+# @tailwindcss/typography (v0.5), default and lg sizes: element selector -> declarations
+PROSE_COLORS = ("--tw-prose-body:#374151;--tw-prose-headings:#111827;--tw-prose-links:#111827;"
+                "--tw-prose-bold:#111827;--tw-prose-counters:#6b7280;--tw-prose-bullets:#d1d5db;"
+                "--tw-prose-hr:#e5e7eb;--tw-prose-quotes:#111827;--tw-prose-quote-borders:#e5e7eb;"
+                "--tw-prose-code:#111827;--tw-prose-th-borders:#d1d5db;--tw-prose-td-borders:#e5e7eb")
+PROSE = [
+    ("p", "margin-top:1.25em;margin-bottom:1.25em"),
+    ("a", "color:var(--tw-prose-links);text-decoration:underline;font-weight:500"),
+    ("strong", "color:var(--tw-prose-bold);font-weight:600"),
+    ("ol", "list-style-type:decimal;margin-top:1.25em;margin-bottom:1.25em;padding-left:1.625em"),
+    ("ul", "list-style-type:disc;margin-top:1.25em;margin-bottom:1.25em;padding-left:1.625em"),
+    ("ol > li::marker", "font-weight:400;color:var(--tw-prose-counters)"),
+    ("ul > li::marker", "color:var(--tw-prose-bullets)"),
+    ("li", "margin-top:0.5em;margin-bottom:0.5em"),
+    ("ol > li, ul > li", "padding-left:0.375em"),
+    ("hr", "border-color:var(--tw-prose-hr);border-top-width:1px;margin-top:3em;margin-bottom:3em"),
+    ("blockquote", "font-weight:500;font-style:italic;color:var(--tw-prose-quotes);border-left-width:0.25rem;"
+                   "border-left-color:var(--tw-prose-quote-borders);margin-top:1.6em;margin-bottom:1.6em;"
+                   "padding-left:1em"),
+    ("h1", "color:var(--tw-prose-headings);font-weight:800;font-size:2.25em;margin-top:0;"
+           "margin-bottom:0.8888889em;line-height:1.1111111"),
+    ("h2", "color:var(--tw-prose-headings);font-weight:700;font-size:1.5em;margin-top:2em;margin-bottom:1em;"
+           "line-height:1.3333333"),
+    ("h3", "color:var(--tw-prose-headings);font-weight:600;font-size:1.25em;margin-top:1.6em;"
+           "margin-bottom:0.6em;line-height:1.6"),
+    ("h4", "color:var(--tw-prose-headings);font-weight:600;margin-top:1.5em;margin-bottom:0.5em;line-height:1.5"),
+    ("img", "margin-top:2em;margin-bottom:2em"),
+    ("code", "color:var(--tw-prose-code);font-weight:600;font-size:0.875em"),
+    ("table", "width:100%;table-layout:auto;text-align:left;margin-top:2em;margin-bottom:2em;font-size:0.875em;"
+              "line-height:1.7142857"),
+    ("thead", "border-bottom-width:1px;border-bottom-color:var(--tw-prose-th-borders)"),
+    ("thead th", "color:var(--tw-prose-headings);font-weight:600;vertical-align:bottom;padding-right:0.5714286em;"
+                 "padding-bottom:0.5714286em;padding-left:0.5714286em"),
+    ("tbody tr", "border-bottom-width:1px;border-bottom-color:var(--tw-prose-td-borders)"),
+    ("tbody td", "vertical-align:baseline;padding:0.5714286em"),
+]
+PROSE_LG = [
+    ("p", "margin-top:1.3333333em;margin-bottom:1.3333333em"),
+    ("h2", "font-size:1.6666667em;margin-top:1.8666667em;margin-bottom:1.0666667em;line-height:1.3333333"),
+    ("h3", "font-size:1.3333333em;margin-top:1.6666667em;margin-bottom:0.6666667em;line-height:1.5"),
+    ("ol, ul", "margin-top:1.3333333em;margin-bottom:1.3333333em;padding-left:1.5555556em"),
+    ("li", "margin-top:0.6666667em;margin-bottom:0.6666667em"),
+    ("ol > li, ul > li", "padding-left:0.4444444em"),
+    ("blockquote", "margin-top:1.6666667em;margin-bottom:1.6666667em;padding-left:1em"),
+    ("img", "margin-top:1.7777778em;margin-bottom:1.7777778em"),
+    ("table", "font-size:0.8888889em;line-height:1.5"),
+]
+PROSE_EDGES = [("> :first-child", "margin-top:0"), ("> :last-child", "margin-bottom:0")]
+
+TRANSFORM = ("translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) "
+             "skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))")
+SIDES = {"t": ["top"], "r": ["right"], "b": ["bottom"], "l": ["left"],
+         "x": ["left", "right"], "y": ["top", "bottom"]}
+CORNERS = {"t": ["top-left", "top-right"], "r": ["top-right", "bottom-right"],
+           "b": ["bottom-right", "bottom-left"], "l": ["top-left", "bottom-left"],
+           "tl": ["top-left"], "tr": ["top-right"], "br": ["bottom-right"], "bl": ["bottom-left"]}
+
+TW_VARIABLES = (
+    "*,::before,::after{--tw-translate-x:0;--tw-translate-y:0;--tw-rotate:0;--tw-skew-x:0;--tw-skew-y:0;"
+    "--tw-scale-x:1;--tw-scale-y:1;--tw-ring-inset: ;--tw-ring-offset-width:0px;--tw-ring-offset-color:#fff;"
+    "--tw-ring-color:rgb(59 130 246 / 0.5);--tw-ring-offset-shadow:0 0 #0000;--tw-ring-shadow:0 0 #0000;"
+    "--tw-shadow:0 0 #0000;--tw-shadow-colored:0 0 #0000}\n"
+)
+
+# Tailwind's Preflight (base reset), which the CDN script also injects
+PREFLIGHT = """*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}
+::before,::after{--tw-content:''}
+html,:host{line-height:1.5;-webkit-text-size-adjust:100%;-moz-tab-size:4;tab-size:4;font-family:Inter, sans-serif;-webkit-tap-highlight-color:transparent}
+body{margin:0;line-height:inherit}
+hr{height:0;color:inherit;border-top-width:1px}
+abbr:where([title]){-webkit-text-decoration:underline dotted;text-decoration:underline dotted}
+h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}
+a{color:inherit;text-decoration:inherit}
+b,strong{font-weight:bolder}
+code,kbd,samp,pre{font-family:ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;font-size:1em}
+small{font-size:80%}
+sub,sup{font-size:75%;line-height:0;position:relative;vertical-align:baseline}
+sub{bottom:-0.25em}
+sup{top:-0.5em}
+table{text-indent:0;border-color:inherit;border-collapse:collapse}
+button,input,optgroup,select,textarea{font-family:inherit;font-feature-settings:inherit;font-variation-settings:inherit;font-size:100%;font-weight:inherit;line-height:inherit;letter-spacing:inherit;color:inherit;margin:0;padding:0}
+button,select{text-transform:none}
+button,input:where([type='button']),input:where([type='reset']),input:where([type='submit']){-webkit-appearance:button;background-color:transparent;background-image:none}
+:-moz-focusring{outline:auto}
+:-moz-ui-invalid{box-shadow:none}
+progress{vertical-align:baseline}
+::-webkit-inner-spin-button,::-webkit-outer-spin-button{height:auto}
+[type='search']{-webkit-appearance:textfield;outline-offset:-2px}
+::-webkit-search-decoration{-webkit-appearance:none}
+::-webkit-file-upload-button{-webkit-appearance:button;font:inherit}
+summary{display:list-item}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}
+fieldset{margin:0;padding:0}
+legend{padding:0}
+ol,ul,menu{list-style:none;margin:0;padding:0}
+dialog{padding:0}
+textarea{resize:vertical}
+input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}
+button,[role="button"]{cursor:pointer}
+:disabled{cursor:default}
+img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}
+img,video{max-width:100%;height:auto}
+[hidden]{display:none}
+"""
+
+
+# --- values -----------------------------------------------------------------
+
+def spacing(value):
+    """Spacing scale: 0, px, 0.5 ... 96 (steps of 0.25rem)."""
+    if value == "px":
+        return "1px"
+    if value == "0":
+        return "0px"
+    if not re.fullmatch(r"\d+(\.5)?", value):
+        return None
+    n = float(value)
+    if n > 96 or (n > 12 and n not in (14, 16, 20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60, 64, 72, 80, 96)):
+        return None
+    if n % 1 and n > 3.5:
+        return None
+    return f"{n * 0.25:g}rem"
+
+
+def fraction(value):
+    m = re.fullmatch(r"(\d+)/(\d+)", value)
+    if not m or int(m.group(2)) == 0:
+        return None
+    percent = f"{int(m.group(1)) / int(m.group(2)) * 100:.6f}".rstrip("0").rstrip(".")
+    return percent + "%"
+
+
+def arbitrary(value):
+    if value.startswith("[") and value.endswith("]") and len(value) > 2:
+        return value[1:-1].replace("_", " ")
+    return None
+
+
+def length(value, extra=None):
+    """Spacing, fraction, arbitrary value or one of extra (dict)."""
+    if extra and value in extra:
+        return extra[value]
+    return spacing(value) or fraction(value) or arbitrary(value)
+
+
+def color(value):
+    """CSS color for gray-500, primary-50/20, white, [#123456] ...; None if not a color."""
+    value, _, alpha = value.partition("/")
+    if value in SPECIAL_COLORS:
+        css = SPECIAL_COLORS[value]
+    elif arbitrary(value) and arbitrary(value).startswith("#"):
+        css = arbitrary(value)
+    else:
+        name, _, shade = value.rpartition("-")
+        css = PALETTE.get(name, {}).get(shade)
+    if css is None:
+        return None
+    if not alpha:
+        return css
+    if not css.startswith("#") or not alpha.isdigit():
+        return None
+    return f"rgb({_rgb(css)} / {int(alpha) / 100:g})"
+
+
+def _rgb(hex_color):
+    h = hex_color[1:]
+    if len(h) == 3:
+        h = "".join(c * 2 for c in h)
+    return " ".join(str(int(h[i:i + 2], 16)) for i in (0, 2, 4))
+
+
+def transparent(css):
+    return f"rgb({_rgb(css)} / 0)" if css.startswith("#") else "rgb(255 255 255 / 0)"
+
+
+def _negate(value):
+    return value if value in ("0px", "auto") else "-" + value
+
+
+# --- utilities --------------------------------------------------------------
+# Each plugin: (name, regex, handler). A handler returns a declaration string,
+# or a list of (selector template, declarations) with "&" for the class selector,
+# or None. Plugins are listed in Tailwind's output order, which decides which
+# utility wins when two set the same property (p-4 before px-6, text-sm before leading-*).
+
+def _simple(table):
+    return lambda m: table.get(m.group(1))
+
+
+def _display(m):
+    return {"block": "display:block", "inline-block": "display:inline-block", "inline": "display:inline",
+            "flex": "display:flex", "inline-flex": "display:inline-flex", "grid": "display:grid",
+            "inline-grid": "display:inline-grid", "table": "display:table", "contents": "display:contents",
+            "list-item": "display:list-item", "hidden": "display:none"}.get(m.group(1))
+
+
+def _inset(m):
+    neg, prop, value = m.groups()
+    css = length(value, {"auto": "auto", "full": "100%"})
+    if css is None:
+        return None
+    css = _negate(css) if neg else css
+    props = {"inset": ["inset"], "inset-x": ["left", "right"], "inset-y": ["top", "bottom"]}.get(prop, [prop])
+    return ";".join(f"{p}:{css}" for p in props)
+
+
+def _z(m):
+    value = m.group(1)
+    if value in ("0", "10", "20", "30", "40", "50", "auto"):
+        return f"z-index:{value}"
+    return f"z-index:{arbitrary(value)}" if arbitrary(value) else None
+
+
+def _box_sides(prop):
+    def handler(m):
+        neg, side, value = m.groups()
+        css = spacing(value) or arbitrary(value) or ("auto" if value == "auto" and prop == "margin" else None)
+        if css is None:
+            return None
+        css = _negate(css) if neg else css
+        if not side:
+            return f"{prop}:{css}"
+        return ";".join(f"{prop}-{s}:{css}" for s in SIDES[side])
+    return handler
+
+
+def _size(prop, extra):
+    def handler(m):
+        css = length(m.group(1), extra)
+        return f"{prop}:{css}" if css else None
+    return handler
+
+
+def _line_clamp(m):
+    if m.group(1) == "none":
+        return "overflow:visible;display:block;-webkit-box-orient:horizontal;-webkit-line-clamp:none"
+    return f"overflow:hidden;display:-webkit-box;-webkit-box-orient:vertical;-webkit-line-clamp:{m.group(1)}"
+
+
+def _transform_part(var_x, var_y, unit_value):
+    def handler(m):
+        neg, axis, value = m.groups()
+        css = unit_value(value)
+        if css is None:
+            return None
+        css = _negate(css) if neg else css
+        names = {"x": [var_x], "y": [var_y], "": [var_x, var_y]}[axis or ""]
+        return ";".join(f"{n}:{css}" for n in names) + f";transform:{TRANSFORM}"
+    return handler
+
+
+def _rotate(m):
+    neg, value = m.groups()
+    css = _rotate_value(value)
+    if css is None:
+        return None
+    return f"--tw-rotate:{_negate(css) if neg else css};transform:{TRANSFORM}"
+
+
+def _scale_value(value):
+    if arbitrary(value):
+        return arbitrary(value)
+    return f"{int(value) / 100:g}" if value in ("0", "50", "75", "90", "95", "100", "105", "110", "125", "150") else None
+
+
+def _rotate_value(value):
+    if arbitrary(value):
+        return arbitrary(value)
+    return f"{value}deg" if value in ("0", "1", "2", "3", "6", "12", "45", "90", "180") else None
+
+
+def _translate_value(value):
+    return length(value, {"full": "100%"})
+
+
+def _animation(m):
+    if m.group(1) == "none":
+        return "animation:none"
+    if m.group(1) not in KEYFRAMES:
+        return None
+    keyframes, animation = KEYFRAMES[m.group(1)]
+    return [(keyframes, ""), ("&", f"animation:{animation}")]
+
+
+def _space(m):
+    neg, axis, value = m.groups()
+    css = spacing(value)
+    if css is None:
+        return None
+    css = _negate(css) if neg else css
+    prop = "margin-top" if axis == "y" else "margin-left"
+    return [("&>:not([hidden])~:not([hidden])", f"{prop}:{css}")]
+
+
+def _rounded(m):
+    corner, value = m.group(1) or "", m.group(2) or ""
+    css = RADIUS.get(value) or arbitrary(value)
+    if css is None:
+        return None
+    if not corner:
+        return f"border-radius:{css}"
+    return ";".join(f"border-{c}-radius:{css}" for c in CORNERS[corner])
+
+
+def _border_width(m):
+    side, value = m.group(1) or "", m.group(2)
+    if value is None:
+        width = "1px"
+    elif value in ("0", "2", "4", "8"):
+        width = f"{value}px"
+    else:
+        width = arbitrary(value)
+    if width is None:
+        return None
+    if not side:
+        return f"border-width:{width}"
+    return ";".join(f"border-{s}-width:{width}" for s in SIDES[side])
+
+
+def _color_prop(prop):
+    def handler(m):
+        css = color(m.group(1))
+        return f"{prop}:{css}" if css else None
+    return handler
+
+
+def _gradient(m):
+    direction = {"t": "top", "tr": "top right", "r": "right", "br": "bottom right",
+                 "b": "bottom", "bl": "bottom left", "l": "left", "tl": "top left"}[m.group(1)]
+    return f"background-image:linear-gradient(to {direction}, var(--tw-gradient-stops))"
+
+
+def _gradient_stop(m):
+    stop, value = m.groups()
+    css = color(value)
+    if css is None:
+        return None
+    if stop == "from":
+        return (f"--tw-gradient-from:{css};--tw-gradient-to:{transparent(css)};"
+                "--tw-gradient-stops:var(--tw-gradient-from), var(--tw-gradient-to)")
+    if stop == "via":
+        return (f"--tw-gradient-to:{transparent(css)};"
+                f"--tw-gradient-stops:var(--tw-gradient-from), {css}, var(--tw-gradient-to)")
+    return f"--tw-gradient-to:{css}"
+
+
+def _font_size(m):
+    value = m.group(1)
+    if value in FONT_SIZE:
+        size, line_height = FONT_SIZE[value]
+        return f"font-size:{size};line-height:{line_height}"
+    css = arbitrary(value)
+    if css and re.fullmatch(r"[\d.]+(px|rem|em|%)", css):
+        return f"font-size:{css}"
+    return None
+
+
+def _leading(m):
+    value = m.group(1)
+    if value in LINE_HEIGHT:
+        return f"line-height:{LINE_HEIGHT[value]}"
+    if value.isdigit() and 3 <= int(value) <= 10:
+        return f"line-height:{int(value) * 0.25:g}rem"
+    return None
+
+
+def _opacity(m):
+    value = m.group(1)
+    if value.isdigit() and int(value) <= 100 and int(value) % 5 == 0:
+        return f"opacity:{int(value) / 100:g}"
+    return None
+
+
+def _shadow(m):
+    value = m.group(1) or ""
+    if value in SHADOW:
+        shadow = SHADOW[value]
+        plain = shadow.format(c05="rgb(0 0 0 / 0.05)", c1="rgb(0 0 0 / 0.1)", c25="rgb(0 0 0 / 0.25)")
+        colored = shadow.format(c05="var(--tw-shadow-color)", c1="var(--tw-shadow-color)",
+                                c25="var(--tw-shadow-color)")
+        return (f"--tw-shadow:{plain};--tw-shadow-colored:{colored};"
+                "box-shadow:var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)")
+    css = color(value)
+    if css:
+        return f"--tw-shadow-color:{css};--tw-shadow:var(--tw-shadow-colored)"
+    return None
+
+
+def _ring_width(m):
+    value = m.group(1)
+    width = "3px" if value is None else (f"{value}px" if value in ("0", "1", "2", "4", "8") else None)
+    if width is None:
+        return None
+    return ("--tw-ring-offset-shadow:var(--tw-ring-inset) 0 0 0 var(--tw-ring-offset-width) var(--tw-ring-offset-color);"
+            f"--tw-ring-shadow:var(--tw-ring-inset) 0 0 0 calc({width} + var(--tw-ring-offset-width)) var(--tw-ring-color);"
+            "box-shadow:var(--tw-ring-offset-shadow), var(--tw-ring-shadow), var(--tw-shadow, 0 0 #0000)")
+
+
+def _backdrop_blur(m):
+    css = {"": "8px", "none": "0", "sm": "4px", "md": "12px", "lg": "16px", "xl": "24px", "2xl": "40px",
+           "3xl": "64px"}.get(m.group(1) or "")
+    if css is None:
+        return None
+    blur = f"blur({css})" if css != "0" else "none"
+    return f"-webkit-backdrop-filter:{blur};backdrop-filter:{blur}"
+
+
+def _transition(m):
+    props = TRANSITION.get(m.group(1) or "")
+    if props is None:
+        return None
+    return (f"transition-property:{props};transition-timing-function:cubic-bezier(0.4, 0, 0.2, 1);"
+            "transition-duration:150ms")
+
+
+def _duration(m):
+    value = m.group(1)
+    return f"transition-duration:{value}ms" if value in ("0", "75", "100", "150", "200", "300", "500", "700", "1000") else None
+
+
+def _grid_cols(m):
+    value = m.group(1)
+    if value == "none":
+        return "grid-template-columns:none"
+    return f"grid-template-columns:repeat({value}, minmax(0, 1fr))" if 1 <= int(value) <= 12 else None
+
+
+def _col_span(m):
+    value = m.group(1)
+    if value == "full":
+        return "grid-column:1 / -1"
+    return f"grid-column:span {value} / span {value}" if 1 <= int(value) <= 12 else None
+
+
+def _gap(m):
+    axis, value = m.groups()
+    css = spacing(value) or arbitrary(value)
+    if css is None:
+        return None
+    prop = {"": "gap", "x": "column-gap", "y": "row-gap"}[axis or ""]
+    return f"{prop}:{css}"
+
+
+def _container(m):
+    rules = [("&", "width:100%")]
+    for _, min_width in SCREENS:
+        rules.append((f"@media (min-width: {min_width})", f"&{{max-width:{min_width}}}"))
+    return rules
+
+
+def _prose_rules(elements):
+    # Like the plugin: :where() keeps element rules at the specificity of the class, and
+    # nothing inside a not-prose element is styled
+    return [(f'& :where({selector}):not(:where([class~="not-prose"],[class~="not-prose"] *))', declarations)
+            for selector, declarations in elements]
+
+
+def _prose(m):
+    size = m.group(1)
+    if size == "gray":
+        return PROSE_COLORS
+    if size == "lg":
+        return [("&", "font-size:1.125rem;line-height:1.7777778")] + _prose_rules(PROSE_LG + PROSE_EDGES)
+    return ([("&", f"{PROSE_COLORS};color:var(--tw-prose-body);max-width:65ch;font-size:1rem;line-height:1.75")]
+            + _prose_rules(PROSE + PROSE_EDGES))
+
+
+_N = r"(-?)"
+_V = r"(\[[^\]\s]+\]|[\w./%]+)"
+
+PLUGINS = [
+    ("container", r"(container)", _container),
+    ("prose", r"prose(?:-(lg|gray))?", _prose),
+    ("sr-only", r"(sr-only|not-sr-only)", _simple({
+        "sr-only": "position:absolute;width:1px;height:1px;padding:0;margin:-1px;overflow:hidden;"
+                   "clip:rect(0, 0, 0, 0);white-space:nowrap;border-width:0",
+        "not-sr-only": "position:static;width:auto;height:auto;padding:0;margin:0;overflow:visible;"
+                       "clip:auto;white-space:normal"})),
+    ("pointer-events", r"pointer-events-(none|auto)", lambda m: f"pointer-events:{m.group(1)}"),
+    ("visibility", r"(visible|invisible)", _simple({"visible": "visibility:visible", "invisible": "visibility:hidden"})),
+    ("position", r"(static|fixed|absolute|relative|sticky)", lambda m: f"position:{m.group(1)}"),
+    ("inset", _N + r"(inset|inset-x|inset-y)-" + _V, _inset),
+    ("inset-side", _N + r"(top|right|bottom|left)-" + _V, _inset),
+    ("z-index", r"z-" + _V, _z),
+    ("order", r"order-(first|last|none|\d+)", lambda m: "order:" + {"first": "-9999", "last": "9999", "none": "0"}.get(m.group(1), m.group(1))),
+    ("grid-column", r"col-span-(\d+|full)", _col_span),
+    ("margin", _N + r"m()-" + _V, _box_sides("margin")),
+    ("margin-axis", _N + r"m([xy])-" + _V, _box_sides("margin")),
+    ("margin-side", _N + r"m([trbl])-" + _V, _box_sides("margin")),
+    ("line-clamp", r"line-clamp-(\d|none)", _line_clamp),
+    ("display", r"(block|inline-block|inline|flex|inline-flex|grid|inline-grid|table|contents|list-item|hidden)", _display),
+    ("aspect", r"aspect-(auto|square|video)", _simple({"auto": "aspect-ratio:auto", "square": "aspect-ratio:1 / 1",
+                                                      "video": "aspect-ratio:16 / 9"})),
+    ("height", r"h-" + _V, _size("height", {"auto": "auto", "full": "100%", "screen": "100vh", "min": "min-content",
+                                            "max": "max-content", "fit": "fit-content"})),
+    ("max-height", r"max-h-" + _V, _size("max-height", {"none": "none", "full": "100%", "screen": "100vh"})),
+    ("min-height", r"min-h-" + _V, _size("min-height", {"full": "100%", "screen": "100vh", "min": "min-content",
+                                                        "max": "max-content", "fit": "fit-content"})),
+    ("width", r"w-" + _V, _size("width", {"auto": "auto", "full": "100%", "screen": "100vw", "min": "min-content",
+                                          "max": "max-content", "fit": "fit-content"})),
+    ("min-width", r"min-w-" + _V, _size("min-width", {"full": "100%", "min": "min-content", "max": "max-content",
+                                                      "fit": "fit-content"})),
+    ("max-width", r"max-w-" + _V, lambda m: (f"max-width:{MAX_WIDTH.get(m.group(1)) or arbitrary(m.group(1))}"
+                                             if MAX_WIDTH.get(m.group(1)) or arbitrary(m.group(1)) else None)),
+    ("flex", r"flex-(1|auto|initial|none)", _simple({"1": "flex:1 1 0%", "auto": "flex:1 1 auto",
+                                                     "initial": "flex:0 1 auto", "none": "flex:none"})),
+    ("flex-shrink", r"(?:flex-)?shrink(-0)?", lambda m: f"flex-shrink:{0 if m.group(1) else 1}"),
+    ("flex-grow", r"(?:flex-)?grow(-0)?", lambda m: f"flex-grow:{0 if m.group(1) else 1}"),
+    ("translate", _N + r"translate-([xy])-" + _V, _transform_part("--tw-translate-x", "--tw-translate-y", _translate_value)),
+    ("rotate", _N + r"rotate-" + _V, _rotate),
+    ("scale", _N + r"scale-(?:([xy])-)?" + _V, _transform_part("--tw-scale-x", "--tw-scale-y", _scale_value)),
+    ("transform", r"(transform|transform-none)", _simple({"transform": f"transform:{TRANSFORM}",
+                                                          "transform-none": "transform:none"})),
+    ("animation", r"animate-(\w+)", _animation),
+    ("cursor", r"cursor-(auto|default|pointer|wait|text|move|help|not-allowed)", lambda m: f"cursor:{m.group(1)}"),
+    ("select", r"select-(none|text|all|auto)", lambda m: f"-webkit-user-select:{m.group(1)};user-select:{m.group(1)}"),
+    ("resize", r"resize(-none|-y|-x)?", lambda m: "resize:" + {None: "both", "-none": "none", "-y": "vertical",
+                                                              "-x": "horizontal"}[m.group(1)]),
+    ("list-position", r"list-(inside|outside)", lambda m: f"list-style-position:{m.group(1)}"),
+    ("list-type", r"list-(none|disc|decimal)", lambda m: f"list-style-type:{m.group(1)}"),
+    ("grid-cols", r"grid-cols-(\d+|none)", _grid_cols),
+    ("flex-direction", r"flex-(row|row-reverse|col|col-reverse)",
+     lambda m: "flex-direction:" + m.group(1).replace("col", "column")),
+    ("flex-wrap", r"flex-(wrap|wrap-reverse|nowrap)", lambda m: f"flex-wrap:{m.group(1)}"),
+    ("align-items", r"items-(start|end|center|baseline|stretch)",
+     lambda m: "align-items:" + {"start": "flex-start", "end": "flex-end"}.get(m.group(1), m.group(1))),
+    ("justify-content", r"justify-(start|end|center|between|around|evenly)",
+     lambda m: "justify-content:" + {"start": "flex-start", "end": "flex-end", "between": "space-between",
+                                     "around": "space-around", "evenly": "space-evenly"}.get(m.group(1), m.group(1))),
+    ("gap", r"gap(?:-([xy]))?-" + _V, _gap),
+    ("space", _N + r"space-([xy])-" + _V, _space),
+    ("align-self", r"self-(auto|start|end|center|stretch|baseline)",
+     lambda m: "align-self:" + {"start": "flex-start", "end": "flex-end"}.get(m.group(1), m.group(1))),
+    ("overflow", r"overflow-(?:([xy])-)?(auto|hidden|clip|visible|scroll)",
+     lambda m: f"overflow{'-' + m.group(1) if m.group(1) else ''}:{m.group(2)}"),
+    ("truncate", r"(truncate)", lambda m: "overflow:hidden;text-overflow:ellipsis;white-space:nowrap"),
+    ("whitespace", r"whitespace-(normal|nowrap|pre|pre-line|pre-wrap)", lambda m: f"white-space:{m.group(1)}"),
+    ("break", r"break-(words|all)", _simple({"words": "overflow-wrap:break-word", "all": "word-break:break-all"})),
+    ("rounded", r"rounded()(?:-([\w\[\].%]+))?", _rounded),
+    ("rounded-corner", r"rounded-(tl|tr|br|bl|t|r|b|l)(?:-([\w\[\].%]+))?", _rounded),
+    ("border-width", r"border()(?:-(\d+|\[[^\]]+\]))?", _border_width),
+    ("border-width-axis", r"border-([xy])(?:-(\d+|\[[^\]]+\]))?", _border_width),
+    ("border-width-side", r"border-([trbl])(?:-(\d+|\[[^\]]+\]))?", _border_width),
+    ("border-style", r"border-(solid|dashed|dotted|double|none)", lambda m: f"border-style:{m.group(1)}"),
+    ("border-color", r"border-(.+)", _color_prop("border-color")),
+    ("background-color", r"bg-(.+)", _color_prop("background-color")),
+    ("background-image", r"bg-gradient-to-(tr|br|bl|tl|t|r|b|l)", _gradient),
+    ("gradient-stops", r"(from|via|to)-(.+)", _gradient_stop),
+    ("object-fit", r"object-(contain|cover|fill|none|scale-down)", lambda m: f"object-fit:{m.group(1)}"),
+    ("padding", r"()p()-" + _V, _box_sides("padding")),
+    ("padding-axis", r"()p([xy])-" + _V, _box_sides("padding")),
+    ("padding-side", r"()p([trbl])-" + _V, _box_sides("padding")),
+    ("text-align", r"text-(left|center|right|justify)", lambda m: f"text-align:{m.group(1)}"),
+    ("vertical-align", r"align-(baseline|top|middle|bottom|text-top|text-bottom)", lambda m: f"vertical-align:{m.group(1)}"),
+    ("font-family", r"font-(sans|serif|mono)", lambda m: f"font-family:{FONT_FAMILY[m.group(1)]}"),
+    ("font-size", r"text-" + _V, _font_size),
+    ("font-weight", r"font-(\w+)", lambda m: f"font-weight:{FONT_WEIGHT[m.group(1)]}" if m.group(1) in FONT_WEIGHT else None),
+    ("text-transform", r"(uppercase|lowercase|capitalize|normal-case)",
+     lambda m: "text-transform:" + ("none" if m.group(1) == "normal-case" else m.group(1))),
+    ("font-style", r"(italic|not-italic)", lambda m: "font-style:" + ("italic" if m.group(1) == "italic" else "normal")),
+    ("line-height", r"leading-(\w+)", _leading),
+    ("letter-spacing", r"tracking-(\w+)", lambda m: f"letter-spacing:{LETTER_SPACING[m.group(1)]}" if m.group(1) in LETTER_SPACING else None),
+    ("text-color", r"text-(.+)", _color_prop("color")),
+    ("text-decoration", r"(underline|line-through|no-underline)",
+     lambda m: "text-decoration-line:" + ("none" if m.group(1) == "no-underline" else m.group(1))),
+    ("accent-color", r"accent-(.+)", _color_prop("accent-color")),
+    ("opacity", r"opacity-(\d+)", _opacity),
+    ("box-shadow", r"shadow(?:-(.+))?", _shadow),
+    ("outline", r"outline-(none)", lambda m: "outline:2px solid transparent;outline-offset:2px"),
+    ("ring-width", r"ring(?:-(\d+))?", _ring_width),
+    ("ring-color", r"ring-(.+)", _color_prop("--tw-ring-color")),
+    ("backdrop-blur", r"backdrop-blur(?:-(\w+))?", _backdrop_blur),
+    ("transition", r"transition(?:-(\w+))?", _transition),
+    ("duration", r"duration-(\d+)", _duration),
+]
+PLUGINS = [(name, re.compile(pattern), handler) for name, pattern, handler in PLUGINS]
+
+
+def utility_rules(utility):
+    """(plugin index, [(selector template, declarations)]) for a utility name, or None."""
+    for index, (_, pattern, handler) in enumerate(PLUGINS):
+        m = pattern.fullmatch(utility)
+        if not m:
+            continue
+        result = handler(m)
+        if not result:
+            continue
+        if isinstance(result, str):
+            result = [("&", result)]
+        return index, result
+    return None
+
+
+# --- candidates and output --------------------------------------------------
+
+_CANDIDATE_RE = re.compile(r"[\w\-:/.\[\]%#]+")
+_CLASS_ATTR_RE = re.compile(r"""\bclass=["']([^"']*)["']""")
+_STYLE_BLOCK_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+_CRITICAL_BLOCK_RE = re.compile(r'<style data-critical="([\w-]+)">.*?</style>', re.S)
+_SCRIPT_BLOCK_RE = re.compile(r"<script[^>]*>(.*?)</script>", re.S | re.I)
+_STYLE_CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+_ESCAPE_RE = re.compile(r"([^\w-])")
+_CLASS_NAME_RE = re.compile(r"-?[a-z][\w\-:/.\[\]%]*")
+# Used only as selectors by other utilities (group-hover:, prose)
+MARKER_CLASSES = {"group", "peer", "not-prose"}
+# No CSS of their own: page scripts select elements by these classes
+HOOK_CLASSES = {"category-btn", "error-message", "faq-category", "question", "tab-btn", "tab-content",
+                "thumbnail-btn"}
+
+
+def escape_class(name):
+    return _ESCAPE_RE.sub(r"\\\1", name)
+
+
+def parse_candidate(candidate):
+    """(screen, state variant, utility) or None."""
+    parts = candidate.split(":")
+    utility = parts.pop()
+    screen = state = None
+    for variant in parts:
+        if variant in dict(SCREENS) and screen is None and state is None:
+            screen = variant
+        elif variant in STATE_VARIANTS and state is None:
+            state = variant
+        else:
+            return None
+    return screen, state, utility
+
+
+def content_files(deploy_dir=DEPLOY_DIR):
+    files = []
+    for pattern in CONTENT_GLOBS:
+        files.extend(sorted(glob.glob(os.path.join(deploy_dir, pattern))))
+    return files
+
+
+def scan_content(paths):
+    """(candidate tokens, class attribute tokens, classes defined in page <style> blocks)."""
+    candidates = set()
+    class_tokens = set()
+    custom = set()
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        # Inlined critical CSS is derived from the pages, it is not content
+        text = _CRITICAL_BLOCK_RE.sub("", text)
+        for token in _CANDIDATE_RE.findall(text):
+            candidates.add(token.rstrip(".:/"))
+        if path.endswith(".html"):
+            for attr in _CLASS_ATTR_RE.findall(text):
+                class_tokens.update(t for t in attr.split() if "${" not in t and "{" not in t)
+            for block in _STYLE_BLOCK_RE.findall(text):
+                custom.update(_STYLE_CLASS_RE.findall(block))
+    return candidates, class_tokens, custom
+
+
+def generate_css(candidates):
+    """CSS for every candidate that is a known utility. Returns (css, set of generated classes)."""
+    rules = []
+    keyframes = set()
+    generated = set()
+    screen_order = {name: i + 1 for i, (name, _) in enumerate(SCREENS)}
+    for candidate in candidates:
+        parsed = parse_candidate(candidate)
+        if not parsed:
+            continue
+        screen, state, utility = parsed
+        found = utility_rules(utility)
+        if not found:
+            continue
+        plugin_index, utility_css = found
+        generated.add(candidate)
+        selector = "." + escape_class(candidate)
+        if state == "group-hover":
+            selector = ".group:hover " + selector
+        elif state:
+            selector += ":" + state
+        for position, (template, declarations) in enumerate(utility_css):
+            if template.startswith("@keyframes"):
+                keyframes.add(template)
+                continue
+            if template.startswith("@media"):
+                # container: its own breakpoints, emitted after the base rule
+                rule = f"{template}{{{declarations.replace('&', selector)}}}"
+            else:
+                rule = f"{template.replace('&', selector)}{{{declarations}}}"
+            sort_key = (screen_order.get(screen, 0), STATE_VARIANTS.index(state) + 1 if state else 0,
+                        plugin_index, candidate, position)
+            rules.append((sort_key, screen, rule))
+
+    out = [TW_VARIABLES, PREFLIGHT]
+    out.extend(k + "\n" for k in sorted(keyframes))
+    current_screen = None
+    for _, screen, rule in sorted(rules):
+        if screen != current_screen:
+            if current_screen:
+                out.append("}\n")
+            if screen:
+                out.append(f"@media (min-width: {dict(SCREENS)[screen]}){{\n")
+            current_screen = screen
+        out.append(rule + "\n")
+    if current_screen:
+        out.append("}\n")
+    return "".join(out), generated
+
+
+# --- critical CSS -----------------------------------------------------------
+
+def family_pages(deploy_dir=DEPLOY_DIR):
+    """Generated (and hand-written) page files of each layout family that exist in deploy_dir.
+
+    pSEO articles are the pages in pseo_manifest.json of the last pSEO build;
+    no generator runs here.
+    """
+    from catalog import PRODUCTS
+    from generate_seo_pages import SEO_PAGES
+    from generate_pseo_all import load_manifest
+
+    pages = {family: [] for family in FAMILIES}
+    pages["article"] = [f"{entry['slug']}.html" for entry in load_manifest(deploy_dir).get("pages", [])]
+    pages["landing"] = [f"{page['slug']}.html" for page in SEO_PAGES]
+    pages["product"] = [p.url for p in PRODUCTS]
+    pages["catalog"] = sorted(STATIC_FAMILIES) + ["vsechny-regaly.html"]
+    return {family: [name for name in names if os.path.exists(os.path.join(deploy_dir, name))]
+            for family, names in pages.items()}
+
+
+def static_pages(deploy_dir=DEPLOY_DIR):
+    """Hand-written pages in deploy_dir: every *.html no generator writes (STATIC_FAMILIES included)."""
+    generated = {name for names in family_pages(deploy_dir).values() for name in names} - set(STATIC_FAMILIES)
+    return sorted(name for name in map(os.path.basename, glob.glob(os.path.join(deploy_dir, "*.html")))
+                  if name not in generated)
+
+
+def above_the_fold(html, family):
+    """Markup from <body> through the opening tag of the family's first below-the-fold element."""
+    start = html.find("<body")
+    main = html.find("<main", start)
+    if start < 0:
+        return ""
+    m = re.compile(CRITICAL_FOLD[family]).search(html, max(main, start))
+    if m:
+        end = html.find(">", m.end()) + 1 or m.end()
+    else:
+        end = max(main, start) + FOLD_FALLBACK
+    return html[start:end]
+
+
+def critical_candidates(paths, family):
+    """Class tokens above the fold on the given pages (plus inline script tokens for script-rendered families)."""
+    # The chat launcher is fixed to the viewport, so it is above the fold on every page
+    candidates = set()
+    for attr in _CLASS_ATTR_RE.findall(fragment("chat")):
+        candidates.update(attr.split())
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        for attr in _CLASS_ATTR_RE.findall(above_the_fold(html, family)):
+            candidates.update(attr.split())
+        if family in CRITICAL_SCRIPTS:
+            for script in _SCRIPT_BLOCK_RE.findall(html):
+                candidates.update(token.rstrip(".:/") for token in _CANDIDATE_RE.findall(script))
+    return candidates
+
+
+def build_critical(deploy_dir, writer):
+    """Write critical-<family>.<hash>.css for every family with pages; returns {family: (filename, css)}."""
+    built = {}
+    for family, names in family_pages(deploy_dir).items():
+        if not names:
+            continue
+        css, _ = generate_css(critical_candidates([os.path.join(deploy_dir, n) for n in names], family))
+        # One line: rules are newline-separated, never split inside
+        css = css.replace("\n", "")
+        filename = f"critical-{family}.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]}.css"
+        writer.write(filename, css)
+        built[family] = (filename, css)
+    current = {filename for filename, _ in built.values()}
+    for old in glob.glob(os.path.join(deploy_dir, "critical-*.css")):
+        if os.path.basename(old) not in current:
+            writer.remove(os.path.basename(old))
+    return built
+
+
+# --- page heads -------------------------------------------------------------
+
+_CDN_SCRIPT_RE = re.compile(r'[ \t]*<script src="https://cdn\.tailwindcss\.com[^"]*"></script>\n?')
+_CDN_CONFIG_RE = re.compile(r'\s*<script>\s*tailwind\.config\s*=.*?</script>', re.S)
+_CDN_PREFETCH_RE = re.compile(r'[ \t]*<link rel="dns-prefetch" href="https://cdn\.tailwindcss\.com">\n?')
+# stylesheet_tags() output of an earlier build: plain link, or critical <style> + preload + <noscript>
+_LINKED_RE = re.compile(
+    r'[ \t]*(?:<style data-critical="[\w-]+">.*?</style>\s*)?'
+    r'<link rel="(?:stylesheet|preload)" href="tailwind\.[0-9a-f]+\.css"[^>]*>'
+    r'(?:\s*<noscript><link rel="stylesheet" href="tailwind\.[0-9a-f]+\.css"></noscript>)?\n?', re.S)
+
+
+_STYLESHEET_HREF_RE = re.compile(r'href="(tailwind\.[0-9a-f]+\.css)"')
+
+
+def linked_stylesheets(deploy_dir=DEPLOY_DIR):
+    """tailwind.<hash>.css files that some page in deploy_dir links."""
+    linked = set()
+    for path in glob.glob(os.path.join(deploy_dir, "*.html")):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            linked.update(_STYLESHEET_HREF_RE.findall(f.read()))
+    return linked
+
+
+def relink_page(html, href, critical_css="", family=""):
+    """Point a page head at the built stylesheet (replacing the CDN runtime and config, or an older build).
+
+    The stylesheet goes at the end of <head>, where the CDN runtime injected its
+    styles, so utilities still override the page's own <style> rules. With
+    critical_css it is inlined and the full stylesheet loads asynchronously.
+    """
+    tags = stylesheet_tags(href, critical_css, family)
+    if _CDN_SCRIPT_RE.search(html) and "</head>" in html:
+        html = _CDN_SCRIPT_RE.sub("", html, count=1)
+        html = _CDN_CONFIG_RE.sub("", html, count=1)
+        html = _CDN_PREFETCH_RE.sub("", html)
+        return html.replace("</head>", tags + "</head>", 1)
+    return _LINKED_RE.sub(lambda m: tags, html, count=1)
+
+
+def build(deploy_dir=DEPLOY_DIR, writer=None, relink_static=False):
+    writer = writer or OutputWriter(deploy_dir)
+    paths = content_files(deploy_dir)
+    candidates, class_tokens, custom = scan_content(paths)
+    css, generated = generate_css(candidates)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:10]
+    filename = f"tailwind.{digest}.css"
+
+    writer.write(filename, css)
+    critical = build_critical(deploy_dir, writer)
+    entries = {f"critical-{family}.css": name for family, (name, _) in critical.items()}
+    update_asset_manifest(dict(entries, **{ASSET_NAME: filename}), writer)
+
+    relinked = 0
+    if relink_static:
+        # Generated pages get the stylesheet from page_layout when the generators run
+        for name in static_pages(deploy_dir):
+            with open(os.path.join(deploy_dir, name), "r", encoding="utf-8") as f:
+                html = f.read()
+            family = STATIC_FAMILIES.get(name, "")
+            critical_css = critical[family][1] if family in critical else ""
+            if writer.write(name, relink_page(html, filename, critical_css, family)) == "changed":
+                relinked += 1
+
+    # After relinking: an older stylesheet goes once no page links it any more
+    linked = linked_stylesheets(deploy_dir)
+    kept = []
+    for old in sorted(map(os.path.basename, glob.glob(os.path.join(deploy_dir, "tailwind.*.css")))):
+        if old == filename:
+            continue
+        if old in linked:
+            kept.append(old)
+        else:
+            writer.remove(old)
+
+    unknown = sorted(t for t in class_tokens - generated - custom - MARKER_CLASSES - HOOK_CLASSES
+                     if _CLASS_NAME_RE.fullmatch(t) and parse_candidate(t))
+    critical_sizes = {family: len(css.encode("utf-8")) for family, (_, css) in critical.items()}
+    return filename, len(css.encode("utf-8")), len(generated), relinked, unknown, critical_sizes, kept
+
+
+def main():
+    writer = OutputWriter(DEPLOY_DIR, dry_run="--dry-run" in sys.argv)
+    previous = load_asset_manifest().get(ASSET_NAME)
+    filename, size, count, relinked, unknown, critical_sizes, kept = build(writer=writer,
+                                                                           relink_static="--static" in sys.argv)
+    print(f"Built {filename}: {count} utilities, {size:,} B")
+    for family, critical_size in critical_sizes.items():
+        print(f"  Critical CSS {family:<8} {critical_size:>7,} B")
+    missing = [family for family in FAMILIES if family not in critical_sizes]
+    if missing:
+        print(f"  No pages yet for {', '.join(missing)} - run the generators, then build_css.py again")
+    if previous and previous != filename:
+        print(f"  Replaces {previous} - re-run the generators to relink generated pages")
+    if kept:
+        print(f"  Keeps {' '.join(kept)}: still linked by pages, removed once they are relinked")
+    if relinked:
+        print(f"  Relinked {relinked} pages")
+    if writer.dry_run:
+        writer.report("CSS build output")
+    if unknown:
+        print(f"\nERROR: {len(unknown)} class names without CSS (add the utility, or HOOK_CLASSES for JS hooks):")
+        print("    " + " ".join(unknown))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
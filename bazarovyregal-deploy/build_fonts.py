@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Self-hosted Inter: a subset woff2 instead of fonts.googleapis.com.
+
+Subsets the Inter variable font (SOURCE_FONT, the InterVariable.ttf from
+https://github.com/rsms/inter/releases, SIL OFL) to the characters the site
+uses: everything found in the pages, scripts and generator sources, plus
+ASCII, Czech/Slovak letters and common typography, so newly generated text
+is covered. The weight axis is limited to WEIGHTS, other axes (opsz) are
+pinned to their defaults. Writes inter.<hash>.woff2 and inter.<hash>.css
+(the @font-face rule, font-display: swap) with "inter.woff2"/"inter.css"
+entries in asset_manifest.json. page_layout preloads the font and inlines
+the rule instead of the Google Fonts links; without a build it keeps them.
+
+Requires fontTools with Brotli (pip install fonttools brotli).
+
+Usage:
+    python3 build_fonts.py             # build the font, then run the generators
+    python3 build_fonts.py --static    # ... and relink hand-written pages (index.html, katalog.html, ...)
+    python3 build_fonts.py --dry-run   # report what would change
+"""
+
+import io
+import os
+import re
+import sys
+import glob
+import hashlib
+
+from asset_manifest import load_asset_manifest, update_asset_manifest
+from build_output import OutputWriter
+from page_layout import font_tags
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:
+    subset = None
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FONT = os.path.join(DEPLOY_DIR, "fonts", "InterVariable.ttf")
+CONTENT_GLOBS = ("*.html", "*.js", "*.py")
+FONT_ASSET = "inter.woff2"
+CSS_ASSET = "inter.css"
+# Static pages asked Google Fonts for up to 900 (font-black)
+WEIGHTS = (400, 900)
+
+# Always included, whether or not the current pages use them
+BASE_CHARACTERS = (
+    "".join(chr(c) for c in range(0x20, 0x7f))
+    + "áčďéěíňóřšťúůýžÁČĎÉĚÍŇÓŘŠŤÚŮÝŽ"  # Czech
+    + "äľĺôŕÄĽĹÔŔ"                    # Slovak
+    + " –—‘’‚“”„…•›‹«»€×°±½¼¾²³"
+)
+LAYOUT_FEATURES = ["kern", "liga", "calt", "ccmp", "locl", "mark", "mkmk", "tnum", "case"]
+
+
+def used_characters(deploy_dir=DEPLOY_DIR):
+    """Characters of BASE_CHARACTERS plus every printable character in the site content."""
+    chars = set(BASE_CHARACTERS)
+    for pattern in CONTENT_GLOBS:
+        for path in glob.glob(os.path.join(deploy_dir, pattern)):
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                chars.update(f.read())
+    return {c for c in chars if c.isprintable() or c == " "}
+
+
+def subset_font(source, chars):
+    """woff2 bytes of source limited to chars and WEIGHTS."""
+    font = TTFont(source)
+    if "fvar" in font:
+        limits = {axis.axisTag: WEIGHTS if axis.axisTag == "wght" else axis.defaultValue
+                  for axis in font["fvar"].axes}
+        font = instancer.instantiateVariableFont(font, limits)
+    # Keep head.modified from the source so the same input gives the same file hash
+    font.recalcTimestamp = False
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = LAYOUT_FEATURES
+    options.name_IDs = [0, 1, 2, 3, 4, 5, 6]  # keep the copyright/licence names
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=sorted(ord(c) for c in chars))
+    subsetter.subset(font)
+    buf = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(buf)
+    return buf.getvalue(), len(font.getBestCmap())
+
+
+def font_face(href):
+    low, high = WEIGHTS
+    return (f"@font-face{{font-family:'Inter';font-style:normal;font-weight:{low} {high};"
+            f"font-display:swap;src:url({href}) format('woff2')}}")
+
+
+# --- page heads -------------------------------------------------------------
+
+_GOOGLE_FONTS_RE = re.compile(
+    r'[ \t]*<link (?:rel="(?:preconnect|dns-prefetch)" href="https://fonts\.(?:googleapis|gstatic)\.com"(?: crossorigin)?'
+    r'|href="https://fonts\.googleapis\.com/css2[^"]*" rel="stylesheet")>\n?')
+_LINKED_RE = re.compile(
+    r'[ \t]*<link rel="preload" href="inter\.[0-9a-f]+\.woff2"[^>]*>\s*<style data-font-face>.*?</style>\n?', re.S)
+
+
+def relink_page(html, tags):
+    """Replace the Google Fonts links (or an older build) in a page head with the self-hosted font tags."""
+    m = _LINKED_RE.search(html) or _GOOGLE_FONTS_RE.search(html)
+    if not m:
+        return html
+    # The font tags take the place of the first link, at its indentation
+    indent = m.group(0)[:len(m.group(0)) - len(m.group(0).lstrip(" \t"))]
+    tags = "".join(indent + line.lstrip() + "\n" for line in tags.splitlines())
+    if m.re is _LINKED_RE:
+        return html[:m.start()] + tags + html[m.end():]
+    html = html[:m.start()] + "\0" + html[m.end():]
+    html = _GOOGLE_FONTS_RE.sub("", html)
+    return html.replace("\0", tags, 1)
+
+
+def build(deploy_dir=DEPLOY_DIR, writer=None, relink_static=False, source=SOURCE_FONT):
+    writer = writer or OutputWriter(deploy_dir)
+    chars = used_characters(deploy_dir)
+    data, glyphs = subset_font(source, chars)
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    filename = f"inter.{digest}.woff2"
+    css = font_face(filename)
+    css_filename = f"inter.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]}.css"
+
+    writer.write(filename, data)
+    writer.write(css_filename, css)
+    for old in glob.glob(os.path.join(deploy_dir, "inter.*.woff2")) + glob.glob(os.path.join(deploy_dir, "inter.*.css")):
+        if os.path.basename(old) not in (filename, css_filename):
+            writer.remove(os.path.basename(old))
+    update_asset_manifest({FONT_ASSET: filename, CSS_ASSET: css_filename}, writer)
+
+    relinked = 0
+    if relink_static:
+        tags = font_tags(filename, css)
+        for path in sorted(glob.glob(os.path.join(deploy_dir, "*.html"))):
+            with open(path, "r", encoding="utf-8") as f:
+                html = f.read()
+            if writer.write(os.path.basename(path), relink_page(html, tags)) == "changed":
+                relinked += 1
+    return filename, len(data), glyphs, relinked
+
+
+def main():
+    if subset is None:
+        print("fontTools is not installed (pip install fonttools brotli); pages keep Google Fonts")
+        sys.exit(1)
+    if not os.path.exists(SOURCE_FONT):
+        print(f"Source font not found: {SOURCE_FONT}")
+        print("  Download InterVariable.ttf from https://github.com/rsms/inter/releases into fonts/")
+        sys.exit(1)
+    writer = OutputWriter(DEPLOY_DIR, dry_run="--dry-run" in sys.argv)
+    previous = load_asset_manifest().get(FONT_ASSET)
+    filename, size, glyphs, relinked = build(writer=writer, relink_static="--static" in sys.argv)
+    print(f"Built {filename}: {glyphs} characters, {size:,} B")
+    if previous and previous != filename:
+        print(f"  Replaces {previous} - re-run the generators to relink generated pages")
+    if relinked:
+        print(f"  Relinked {relinked} pages")
+    if writer.dry_run:
+        writer.report("Font build output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Responsive images: resized AVIF/WebP/JPEG variants of the category photos.
+
+Each source in SOURCE_IMAGES is resized to WIDTHS (never upscaled) and
+encoded as AVIF and WebP, plus a JPEG fallback for browsers without either.
+Variants get content-hashed names (home-640.3f2a9c1b7d.webp) and
+asset_manifest.json entries ("home-640.webp"). Sources are re-encoded only
+when their bytes change: image_manifest.json keeps the source hash, size and
+variant files of every image.
+
+Every <img src="home.png" ...> in the deploy dir's pages is rewritten to
+    <picture data-image="home.png">
+        <source type="image/avif" srcset="... 320w, ..." sizes="...">
+        <source type="image/webp" srcset="..." sizes="...">
+        <img src="home-960.<hash>.jpg" srcset="..." sizes="..." width="1184" height="864" ...>
+    </picture>
+keeping the tag's other attributes; a rebuild rewrites earlier <picture> output.
+
+Requires Pillow (pip install pillow). AVIF needs a Pillow built with libavif
+(or pillow-avif-plugin); without it AVIF is skipped with a warning and pages
+get WebP and JPEG only. Without Pillow nothing is encoded: images whose
+variants are already built (image_manifest.json) keep their <picture>, the
+others keep the original <img>.
+
+Usage:
+    python3 build_images.py             # encode changed images and rewrite pages
+    python3 build_images.py --force     # re-encode every image
+    python3 build_images.py --dry-run   # report what would change
+"""
+
+import io
+import os
+import re
+import sys
+import glob
+import json
+import hashlib
+
+from asset_manifest import update_asset_manifest
+from build_output import OutputWriter
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import pillow_avif  # noqa: F401 - registers the AVIF encoder on Pillow builds without it
+except ImportError:
+    pass
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_FILE = "image_manifest.json"
+SOURCE_IMAGES = ("garage.png", "home.png", "office.png", "warehouse.png")
+WIDTHS = (320, 480, 640, 960)
+# Category cards: 1 column, 2 from sm, 4 from lg
+SIZES = "(min-width: 1024px) 25vw, (min-width: 640px) 50vw, 100vw"
+# (extension, MIME type, Pillow save options); the last one is the <img> fallback
+FORMATS = [
+    ("avif", "image/avif", {"format": "AVIF", "quality": 55}),
+    ("webp", "image/webp", {"format": "WEBP", "quality": 78, "method": 6}),
+    ("jpg", "image/jpeg", {"format": "JPEG", "quality": 80, "optimize": True, "progressive": True}),
+]
+FALLBACK_WIDTH = 960
+
+
+def load_state(deploy_dir=DEPLOY_DIR):
+    path = os.path.join(deploy_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _variants_exist(entry, deploy_dir):
+    return all(os.path.exists(os.path.join(deploy_dir, filename))
+               for variants in entry["variants"].values() for _, filename in variants)
+
+
+def encodable_formats():
+    """The FORMATS this Pillow can write, in FORMATS order (none without Pillow)."""
+    if Image is None:
+        return []
+    Image.init()
+    return [f for f in FORMATS if f[2]["format"] in Image.SAVE]
+
+
+def encode_image(data, stem, formats=FORMATS):
+    """(width, height, {ext: [[width, filename, bytes]]}) for one source image."""
+    image = Image.open(io.BytesIO(data))
+    image = image.convert("RGB")
+    width, height = image.size
+    widths = sorted({min(w, width) for w in WIDTHS})
+    variants = {}
+    for w in widths:
+        resized = image if w == width else image.resize((w, round(height * w / width)), Image.LANCZOS)
+        for ext, _, options in formats:
+            buf = io.BytesIO()
+            resized.save(buf, **options)
+            encoded = buf.getvalue()
+            filename = f"{stem}-{w}.{hashlib.sha256(encoded).hexdigest()[:10]}.{ext}"
+            variants.setdefault(ext, []).append([w, filename, encoded])
+    return width, height, variants
+
+
+# --- page markup ------------------------------------------------------------
+
+_PICTURE_RE = re.compile(r'<picture data-image="([^"]+)">.*?(<img\b[^>]*>)\s*</picture>', re.S)
+_ATTR_RE = re.compile(r'\s([\w-]+)(?:="([^"]*)")?')
+# Attributes owned by the build; everything else on the original tag is kept
+_OWN_ATTRS = {"src", "srcset", "sizes", "width", "height"}
+
+
+def _img_re(names):
+    # Also matches a source fingerprinted by build_assets.py (home.3f2a9c1b7d.png)
+    alternatives = "|".join(re.escape(os.path.splitext(n)[0]) + r"(?:\.[0-9a-f]{10})?" + re.escape(os.path.splitext(n)[1])
+                            for n in names)
+    return re.compile(r'<img\b[^>]*\bsrc="(' + alternatives + r')"[^>]*>')
+
+
+def _source_name(src):
+    return re.sub(r"\.[0-9a-f]{10}(\.\w+)$", r"\1", src)
+
+
+def picture_tag(name, entry, img_tag):
+    """<picture> markup for an image, keeping the attributes of the original <img>."""
+    attrs = [(k, v) for k, v in _ATTR_RE.findall(img_tag[4:-1]) if k not in _OWN_ATTRS]
+    if not any(k == "loading" for k, _ in attrs):
+        attrs.append(("loading", "lazy"))
+    if not any(k == "decoding" for k, _ in attrs):
+        attrs.append(("decoding", "async"))
+
+    def srcset(ext):
+        return ", ".join(f"{filename} {w}w" for w, filename in entry["variants"][ext])
+
+    fallback_ext = FORMATS[-1][0]
+    fallback = [f for w, f in entry["variants"][fallback_ext] if w <= FALLBACK_WIDTH][-1]
+    sources = "".join(f'<source type="{mime}" srcset="{srcset(ext)}" sizes="{SIZES}">'
+                      for ext, mime, _ in FORMATS[:-1] if ext in entry["variants"])
+    rest = "".join(f' {k}="{v}"' for k, v in attrs)
+    return (f'<picture data-image="{name}">{sources}'
+            f'<img src="{fallback}" srcset="{srcset(fallback_ext)}" sizes="{SIZES}" '
+            f'width="{entry["width"]}" height="{entry["height"]}"{rest}></picture>')
+
+
+def rewrite_page(html, state):
+    """Replace <img> tags of built images (and earlier <picture> output) with current <picture> markup."""
+    def repicture(m):
+        return picture_tag(m.group(1), state[m.group(1)], m.group(2)) if m.group(1) in state else m.group(0)
+
+    html = _PICTURE_RE.sub(repicture, html)
+    if state:
+        html = _img_re(sorted(state)).sub(
+            lambda m: picture_tag(_source_name(m.group(1)), state[_source_name(m.group(1))], m.group(0)), html)
+    return html
+
+
+def build(deploy_dir=DEPLOY_DIR, writer=None, force=False, formats=None):
+    """Encode changed images in formats (default: encodable_formats()) and rewrite the pages.
+
+    Returns (state, encoded names, rewritten page count, names left unencoded without Pillow).
+    """
+    writer = writer or OutputWriter(deploy_dir)
+    formats = encodable_formats() if formats is None else formats
+    extensions = {ext for ext, _, _ in formats}
+    previous = load_state(deploy_dir)
+    state = {}
+    encoded = []
+    skipped = []
+    for name in SOURCE_IMAGES:
+        path = os.path.join(deploy_dir, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        entry = previous.get(name)
+        built = entry and entry["source"] == digest and _variants_exist(entry, deploy_dir)
+        # Without an encoder, variants that are already built are the best there is
+        if built and (not formats or not force and set(entry["variants"]) == extensions):
+            state[name] = entry
+            continue
+        if not formats:
+            skipped.append(name)
+            continue
+        width, height, variants = encode_image(data, os.path.splitext(name)[0], formats)
+        for items in variants.values():
+            for _, filename, variant in items:
+                writer.write(filename, variant)
+        state[name] = {"source": digest, "width": width, "height": height,
+                       "variants": {ext: [[w, f] for w, f, _ in items] for ext, items in variants.items()}}
+        encoded.append(name)
+
+    current = {f for entry in state.values() for items in entry["variants"].values() for _, f in items}
+    for name in state:
+        stem = os.path.splitext(name)[0]
+        for ext, _, _ in FORMATS:
+            for old in glob.glob(os.path.join(deploy_dir, f"{stem}-[0-9]*.*.{ext}")):
+                if os.path.basename(old) not in current:
+                    writer.remove(os.path.basename(old))
+    writer.write(STATE_FILE, json.dumps(state, indent=2, sort_keys=True) + "\n")
+    update_asset_manifest({f"{os.path.splitext(name)[0]}-{w}.{ext}": f
+                           for name, entry in state.items()
+                           for ext, items in entry["variants"].items() for w, f in items}, writer)
+
+    rewritten = 0
+    for path in sorted(glob.glob(os.path.join(deploy_dir, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        if writer.write(os.path.basename(path), rewrite_page(html, state)) == "changed":
+            rewritten += 1
+    return state, encoded, rewritten, skipped
+
+
+def main():
+    formats = encodable_formats()
+    if Image is None:
+        print("WARNING: Pillow is not installed (pip install pillow); no images are encoded")
+    elif len(formats) < len(FORMATS):
+        available = [ext for ext, _, _ in formats]
+        missing = [ext.upper() for ext, _, _ in FORMATS if ext not in available]
+        print(f"WARNING: this Pillow cannot encode {', '.join(missing)}; "
+              f"writing {', '.join(ext.upper() for ext in available)} only")
+    writer = OutputWriter(DEPLOY_DIR, dry_run="--dry-run" in sys.argv)
+    state, encoded, rewritten, skipped = build(writer=writer, force="--force" in sys.argv, formats=formats)
+    for name, entry in state.items():
+        source_size = os.path.getsize(os.path.join(DEPLOY_DIR, name))
+        fallback = entry["variants"][FORMATS[-1][0]][-1][1]
+        largest = [(ext, entry["variants"][ext][-1][1]) for ext, _, _ in FORMATS]
+        sizes = " ".join(f"{ext} {os.path.getsize(os.path.join(DEPLOY_DIR, f)):,}"
+                         for ext, f in largest if os.path.exists(os.path.join(DEPLOY_DIR, f)))
+        status = "encoded" if name in encoded else "unchanged"
+        print(f"  {name:<15} {source_size:>10,} B -> largest {sizes} B ({status}; fallback {fallback})")
+    for name in skipped:
+        print(f"  {name:<15} not encoded; pages keep the original image")
+    if rewritten:
+        print(f"  Rewrote <img> tags in {rewritten} pages")
+    if writer.dry_run:
+        writer.report("Image build output")
+
+
+if __name__ == "__main__":
+    main()
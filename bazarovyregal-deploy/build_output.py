@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Build output writer shared by all generators.
+
+Every generated file goes through write_output()/OutputWriter, which
+compares the new bytes with what is on disk:
+    created   - file did not exist
+    changed   - bytes differ
+    unchanged - identical bytes; the file is not rewritten (mtime and CDN cache stay valid)
+
+With dry_run=True nothing is written; the writer only records what would
+happen so `--dry-run` can report created/changed/unchanged files with
+byte-size deltas before a deploy.
+
+With minify=True (`--minify`) HTML outputs pass through
+html_minify.minify_bytes() before the comparison, and the bytes saved are
+reported in total and for every page.
+"""
+
+import os
+import io
+from contextlib import contextmanager
+
+from html_minify import minify_bytes
+
+
+def minify_output(filename, data):
+    """(bytes to write, bytes saved) for one output; only .html files are minified."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if not filename.endswith(".html"):
+        return data, 0
+    minified = minify_bytes(data)
+    return minified, len(data) - len(minified)
+
+
+def write_output(path, data, dry_run=False):
+    """Write data (str or bytes) to path unless identical. Returns (status, old_size, new_size)."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    old = None
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            old = f.read()
+    if old == data:
+        return "unchanged", len(old), len(data)
+    if not dry_run:
+        with open(path, "wb") as f:
+            f.write(data)
+    return ("created" if old is None else "changed"), (0 if old is None else len(old)), len(data)
+
+
+class OutputWriter:
+    def __init__(self, output_dir, dry_run=False, minify=False):
+        self.output_dir = output_dir
+        self.dry_run = dry_run
+        self.minify = minify
+        self.records = []
+        self.saved = {}  # filename -> bytes removed by minification
+
+    def path(self, filename):
+        return os.path.join(self.output_dir, filename)
+
+    def record(self, filename, status, old_size, new_size, saved=0):
+        """Record an output written elsewhere (e.g. by a worker process)."""
+        self.records.append((filename, status, old_size, new_size))
+        if saved:
+            self.saved[filename] = saved
+        return status
+
+    def write(self, filename, data):
+        """Write (or in dry-run mode, diff) one output file. Returns its status."""
+        saved = 0
+        if self.minify:
+            data, saved = minify_output(filename, data)
+        return self.record(filename, *write_output(self.path(filename), data, self.dry_run), saved=saved)
+
+    @contextmanager
+    def open(self, filename):
+        """Binary file-like target for streamed output; compared with the old file on close."""
+        path = self.path(filename)
+        if self.dry_run:
+            buf = io.BytesIO()
+            yield buf
+            self.write(filename, buf.getvalue())
+            return
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                yield f
+        except BaseException:
+            # A failed stream leaves the old file in place and no partial .tmp behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        new_size = os.path.getsize(tmp_path)
+        if not os.path.exists(path):
+            os.replace(tmp_path, path)
+            self.record(filename, "created", 0, new_size)
+            return
+        old_size = os.path.getsize(path)
+        if old_size == new_size and _same_bytes(path, tmp_path):
+            os.remove(tmp_path)
+            self.record(filename, "unchanged", old_size, new_size)
+            return
+        os.replace(tmp_path, path)
+        self.record(filename, "changed", old_size, new_size)
+
+    def remove(self, filename):
+        """Delete a stale output file."""
+        path = self.path(filename)
+        if not os.path.exists(path):
+            return None
+        old_size = os.path.getsize(path)
+        if not self.dry_run:
+            os.remove(path)
+        return self.record(filename, "deleted", old_size, 0)
+
+    def counts(self):
+        counts = {}
+        for _, status, _, _ in self.records:
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    def report(self, title="Output"):
+        """Print created/changed/deleted files with byte deltas and a status summary."""
+        mode = "DRY RUN - nothing written" if self.dry_run else "written"
+        print(f"\n  {title} ({mode}):")
+        for filename, status, old_size, new_size in self.records:
+            if status == "unchanged":
+                continue
+            print(f"    {status:<9} {filename:<55} {old_size:>9,} -> {new_size:>9,} B ({new_size - old_size:+,})")
+        counts = self.counts()
+        delta = sum(new - old for _, _, old, new in self.records)
+        summary = ", ".join(f"{counts.get(s, 0)} {s}" for s in ("created", "changed", "deleted", "unchanged"))
+        print(f"    {summary}; total delta {delta:+,} B")
+        touched = counts.get("created", 0) + counts.get("changed", 0)
+        if self.records and touched > len(self.records) * 0.5 and touched > 20:
+            print(f"    WARNING: {touched} of {len(self.records)} files would be rewritten (mass rewrite)")
+
+    def minify_report(self):
+        """Print bytes saved by minification: the total, then every page, largest savings first."""
+        if not self.saved:
+            return
+        sizes = {filename: new_size for filename, _, _, new_size in self.records}
+        saved = sum(self.saved.values())
+        after = sum(sizes[filename] for filename in self.saved)
+        print(f"\n  Minified {len(self.saved)} HTML files: {after + saved:,} -> {after:,} B "
+              f"(-{saved:,} B, -{saved / (after + saved):.1%}, avg -{saved // len(self.saved):,} B/page)")
+        for filename in sorted(self.saved, key=self.saved.get, reverse=True):
+            before = sizes[filename] + self.saved[filename]
+            print(f"    {filename:<55} {before:>9,} -> {sizes[filename]:>9,} B (-{self.saved[filename]:,})")
+
+
+def _same_bytes(path_a, path_b, chunk=1 << 16):
+    with open(path_a, "rb") as a, open(path_b, "rb") as b:
+        while True:
+            block_a = a.read(chunk)
+            if block_a != b.read(chunk):
+                return False
+            if not block_a:
+                return True
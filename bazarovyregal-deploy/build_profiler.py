@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Build profiler for the Bazarovyregal.cz generators.
+
+Records wall time per build stage, per playbook and per page plus bytes
+written (created/changed outputs of the OutputWriter), then writes two files
+next to pseo_manifest.json through the same writer (nothing with --dry-run):
+    <name>_build_profile.json  - summary report (stages, playbooks, slowest pages)
+    <name>_build_trace.json    - Chrome trace events (open in chrome://tracing or Perfetto)
+
+Stages are exclusive, so their sum is the accounted build time. A parent
+stage (e.g. "pipeline" around the per-page stages) encloses other stages;
+it is reported separately and not counted in that sum.
+
+A disabled profiler keeps the same API but records nothing, so generators
+can call it unconditionally.
+"""
+
+import os
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from build_output import OutputWriter
+
+
+def now_us():
+    """Monotonic timestamp in microseconds, comparable across worker processes."""
+    return time.perf_counter_ns() // 1000
+
+
+class BuildProfiler:
+    def __init__(self, name, enabled=False):
+        self.name = name
+        self.enabled = enabled
+        self.started_at = datetime.now().isoformat()
+        self.start_us = now_us()
+        self.stages = {}
+        self.parent_stages = {}
+        self.playbooks = {}
+        self.pages = []
+        self.bytes_written = 0
+        self.events = []
+        self._frames = []
+
+    def _event(self, name, cat, start_us, dur_us, pid=None, args=None):
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start_us, "dur": dur_us,
+                 "pid": pid or os.getpid(), "tid": cat}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def add_time(self, stage, seconds, playbook=None):
+        """Accumulate seconds for a stage (and optionally a playbook)."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        if playbook:
+            stats = self.playbooks.setdefault(playbook, {"pages": 0})
+            stats[f"{stage}_seconds"] = stats.get(f"{stage}_seconds", 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name, parent=False):
+        """Time a sequential build stage (parent=True: one that encloses other stages)."""
+        if not self.enabled:
+            yield
+            return
+        start = now_us()
+        try:
+            yield
+        finally:
+            dur = now_us() - start
+            if parent:
+                self.parent_stages[name] = self.parent_stages.get(name, 0.0) + dur / 1e6
+            else:
+                self.add_time(name, dur / 1e6)
+            self._event(name, "stage", start, dur)
+
+    def timed(self, iterable, stage, playbook=None):
+        """Yield from iterable, charging the time spent producing each item to stage.
+
+        Nested timed iterators are accounted exclusively: time spent in an
+        inner iterator is not charged again to the outer one.
+        """
+        if not self.enabled:
+            yield from iterable
+            return
+        it = iter(iterable)
+        while True:
+            frame = [0]
+            self._frames.append(frame)
+            start = now_us()
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            finally:
+                elapsed = now_us() - start
+                self._frames.pop()
+                if self._frames:
+                    self._frames[-1][0] += elapsed
+                self.add_time(stage, (elapsed - frame[0]) / 1e6, playbook)
+            if playbook:
+                self.playbooks[playbook]["pages"] += 1
+            yield item
+
+    def record_page(self, slug, playbook, render_seconds, write_seconds, nbytes, start_us=None, pid=None):
+        """Record one rendered page (timings may come from a worker process)."""
+        if not self.enabled:
+            return
+        self.add_time("render", render_seconds, playbook)
+        self.add_time("write", write_seconds, playbook)
+        if playbook:
+            stats = self.playbooks.setdefault(playbook, {"pages": 0})
+            stats["bytes"] = stats.get("bytes", 0) + nbytes
+        self.pages.append({"slug": slug, "playbook": playbook, "render_seconds": render_seconds,
+                           "write_seconds": write_seconds, "bytes": nbytes})
+        if start_us is not None:
+            dur = int((render_seconds + write_seconds) * 1e6)
+            self._event(slug, "page", start_us, dur, pid, {"playbook": playbook, "bytes": nbytes})
+
+    def report(self):
+        total = (now_us() - self.start_us) / 1e6
+        slowest = sorted(self.pages, key=lambda p: p["render_seconds"] + p["write_seconds"], reverse=True)
+        return {
+            "generator": self.name,
+            "started_at": self.started_at,
+            "total_seconds": round(total, 6),
+            "bytes_written": self.bytes_written,
+            "stages": {k: round(v, 6) for k, v in self.stages.items()},
+            "stages_total_seconds": round(sum(self.stages.values()), 6),
+            "parent_stages": {k: round(v, 6) for k, v in self.parent_stages.items()},
+            "playbooks": {
+                name: {k: round(v, 6) if isinstance(v, float) else v for k, v in stats.items()}
+                for name, stats in self.playbooks.items()
+            },
+            "slowest_pages": slowest[:20],
+            "pages": self.pages,
+        }
+
+    def write(self, output_dir, writer=None):
+        """Write the JSON report and Chrome trace file through writer (an OutputWriter).
+
+        bytes_written is taken from the created/changed records of writer.
+        Returns the file names (None when disabled).
+        """
+        if not self.enabled:
+            return None
+        writer = writer or OutputWriter(output_dir)
+        self.bytes_written = sum(new_size for _, status, _, new_size in writer.records
+                                 if status in ("created", "changed"))
+        report_name = f"{self.name}_build_profile.json"
+        trace_name = f"{self.name}_build_trace.json"
+        report = self.report()
+        writer.write(report_name, json.dumps(report, ensure_ascii=False, indent=2))
+        writer.write(trace_name, json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}))
+
+        print(f"\nBuild profile ({self.name}): {report['total_seconds']:.3f}s, "
+              f"{self.bytes_written / 1024:.1f} KB {'would be written' if writer.dry_run else 'written'}")
+        for stage, seconds in sorted(report["stages"].items(), key=lambda kv: -kv[1]):
+            print(f"    {stage:<12} {seconds * 1000:>9.1f} ms")
+        print(f"    {'(sum)':<12} {report['stages_total_seconds'] * 1000:>9.1f} ms")
+        for stage, seconds in report["parent_stages"].items():
+            print(f"    {stage:<12} {seconds * 1000:>9.1f} ms  (encloses other stages, not in the sum)")
+        if writer.dry_run:
+            print(f"  DRY RUN: {report_name} and {trace_name} not written")
+        else:
+            print(f"  Report: {report_name}, trace: {trace_name}")
+        return report_name, trace_name
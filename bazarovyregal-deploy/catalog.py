@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Product catalog for Bazarovyregal.cz: the one copy of the product data.
+
+Every product page variant is listed once in VARIANTS (its page slug encodes
+height x width x depth and color) and has exactly one Product record. Its
+price, original price and discount come from its PRICES row (supplier price
+list) or, without one, from the size formula; product pages, product cards,
+JSON-LD offers and products.json all read that record, so a price is edited
+in one place. Derived fields (name, URLs, shelves, capacity, price without
+VAT) are computed once when the record is built. The generators import
+PRODUCTS or featured_products() and select from them through a CatalogIndex
+(INDEX covers all variants) instead of scanning the list; the browser gets
+the same records as products.json (katalog.html, chatbot.js). products.json
+is committed like the pages (the deploy serves committed files), so commit
+it after a catalog edit; it is written by generate_full_product_pages.py or:
+
+Usage:
+    python3 catalog.py             # write products.json
+    python3 catalog.py --dry-run   # report whether it would change
+"""
+
+import os
+import sys
+import json
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+from build_output import OutputWriter
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+PRODUCTS_JSON = "products.json"
+
+VAT_RATE = 0.21
+# Formula-priced variants are shown as a discount from this multiple
+PRICE_ORIG_FACTOR = 4
+
+# Product images
+IMAGES = {
+    "black": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg",
+    "white": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg",
+    "red": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/9/e/9eef5f9f2ad8880b75926a3eae58485b-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny-pravy-15070304700red1.jpeg",
+    "blue": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/1/c/1c64831c1231f5847cf9e7a36f6cdf6f-1-15070304700blue1.jpeg",
+    "zinc": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg",
+    "pro": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/b/1/b17ce5b491bdb73a0df3160b51fbcf7e-1-regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-1050-kg-modro-oranzovy-pravy-18120501050orangeblue1.jpeg"
+}
+
+# Color slug (in page names) -> label, adjective agreeing with "regál", vyprodej-regalu.cz URL suffix, image
+COLORS = {
+    "cerna": {"label": "Černá", "adjective": "černý", "seo": "cerny", "image": IMAGES["black"]},
+    "bila": {"label": "Bílá", "adjective": "bílý", "seo": "bily", "image": IMAGES["white"]},
+    "cervena": {"label": "Červená", "adjective": "červený", "seo": "cerveny", "image": IMAGES["red"]},
+    "modra": {"label": "Modrá", "adjective": "modrý", "seo": "modry", "image": IMAGES["blue"]},
+    "zinkovany": {"label": "Zinkovaný", "adjective": "zinkovaný", "seo": "", "image": IMAGES["zinc"]},
+    "profesionalni": {"label": "Profesionální", "adjective": "profesionální", "seo": "modro-oranzovy", "image": IMAGES["pro"]},
+}
+
+# Every variant with a product page
+VARIANTS = [
+    "regal-150x70x30-cerna", "regal-150x70x30-cervena", "regal-150x70x30-zinkovany", "regal-180x90x40-bila", "regal-180x90x40-zinkovany",
+    "regal-180x60x40-cerna", "regal-180x40x40-cerna", "regal-200x90x40-cerna", "regal-220x90x45-cerna",
+    "regal-180x120x50-cerna", "regal-180x90x40-modra", "regal-180x40x30-zinkovany", "regal-180x90x45-cerna",
+    "regal-220x70x45-bila", "regal-200x40x30-modra", "regal-200x70x45-cerna", "regal-200x120x40-cerna",
+    "regal-220x70x50-cervena", "regal-150x120x40-zinkovany", "regal-180x90x50-cervena", "regal-180x70x30-bila",
+    "regal-200x60x50-modra", "regal-220x60x45-bila", "regal-200x120x50-zinkovany", "regal-200x60x40-zinkovany",
+    "regal-150x40x30-bila", "regal-150x120x45-cervena", "regal-200x90x40-modra", "regal-200x120x40-zinkovany",
+    "regal-220x40x30-cervena", "regal-180x40x40-zinkovany", "regal-150x90x30-zinkovany", "regal-180x90x40-cervena",
+    "regal-200x90x50-cerna", "regal-180x40x45-cerna", "regal-180x120x40-cerna", "regal-150x60x30-cerna",
+    "regal-150x120x40-cervena", "regal-220x60x40-zinkovany", "regal-220x60x50-modra", "regal-150x40x50-cervena",
+    "regal-220x90x30-cerna", "regal-220x70x30-bila", "regal-180x120x50-bila", "regal-180x70x50-bila",
+    "regal-150x40x40-bila", "regal-220x90x40-modra", "regal-180x90x30-modra", "regal-220x70x50-zinkovany",
+    "regal-220x60x40-cervena", "regal-150x120x30-cervena", "regal-150x120x50-zinkovany", "regal-180x40x30-bila",
+    "regal-150x60x50-cerna", "regal-180x120x30-zinkovany", "regal-220x120x45-cervena", "regal-200x60x45-modra",
+    "regal-200x90x45-cerna", "regal-180x120x45-bila", "regal-150x60x45-cervena", "regal-220x120x45-zinkovany",
+    "regal-150x120x45-cerna", "regal-200x70x40-cervena", "regal-200x120x50-cervena", "regal-150x90x45-cerna",
+    "regal-200x60x45-bila", "regal-220x120x30-cerna", "regal-180x120x30-cervena", "regal-180x90x40-cerna",
+    "regal-200x40x45-bila", "regal-180x40x45-zinkovany", "regal-180x60x40-bila", "regal-150x60x45-modra",
+    "regal-180x70x40-cerna", "regal-150x90x40-bila", "regal-200x70x40-bila", "regal-180x90x45-cervena",
+    "regal-150x40x45-bila", "regal-200x40x30-zinkovany", "regal-200x70x50-zinkovany", "regal-150x90x40-cervena",
+    "regal-220x40x40-cervena", "regal-150x70x45-cerna", "regal-200x90x45-modra", "regal-200x120x40-bila",
+    "regal-150x70x30-bila", "regal-180x120x50-profesionalni"
+]
+
+# Supplier price list: slug -> (price, original price, discount %), CZK incl. VAT.
+# The discount is the published badge, not derived from the two prices; variants
+# without a row are priced by formula_price().
+PRICES = {
+    "regal-150x70x30-cerna": (599, 2396, 70), "regal-150x70x30-cervena": (599, 2396, 70),
+    "regal-150x70x30-bila": (599, 2396, 70), "regal-150x70x30-zinkovany": (549, 2196, 70),
+    "regal-180x90x40-cerna": (739, 2956, 75), "regal-180x90x40-bila": (739, 2956, 70),
+    "regal-180x90x40-zinkovany": (649, 2596, 70), "regal-180x90x40-cervena": (759, 3036, 70),
+    "regal-180x90x40-modra": (759, 3036, 70),
+    "regal-180x60x40-cerna": (689, 2756, 70), "regal-180x60x40-bila": (689, 2756, 70),
+    "regal-180x40x40-cerna": (629, 2516, 70), "regal-180x40x40-zinkovany": (579, 2316, 70),
+    "regal-180x40x30-zinkovany": (549, 2196, 70),
+    "regal-200x90x40-cerna": (849, 3396, 70), "regal-220x90x45-cerna": (899, 3596, 70),
+    "regal-180x120x50-cerna": (1149, 4596, 70), "regal-180x120x50-profesionalni": (1249, 4996, 70),
+}
+
+# Photos of the exact variant (others use their color's image)
+VARIANT_IMAGES = {
+    "regal-150x70x30-cerna": "https://vyprodej-regalucz.s26.cdn-upgates.com/v/v6903779a99ff1-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerny-pravy-15070304700black1.jpeg",
+    "regal-180x60x40-cerna": "https://vyprodej-regalucz.s26.cdn-upgates.com/j/j690377a5dc94d-1-regal-1800x600x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18060405875black1.jpeg",
+    "regal-180x40x40-cerna": "https://vyprodej-regalucz.s26.cdn-upgates.com/2/2690377a330269-1-regal-1800x400x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18040405875black1.jpeg",
+}
+
+BESTSELLERS = {"regal-180x90x40-cerna"}
+
+# Products linked from SEO and pSEO pages, in display order (playbooks pick by position)
+FEATURED = [
+    "regal-150x70x30-cerna", "regal-150x70x30-zinkovany", "regal-180x90x40-cerna", "regal-180x90x40-zinkovany",
+    "regal-180x90x40-bila", "regal-180x90x40-cervena", "regal-180x90x40-modra", "regal-200x90x40-cerna",
+    "regal-180x120x50-cerna", "regal-180x120x50-profesionalni", "regal-180x40x40-zinkovany",
+]
+
+# CatalogIndex facets: name -> Product attribute ("price_bucket" is price // PRICE_BUCKET)
+FACETS = {"color": "color_slug", "surface": "surface", "height": "height", "width": "width",
+          "depth": "depth", "price_bucket": "price"}
+PRICE_BUCKET = 200
+# CatalogIndex.range() fields
+RANGE_FIELDS = ("price", "height", "width", "depth", "capacity")
+
+# products.json columns: (JSON name, Product attribute)
+BROWSER_FIELDS = [
+    ("url", "url"), ("name", "name"), ("price", "price"), ("priceOrig", "price_orig"),
+    ("height", "height"), ("width", "width"), ("depth", "depth"), ("color", "color"),
+    ("surface", "surface"), ("shelves", "shelves"), ("capacity", "capacity"),
+    ("image", "image"), ("seoUrl", "seo_url"), ("bestseller", "bestseller"), ("discount", "discount"),
+]
+
+
+def formula_price(height, width, depth, color_slug):
+    """Price of a variant without a supplier price: by size, rounded to ...9 Kč."""
+    price = 400 + (height // 10) * 15 + (width // 10) * 10 + (depth // 10) * 5
+    if color_slug == "zinkovany":
+        price -= 50
+    elif color_slug == "profesionalni":
+        price += 200
+    return (price // 10) * 10 - 1
+
+
+class Product:
+    """One catalog variant; every field is computed when the record is built."""
+
+    __slots__ = ("slug", "url", "height", "width", "depth", "dims", "color_slug", "color", "color_adjective",
+                 "name", "surface", "shelves", "shelf_load", "capacity", "price", "price_orig", "price_no_vat",
+                 "discount", "image", "seo_url", "bestseller")
+
+    def __init__(self, slug, prices=None, image=None, bestseller=False):
+        dims, color_slug = slug[len("regal-"):].split("-", 1)
+        height, width, depth = (int(d) for d in dims.split("x"))
+        color = COLORS[color_slug]
+
+        self.slug = slug
+        self.url = f"{slug}.html"
+        self.height, self.width, self.depth = height, width, depth
+        self.dims = f"{height}×{width}×{depth}"
+        self.color_slug = color_slug
+        self.color = color["label"]
+        self.color_adjective = color["adjective"]
+        self.name = f"Regál {self.dims} cm {color['adjective']}"
+        self.surface = "Pozinkovaný" if color_slug == "zinkovany" else "Lakovaný"
+        self.shelves = 5 if height >= 180 else 4
+        self.shelf_load = 210 if color_slug == "profesionalni" else 175
+        self.capacity = self.shelves * self.shelf_load
+        if prices:
+            self.price, self.price_orig, self.discount = prices
+        else:
+            self.price = formula_price(height, width, depth, color_slug)
+            self.price_orig = self.price * PRICE_ORIG_FACTOR
+            self.discount = round((1 - self.price / self.price_orig) * 100)
+        self.price_no_vat = round(self.price / (1 + VAT_RATE))
+        self.image = image or color["image"]
+        self.bestseller = bestseller
+
+        surface = "zinkovany" if color_slug == "zinkovany" else "lakovany"
+        seo_url = (f"regal-{height * 10}x{width * 10}x{depth * 10}-mm-{surface}-{self.shelves}-policovy"
+                   f"-nosnost-{self.capacity}-kg")
+        self.seo_url = f"{seo_url}-{color['seo']}" if color["seo"] else seo_url
+
+    def _fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, Product) and self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self.slug)
+
+    def __repr__(self):
+        return f"Product({self.slug!r}, {self.price} Kč)"
+
+
+def facet_value(product, facet):
+    value = getattr(product, FACETS[facet])
+    return value // PRICE_BUCKET if facet == "price_bucket" else value
+
+
+class CatalogIndex:
+    """Secondary indexes over a product list: facet lookups by hash, range queries by bisect.
+
+    Results are new lists in the order of the indexed products (range(): in field order).
+    """
+
+    def __init__(self, products):
+        self.products = list(products)
+        self.position = {p.slug: i for i, p in enumerate(self.products)}
+        self.facets = {facet: {} for facet in FACETS}
+        for p in self.products:
+            for facet, values in self.facets.items():
+                values.setdefault(facet_value(p, facet), []).append(p)
+        self.ranges = {}
+        for field in RANGE_FIELDS:
+            ordered = sorted(self.products, key=attrgetter(field))
+            self.ranges[field] = ([getattr(p, field) for p in ordered], ordered)
+
+    def lookup(self, facet, value):
+        """Products whose facet equals value, e.g. lookup("color", "zinkovany")."""
+        return list(self.facets[facet].get(value, ()))
+
+    def where(self, **facets):
+        """Products matching every facet=value, e.g. where(height=180, width=90)."""
+        candidates = min((self.facets[f].get(v, ()) for f, v in facets.items()), key=len, default=self.products)
+        return [p for p in candidates if all(facet_value(p, f) == v for f, v in facets.items())]
+
+    def any_of(self, facet, values):
+        """Products whose facet is any of values."""
+        return self.union(*(self.facets[facet].get(v, ()) for v in values))
+
+    def union(self, *groups):
+        """Products in any of the given lists, once each, in index order."""
+        return sorted({p.slug: p for group in groups for p in group}.values(), key=lambda p: self.position[p.slug])
+
+    def prefer(self, facet, value):
+        """All products, those whose facet equals value first."""
+        matches = self.lookup(facet, value)
+        return matches + [p for p in self.products if facet_value(p, facet) != value]
+
+    def range(self, field, low=None, high=None):
+        """Products with low <= field <= high (either bound optional), ordered by field."""
+        keys, ordered = self.ranges[field]
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+        return ordered[start:end]
+
+
+PRODUCTS = [Product(slug, PRICES.get(slug), VARIANT_IMAGES.get(slug), slug in BESTSELLERS) for slug in VARIANTS]
+BY_SLUG = {p.slug: p for p in PRODUCTS}
+INDEX = CatalogIndex(PRODUCTS)
+
+
+def featured_products():
+    return [BY_SLUG[slug] for slug in FEATURED]
+
+
+def products_json(products=PRODUCTS):
+    """Compact browser copy: column names once, then one row per product."""
+    return json.dumps({"fields": [name for name, _ in BROWSER_FIELDS],
+                       "rows": [[getattr(p, attr) for _, attr in BROWSER_FIELDS] for p in products]},
+                      ensure_ascii=False, separators=(",", ":"))
+
+
+def write_products_json(writer):
+    return writer.write(PRODUCTS_JSON, products_json() + "\n")
+
+
+def main():
+    writer = OutputWriter(DEPLOY_DIR, dry_run="--dry-run" in sys.argv)
+    status = write_products_json(writer)
+    print(f"{PRODUCTS_JSON}: {len(PRODUCTS)} products ({status})")
+    if writer.dry_run:
+        writer.report("Catalog output")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,105 @@
 // ========== REGAL BOT - Chatbot s localStorage ==========
+// Generované stránky mají jen spouštěcí tlačítko (#chatWidget) a tento skript
+// načítají až při první interakci nebo v nečinnosti; okno chatu si skript
+// vytvoří sám. Historie z localStorage se čte až při prvním otevření.
+
+// Historie z localStorage (načte se v ensureChatData)
+let chatLog = null;
+let chatContext = null;
+
+function ensureChatData() {
+  if (chatLog) return;
+  chatLog = JSON.parse(localStorage.getItem('regalbot_history') || '[]');
+  chatContext = JSON.parse(localStorage.getItem('regalbot_context') || '{"height":null,"width":null,"depth":null,"color":null,"quantity":null,"usage":null}');
+}
+
+const CHAT_GREETING = `
+    <div class="flex gap-3">
+      <div class="w-8 h-8 bg-primary-100 rounded-full flex items-center justify-center flex-shrink-0">🤖</div>
+      <div class="bg-gray-100 rounded-2xl rounded-tl-none p-3 text-sm max-w-[80%]">Ahoj! 👋 Jsem RegálBot a pomohu vám vybrat ideální regál. Na co se chcete zeptat?</div>
+    </div>
+  `;
+
+// Okno chatu - vytvoří se, pokud ho stránka nemá ve svém HTML
+function ensureChatWindow() {
+  if (document.getElementById('chatWindow')) return;
+  let widget = document.getElementById('chatWidget');
+  if (!widget) {
+    widget = document.createElement('div');
+    widget.id = 'chatWidget';
+    widget.className = 'fixed bottom-6 right-4 z-40';
+    document.body.appendChild(widget);
+  }
+  widget.insertAdjacentHTML('beforeend', `
+  <div id="chatWindow" class="hidden absolute bottom-16 right-0 w-80 sm:w-96 bg-white rounded-2xl shadow-2xl overflow-hidden">
+    <div class="bg-gradient-to-r from-primary-500 to-orange-500 text-white p-4">
+      <div class="flex items-center justify-between">
+        <div class="flex items-center gap-3">
+          <div class="w-10 h-10 bg-white/20 rounded-full flex items-center justify-center">🤖</div>
+          <div>
+            <div class="font-bold">RegálBot</div>
+            <div class="text-xs text-white/80 flex items-center gap-1">
+              <span class="w-2 h-2 bg-green-400 rounded-full"></span> Online
+            </div>
+          </div>
+        </div>
+        <button onclick="toggleChat()" class="text-white/80 hover:text-white text-xl">✕</button>
+      </div>
+    </div>
+    <div id="chatMessages" class="h-80 overflow-y-auto p-4 space-y-4">${CHAT_GREETING}</div>
+    <div class="border-t p-4">
+      <div class="flex gap-2">
+        <input type="text" id="chatInput" placeholder="Napište zprávu..." class="flex-1 border rounded-lg px-3 py-2 text-sm focus:outline-none focus:border-primary-500" onkeypress="if(event.key==='Enter')sendMessage()">
+        <button onclick="sendMessage()" class="bg-primary-500 hover:bg-primary-600 text-white px-4 py-2 rounded-lg transition">➤</button>
+      </div>
+      <div class="flex flex-wrap gap-1 mt-2">
+        <button onclick="quickQuestion('Jaký regál do garáže?')" class="text-xs bg-gray-100 hover:bg-gray-200 px-2 py-1 rounded-full">🚗 Do garáže</button>
+        <button onclick="quickQuestion('Regál do vlhka?')" class="text-xs bg-gray-100 hover:bg-gray-200 px-2 py-1 rounded-full">💧 Do vlhka</button>
+        <button onclick="quickQuestion('Nejlevnější regál?')" class="text-xs bg-gray-100 hover:bg-gray-200 px-2 py-1 rounded-full">💰 Nejlevnější</button>
+      </div>
+    </div>
+  </div>`);
+}
+
+// Produktová data pro chatbot: products.json z catalog.py, načte se při prvním použití chatu
+let chatProducts = [];
+let chatProductsRequest = null;
+let chatProductsFailed = false;
+
+// Promise, která se vyřeší po načtení (i neúspěšném) produktů; při chybě se příště zkusí znovu
+function ensureChatProducts() {
+  if (chatProductsRequest) return chatProductsRequest;
+  chatProductsRequest = fetch('products.json')
+    .then(r => {
+      if (!r.ok) throw new Error(`products.json: HTTP ${r.status}`);
+      return r.json();
+    })
+    .then(data => {
+      chatProducts = data.rows.map(row => {
+        const p = {};
+        data.fields.forEach((field, j) => { p[field] = row[j]; });
+        return p;
+      });
+      chatProductsFailed = false;
+    })
+    .catch(err => {
+      console.warn('Chatbot: produkty se nepodařilo načíst', err);
+      chatProductsFailed = true;
+      chatProductsRequest = null;
+    });
+  return chatProductsRequest;
+}
 
-// Načti historii z localStorage
-let chatLog = JSON.parse(localStorage.getItem('regalbot_history') || '[]');
-let chatContext = JSON.parse(localStorage.getItem('regalbot_context') || '{"height":null,"width":null,"depth":null,"color":null,"quantity":null,"usage":null}');
-
-// Produktová data pro chatbot (zjednodušená verze)
-const chatProducts = [
-  { height: 150, width: 70, depth: 30, color: "Černá", price: 599, name: "Regál 150×70×30 cm černý", url: "regal-150x70x30-cerna.html" },
-  { height: 150, width: 70, depth: 30, color: "Bílá", price: 599, name: "Regál 150×70×30 cm bílý", url: "regal-150x70x30-bila.html" },
-  { height: 150, width: 70, depth: 30, color: "Červená", price: 599, name: "Regál 150×70×30 cm červený", url: "regal-150x70x30-cervena.html" },
-  { height: 150, width: 70, depth: 30, color: "Zinkovaný", price: 549, name: "Regál 150×70×30 cm zinkovaný", url: "regal-150x70x30-zinkovany.html" },
-  { height: 180, width: 90, depth: 40, color: "Černá", price: 739, name: "Regál 180×90×40 cm černý", url: "regal-180x90x40-cerna.html", bestseller: true },
-  { height: 180, width: 90, depth: 40, color: "Bílá", price: 739, name: "Regál 180×90×40 cm bílý", url: "regal-180x90x40-bila.html" },
-  { height: 180, width: 90, depth: 40, color: "Zinkovaný", price: 649, name: "Regál 180×90×40 cm zinkovaný", url: "regal-180x90x40-zinkovany.html" },
-  { height: 180, width: 90, depth: 40, color: "Červená", price: 759, name: "Regál 180×90×40 cm červený", url: "regal-180x90x40-cervena.html" },
-  { height: 180, width: 90, depth: 40, color: "Modrá", price: 759, name: "Regál 180×90×40 cm modrý", url: "regal-180x90x40-modra.html" },
-  { height: 180, width: 60, depth: 40, color: "Černá", price: 689, name: "Regál 180×60×40 cm černý", url: "regal-180x60x40-cerna.html" },
-  { height: 180, width: 40, depth: 40, color: "Černá", price: 629, name: "Regál 180×40×40 cm černý", url: "regal-180x40x40-cerna.html" },
-  { height: 180, width: 40, depth: 40, color: "Zinkovaný", price: 579, name: "Regál 180×40×40 cm zinkovaný", url: "regal-180x40x40-zinkovany.html" },
-  { height: 200, width: 90, depth: 40, color: "Černá", price: 849, name: "Regál 200×90×40 cm černý", url: "regal-200x90x40-cerna.html" },
-  { height: 220, width: 90, depth: 45, color: "Černá", price: 899, name: "Regál 220×90×45 cm černý", url: "regal-220x90x45-cerna.html" },
-  { height: 180, width: 120, depth: 50, color: "Černá", price: 1149, name: "Regál 180×120×50 cm černý", url: "regal-180x120x50-cerna.html" },
-  { height: 180, width: 120, depth: 50, color: "Profesionální", price: 1249, name: "Regál 180×120×50 cm profesionální", url: "regal-180x120x50-profesionalni.html" }
-];
+const CHAT_PRODUCTS_ERROR = '<br><br><span class="text-xs text-gray-500">Seznam produktů se teď nepodařilo načíst, ' +
+  'celou nabídku najdete v <a href="katalog.html" class="text-primary-500 underline">katalogu</a>.</span>';
 
 function toggleChat() {
+  ensureChatWindow();
+  ensureChatProducts();
+  if (!chatLog) {
+    ensureChatData();
+    loadChatHistory();
+  }
   const chatWindow = document.getElementById('chatWindow');
   chatWindow.classList.toggle('hidden');
 
@@ -40,18 +115,22 @@ function sendMessage() {
   const message = input.value.trim();
   if (!message) return;
 
+  ensureChatData();
+  const productsLoaded = ensureChatProducts();
   addChatMessage(message, 'user');
   chatLog.push({ role: 'user', message, time: new Date().toISOString() });
   saveChatData();
   input.value = '';
 
-  // Simulate AI response
-  setTimeout(() => {
-    const response = generateAIResponse(message);
+  // Simulate AI response; odpověď počká, až se dokončí načítání produktů
+  const delay = new Promise(resolve => setTimeout(resolve, 800));
+  Promise.all([productsLoaded, delay]).then(() => {
+    let response = generateAIResponse(message);
+    if (chatProductsFailed) response += CHAT_PRODUCTS_ERROR;
     addChatMessage(response, 'bot');
     chatLog.push({ role: 'bot', message: response, time: new Date().toISOString() });
     saveChatData();
-  }, 800);
+  });
 }
 
 function quickQuestion(question) {
@@ -101,14 +180,7 @@ function clearChatHistory() {
   localStorage.removeItem('regalbot_context');
 
   const container = document.getElementById('chatMessages');
-  container.innerHTML = `
-    <div class="flex gap-3">
-      <div class="w-8 h-8 bg-primary-100 rounded-full flex items-center justify-center flex-shrink-0">🤖</div>
-      <div class="bg-gray-100 rounded-2xl rounded-tl-none p-3 text-sm max-w-[80%]">
-        Ahoj! 👋 Jsem RegálBot a pomohu vám vybrat ideální regál. Na co se chcete zeptat?
-      </div>
-    </div>
-  `;
+  container.innerHTML = CHAT_GREETING;
 }
 
 function findMatchingProduct() {
@@ -224,7 +296,8 @@ function generateAIResponse(message) {
   return 'Pomohu vám vybrat ideální regál! 😊<br><br>Řekněte mi:<br>• Kam ho chcete? (garáž, sklep, dílna...)<br>• Jaké rozměry? (např. 180×90×40 cm)<br>• Jakou barvu? (černá, bílá, zinkovaný...)';
 }
 
-// Inicializace při načtení stránky
-document.addEventListener('DOMContentLoaded', function() {
-  loadChatHistory();
-});
+// Kliknutí na spouštěcí tlačítko před načtením skriptu
+if (window.regalbotOpen) {
+  window.regalbotOpen = false;
+  toggleChat();
+}
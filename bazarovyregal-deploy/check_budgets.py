@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Page-weight budgets: run after all generators (and build_*.py stages).
+
+Breaks every page of the deploy dir down into
+    script   - inline <script> code (not JSON-LD)
+    json_ld  - <script type="application/ld+json"> blocks
+    style    - inline <style> blocks (page styles, critical CSS, @font-face)
+    markup   - tags and attributes
+    text     - text content
+counts the external requests in the page markup (scripts, stylesheets,
+preloads, images, iframes; distinct URLs, loading="lazy" images included,
+files injected by inline scripts such as chatbot.js not), and checks each
+page against the BUDGETS of its template family: the layout families of
+build_css.family_pages() (read from pseo_manifest.json and the page lists of
+the other generators; nothing is rendered), "home" for index.html, and
+"static" for other hand-written pages. Exits with status 1 when a page is
+over budget, so page-weight regressions stop the build before deploy;
+dev_server.py --watch runs it after every rebuild.
+
+Budgets are raw (uncompressed) bytes per page. A family's budget can be
+overridden for one run with --budget family.key=value.
+
+Usage:
+    python3 check_budgets.py                          # check, print violations and family summary
+    python3 check_budgets.py --verbose                # ... and every page's breakdown
+    python3 check_budgets.py --budget product.html=52000
+"""
+
+import os
+import re
+import sys
+import glob
+
+from build_css import family_pages
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+PARTS = ("script", "json_ld", "style", "markup", "text")
+
+# Per family: "html" (total bytes), any of PARTS (bytes) and "requests"
+BUDGETS = {
+    "article": {"html": 40_000, "script": 1_500, "json_ld": 3_500, "style": 10_000, "requests": 7},
+    "landing": {"html": 30_000, "script": 1_500, "json_ld": 2_000, "style": 9_000, "requests": 7},
+    "product": {"html": 65_000, "script": 3_000, "json_ld": 2_000, "style": 12_000, "requests": 10},
+    "catalog": {"html": 90_000, "script": 46_000, "json_ld": 2_000, "style": 16_000, "requests": 5},
+    "home": {"html": 75_000, "script": 12_000, "json_ld": 1_000, "style": 3_000, "requests": 15},
+    "static": {"html": 56_000, "script": 10_000, "json_ld": 1_000, "style": 3_000, "requests": 12},
+}
+FAMILY_ORDER = ("product", "catalog", "article", "landing")
+
+_BLOCK_RE = re.compile(r"<(script|style)\b([^>]*)>(.*?)</\1\s*>", re.S | re.I)
+_TAG_RE = re.compile(r"<!--.*?-->|<[^>]*>", re.S)
+_ATTR_RE = re.compile(r"""\b([\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_ELEMENT_RE = re.compile(r"<(script|link|img|iframe|video|audio|embed)\b[^>]*>", re.I)
+
+
+def page_families(deploy_dir=DEPLOY_DIR):
+    """{page file name: family} for every page in deploy_dir."""
+    families = {}
+    pages = family_pages(deploy_dir)
+    for family in FAMILY_ORDER:
+        for name in pages.get(family, []):
+            families.setdefault(name, family)
+    for path in glob.glob(os.path.join(deploy_dir, "*.html")):
+        name = os.path.basename(path)
+        families.setdefault(name, "home" if name == "index.html" else "static")
+    return families
+
+
+def _attrs(tag):
+    return {m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3) for m in _ATTR_RE.finditer(tag)}
+
+
+def external_requests(html):
+    """Distinct URLs the page fetches while loading."""
+    # Tags built by inline scripts (`<img src="${p.image}">`) are not in the page
+    html = _BLOCK_RE.sub(lambda m: m.group(0) if "src=" in m.group(2) else "", html)
+    urls = set()
+    for m in _ELEMENT_RE.finditer(html):
+        name = m.group(1).lower()
+        attrs = _attrs(m.group(0))
+        if name == "link":
+            rel = set(attrs.get("rel", "").lower().split())
+            if rel & {"stylesheet", "preload", "modulepreload", "icon"} and attrs.get("href"):
+                urls.add(attrs["href"])
+        elif attrs.get("src") and not attrs["src"].startswith("data:"):
+            urls.add(attrs["src"])
+    return urls
+
+
+def breakdown(html):
+    """{part: bytes} for one page (UTF-8 sizes), plus "html" and "requests"."""
+    sizes = dict.fromkeys(PARTS, 0)
+    rest = []
+    last = 0
+    for m in _BLOCK_RE.finditer(html):
+        rest.append(html[last:m.start()])
+        last = m.end()
+        size = len(m.group(0).encode("utf-8"))
+        if m.group(1).lower() == "style":
+            sizes["style"] += size
+        elif "application/ld+json" in m.group(2):
+            sizes["json_ld"] += size
+        elif "src=" in m.group(2):
+            rest.append(m.group(0))  # external script: just a tag
+        else:
+            sizes["script"] += size
+    rest.append(html[last:])
+    rest = "".join(rest)
+    sizes["markup"] = sum(len(t.encode("utf-8")) for t in _TAG_RE.findall(rest))
+    sizes["text"] = len(rest.encode("utf-8")) - sizes["markup"]
+    sizes["html"] = len(html.encode("utf-8"))
+    sizes["requests"] = len(external_requests(html))
+    return sizes
+
+
+def check(deploy_dir=DEPLOY_DIR, budgets=BUDGETS):
+    """([(page, family, sizes)], [(page, family, key, value, budget)])."""
+    results = []
+    violations = []
+    for name, family in sorted(page_families(deploy_dir).items()):
+        with open(os.path.join(deploy_dir, name), "r", encoding="utf-8") as f:
+            sizes = breakdown(f.read())
+        results.append((name, family, sizes))
+        for key, budget in budgets.get(family, {}).items():
+            if sizes[key] > budget:
+                violations.append((name, family, key, sizes[key], budget))
+    return results, violations
+
+
+def parse_overrides(argv, budgets=BUDGETS):
+    """Copy of budgets with --budget family.key=value overrides applied."""
+    budgets = {family: dict(values) for family, values in budgets.items()}
+    for i, arg in enumerate(argv):
+        if arg != "--budget" or i + 1 >= len(argv):
+            continue
+        target, _, value = argv[i + 1].partition("=")
+        family, _, key = target.partition(".")
+        if family not in budgets or key not in ("html", "requests") + PARTS or not value.isdigit():
+            sys.exit(f"--budget expects family.key=number, got {argv[i + 1]}")
+        budgets[family][key] = int(value)
+    return budgets
+
+
+def print_summary(results):
+    columns = ("html",) + PARTS + ("requests",)
+    print(f"  {'family':<8} {'pages':>5}" + "".join(f" {c:>9}" for c in columns) + "   (max per page)")
+    families = {}
+    for _, family, sizes in results:
+        entry = families.setdefault(family, [0, dict.fromkeys(columns, 0)])
+        entry[0] += 1
+        for c in columns:
+            entry[1][c] = max(entry[1][c], sizes[c])
+    for family, (count, maxima) in sorted(families.items()):
+        print(f"  {family:<8} {count:>5}" + "".join(f" {maxima[c]:>9,}" for c in columns))
+
+
+def main():
+    budgets = parse_overrides(sys.argv)
+    results, violations = check(budgets=budgets)
+    if "--verbose" in sys.argv:
+        for name, family, sizes in results:
+            print(f"  {name:<50} {family:<8} " + " ".join(f"{k} {sizes[k]:,}" for k in ("html",) + PARTS + ("requests",)))
+    print(f"Page budgets: {len(results)} pages")
+    print_summary(results)
+    if violations:
+        print(f"\n  {len(violations)} budget violations:")
+        for name, family, key, value, budget in violations:
+            print(f"    {name:<50} {family:<8} {key:<8} {value:>9,} > {budget:,}")
+        sys.exit(1)
+    print("  All pages within budget")
+
+
+if __name__ == "__main__":
+    main()
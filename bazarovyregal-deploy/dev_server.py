@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Local dev server for Bazarovyregal.cz
+
+Serves the deploy directory with the same cleanUrls / trailingSlash
+behaviour as vercel.json. With --watch it polls the generator sources and
+data and re-renders only what changed:
+    pseo_playbooks_partN.py  -> the playbooks defined in that module (--only)
+    pseo_config.py           -> the playbooks that read the changed datasets
+    template / orchestrator  -> all pSEO pages
+    page_layout.py           -> every generator (shared chrome)
+    catalog.py               -> every generator (product data)
+    generate_seo_pages.py    -> SEO pages, generate_full_product_pages.py -> product pages
+Every rebuild ends with check_budgets.py; pages over budget fail it (no reload).
+Open pages reload themselves after a rebuild.
+Precompressed siblings from build_compress.py (page.html.br, .gz) are served
+with Content-Encoding when the client accepts them (not with --watch, where
+pages get the reload script and siblings go stale), and the log shows the
+bytes sent, so transfer sizes can be measured locally.
+
+Usage:
+    python3 dev_server.py serve                  # http://localhost:8000
+    python3 dev_server.py serve --watch          # ... and rebuild on change
+    python3 dev_server.py serve --watch --port 3000
+"""
+
+import os
+import sys
+import json
+import time
+import runpy
+import threading
+import subprocess
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from pseo_registry import PLAYBOOKS, playbooks_for_module, playbooks_for_datasets
+
+DEPLOY_DIR = os.path.dirname(os.path.abspath(__file__))
+POLL_INTERVAL = 0.25
+
+# Changes to these re-render every pSEO page (layout hash is not bumped by hand while iterating)
+PSEO_SHARED = {"pseo_html_template.py", "generate_pseo_all.py", "pseo_registry.py", "pseo_link_graph.py"}
+STANDALONE = {"generate_seo_pages.py": ["generate_seo_pages.py"],
+              "generate_full_product_pages.py": ["generate_full_product_pages.py"]}
+# Shared by all generators
+LAYOUT_SHARED = {"page_layout.py", "asset_manifest.py", "catalog.py"}
+
+# Preferred first
+PRECOMPRESSED = [("br", ".br"), ("gzip", ".gz")]
+
+RELOAD_SCRIPT = b"""<script>(function(){var v=null;setInterval(function(){fetch('/__dev/version').then(function(r){return r.text()}).then(function(t){if(v!==null&&t!==v)location.reload();v=t}).catch(function(){})},500)})();</script>"""
+
+
+def load_vercel_config(deploy_dir=DEPLOY_DIR):
+    path = os.path.join(deploy_dir, "vercel.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def config_datasets(deploy_dir=DEPLOY_DIR):
+    """Top-level UPPERCASE values of pseo_config.py, loaded fresh from disk."""
+    values = runpy.run_path(os.path.join(deploy_dir, "pseo_config.py"))
+    return {k: v for k, v in values.items() if k.isupper()}
+
+
+def source_mtimes(deploy_dir=DEPLOY_DIR):
+    """mtime_ns of every watched source file."""
+    mtimes = {}
+    for name in os.listdir(deploy_dir):
+        if name.endswith(".py") and name != os.path.basename(__file__):
+            mtimes[name] = os.stat(os.path.join(deploy_dir, name)).st_mtime_ns
+    return mtimes
+
+
+def plan_rebuild(changed_files, old_datasets, new_datasets):
+    """Map changed source files to generator commands (lists of argv after the interpreter)."""
+    commands = []
+    pseo_names = set()
+    pseo_full = False
+
+    for name in sorted(changed_files):
+        module = name[:-3]
+        if name in LAYOUT_SHARED:
+            pseo_full = True
+            commands.extend(cmd for cmd in STANDALONE.values() if cmd not in commands)
+        elif name in STANDALONE:
+            if STANDALONE[name] not in commands:
+                commands.append(STANDALONE[name])
+        elif name in PSEO_SHARED:
+            pseo_full = True
+        elif name == "pseo_config.py":
+            changed = [k for k in new_datasets.keys() | old_datasets.keys()
+                       if old_datasets.get(k) != new_datasets.get(k)]
+            affected = playbooks_for_datasets(changed)
+            declared = {d for pb in PLAYBOOKS for d in pb["depends"]}
+            if any(k not in declared for k in changed):
+                pseo_full = True  # BASE_URL, IMAGES, ... are not tracked per playbook
+            pseo_names.update(pb["name"] for pb in affected)
+            if changed:
+                print(f"  pseo_config.py: changed {', '.join(sorted(changed))}")
+        elif playbooks_for_module(module):
+            pseo_names.update(pb["name"] for pb in playbooks_for_module(module))
+
+    if pseo_full:
+        commands.insert(0, ["generate_pseo_all.py"])
+    elif pseo_names:
+        only = ",".join(pb["name"] for pb in PLAYBOOKS if pb["name"] in pseo_names)
+        commands.insert(0, ["generate_pseo_all.py", "--incremental", "--only", only])
+    if commands:
+        # Last: a page over its budget fails the rebuild
+        commands.append(["check_budgets.py"])
+    return commands
+
+
+class Watcher(threading.Thread):
+    """Polls source mtimes and runs the planned generators in a subprocess (fresh imports)."""
+
+    def __init__(self, deploy_dir=DEPLOY_DIR, interval=POLL_INTERVAL):
+        super().__init__(daemon=True)
+        self.deploy_dir = deploy_dir
+        self.interval = interval
+        self.version = 0
+        self.mtimes = source_mtimes(deploy_dir)
+        self.datasets = config_datasets(deploy_dir)
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            mtimes = source_mtimes(self.deploy_dir)
+            changed = {name for name, m in mtimes.items() if self.mtimes.get(name) != m}
+            if not changed:
+                continue
+            self.mtimes = mtimes
+            self.rebuild(changed)
+
+    def rebuild(self, changed):
+        print(f"\nChanged: {', '.join(sorted(changed))}")
+        datasets = self.datasets
+        if "pseo_config.py" in changed:
+            try:
+                datasets = config_datasets(self.deploy_dir)
+            except Exception as e:
+                print(f"  pseo_config.py failed to load: {e}")
+                return
+        commands = plan_rebuild(changed, self.datasets, datasets)
+        self.datasets = datasets
+        if not commands:
+            print("  Nothing to rebuild")
+            return
+
+        start = time.perf_counter()
+        for argv in commands:
+            print(f"  Running: {' '.join(argv)}")
+            result = subprocess.run([sys.executable] + argv, cwd=self.deploy_dir,
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                print(result.stdout[-2000:] + result.stderr[-2000:])
+                print(f"  FAILED: {argv[0]} (exit {result.returncode})")
+                return
+        self.version += 1
+        print(f"  Rebuilt in {time.perf_counter() - start:.2f}s")
+
+
+def make_handler(deploy_dir, vercel, watcher=None):
+    clean_urls = vercel.get("cleanUrls", False)
+    trailing_slash = vercel.get("trailingSlash")
+
+    class DevHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=deploy_dir, **kwargs)
+
+        def redirect(self, location):
+            self.send_response(308)
+            self.send_header("Location", location)
+            self.end_headers()
+
+        def do_GET(self):
+            path, _, query = self.path.partition("?")
+            suffix = f"?{query}" if query else ""
+
+            if path == "/__dev/version":
+                body = str(watcher.version if watcher else 0).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            # trailingSlash: false -> /foo/ redirects to /foo
+            if trailing_slash is False and path != "/" and path.endswith("/"):
+                return self.redirect(path.rstrip("/") + suffix)
+
+            if clean_urls:
+                # /foo.html redirects to /foo, /foo serves foo.html, /index redirects to /
+                if path.endswith(".html"):
+                    clean = path[:-5]
+                    if clean.endswith("/index"):
+                        clean = clean[:-len("index")]
+                    return self.redirect(clean + suffix)
+                local = self.translate_path(path)
+                if path != "/" and not os.path.exists(local) and os.path.isfile(local + ".html"):
+                    self.path = path + ".html" + suffix
+
+            if watcher and self.path.split("?", 1)[0].endswith((".html", "/")):
+                return self.send_html_with_reload()
+            if not watcher and self.send_precompressed():
+                return
+            return super().do_GET()
+
+        def send_precompressed(self):
+            """Serve a fresh .br/.gz sibling the client accepts; False if there is none."""
+            local = self.translate_path(self.path.split("?", 1)[0])
+            if os.path.isdir(local):
+                local = os.path.join(local, "index.html")
+            if not os.path.isfile(local):
+                return False
+            accepted = {e.split(";")[0].strip() for e in self.headers.get("Accept-Encoding", "").split(",")}
+            for encoding, ext in PRECOMPRESSED:
+                sibling = local + ext
+                if (encoding in accepted and os.path.isfile(sibling)
+                        and os.path.getmtime(sibling) >= os.path.getmtime(local)):
+                    with open(sibling, "rb") as f:
+                        body = f.read()
+                    self.send_response_only(200)
+                    self.log_request(200, len(body))
+                    self.send_header("Server", self.version_string())
+                    self.send_header("Date", self.date_time_string())
+                    self.send_header("Content-Type", self.guess_type(local))
+                    self.send_header("Content-Encoding", encoding)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("Vary", "Accept-Encoding")
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return True
+            return False
+
+        def send_html_with_reload(self):
+            local = self.translate_path(self.path.split("?", 1)[0])
+            if os.path.isdir(local):
+                local = os.path.join(local, "index.html")
+            if not os.path.isfile(local):
+                return super().do_GET()
+            with open(local, "rb") as f:
+                body = f.read()
+            idx = body.rfind(b"</body>")
+            body = body[:idx] + RELOAD_SCRIPT + body[idx:] if idx != -1 else body + RELOAD_SCRIPT
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if "/__dev/" not in self.path:
+                super().log_message(format, *args)
+
+    return DevHandler
+
+
+def _parse_port(argv, default=8000):
+    if "--port" not in argv:
+        return default
+    idx = argv.index("--port")
+    if idx + 1 >= len(argv) or not argv[idx + 1].isdigit():
+        sys.exit("--port expects a number")
+    return int(argv[idx + 1])
+
+
+def serve(port=8000, watch=False, deploy_dir=DEPLOY_DIR):
+    watcher = None
+    if watch:
+        watcher = Watcher(deploy_dir)
+        watcher.start()
+        print(f"Watching {len(watcher.mtimes)} source files in {deploy_dir}")
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(deploy_dir, load_vercel_config(deploy_dir), watcher))
+    print(f"Serving {deploy_dir} on http://localhost:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+    finally:
+        server.server_close()
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != "serve":
+        sys.exit(__doc__)
+    serve(_parse_port(sys.argv), watch="--watch" in sys.argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Memoizing cache for repeated HTML fragments (product cards, FAQ blocks, related links).
+
+Many pages embed byte-identical fragments, e.g. get_product_cards(PRODUCTS, 4)
+on every location page. Helpers decorated with @cached_fragment render each
+distinct input once; later calls are dict lookups. Each cache is a
+size-bounded LRU with hit/miss/eviction counters.
+
+Caches live per process, so with --jobs N every worker warms its own.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+
+DEFAULT_MAXSIZE = 512
+
+CACHES = {}
+
+
+class FragmentCache:
+    def __init__(self, name, maxsize=DEFAULT_MAXSIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_render(self, key, render):
+        """Return the cached fragment for key, calling render() on a miss."""
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            value = render()
+            self.entries[key] = value
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self.entries)}
+
+
+def freeze(value):
+    """Hashable snapshot of nested dicts/lists, for use as a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def cached_fragment(name, maxsize=DEFAULT_MAXSIZE, key=None):
+    """Decorator: memoize a fragment helper in the FragmentCache called name.
+
+    key(*args, **kwargs) must return a hashable value covering every input
+    that affects the output; by default all arguments are frozen.
+    """
+    cache = CACHES.setdefault(name, FragmentCache(name, maxsize))
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key else freeze((args, kwargs))
+            return cache.get_or_render(k, lambda: func(*args, **kwargs))
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    """{cache name: counters} for every cache that was used."""
+    return {name: c.stats() for name, c in CACHES.items() if c.hits or c.misses}
+
+
+def clear_caches():
+    """Empty every cache and zero its counters."""
+    for c in CACHES.values():
+        c.clear()
+
+
+def print_cache_stats():
+    stats = cache_stats()
+    if not stats:
+        return
+    print("\n  Fragment cache:")
+    for name, s in stats.items():
+        total = s["hits"] + s["misses"]
+        evicted = f", {s['evictions']} evicted" if s["evictions"] else ""
+        print(f"    {name:<16} {s['hits']:>6} hits / {s['misses']:>4} misses ({s['hits'] / total:.0%} hit rate){evicted}")
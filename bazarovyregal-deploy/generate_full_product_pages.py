@@ -12,263 +12,89 @@ Based on the original template with:
 """
 
 import os
+import sys
 import json
+import time
+
+from build_profiler import BuildProfiler, now_us
+from build_output import OutputWriter
+from page_layout import render_document, head_meta, breadcrumb
+from catalog import PRODUCTS, INDEX, write_products_json
+
+PRODUCT_STYLE = """    <style>
+        .product-image { aspect-ratio: 1; object-fit: contain; background: #f8fafc; }
+        .thumbnail { aspect-ratio: 1; object-fit: contain; }
+        .spec-row:nth-child(odd) { background: #f8fafc; }
+        .tab-active { border-bottom: 3px solid #f97316; color: #f97316; }
+        .sticky-bar { transform: translateY(-100%); transition: transform 0.3s; }
+        .sticky-bar.visible { transform: translateY(0); }
+        .pulse-badge { animation: pulse 2s infinite; }
+        @keyframes pulse { 0%, 100% { opacity: 1; } 50% { opacity: 0.7; } }
+        .faq-answer { max-height: 0; overflow: hidden; transition: max-height 0.3s ease; }
+        .faq-item.open .faq-answer { max-height: 500px; }
+        .faq-item.open .faq-icon { transform: rotate(180deg); }
+        .video-wrapper { position: relative; padding-bottom: 56.25%; height: 0; overflow: hidden; border-radius: 12px; }
+        .video-wrapper iframe { position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: 0; }
+        .product-card { transition: all 0.3s; }
+        .product-card:hover { transform: translateY(-4px); box-shadow: 0 12px 30px rgba(0,0,0,0.12); }
+    </style>
+"""
 
-# Product data - matching the catalog
-products = [
-    {"height": 150, "width": 70, "depth": 30, "color": "Černá", "price": 599, "priceOrig": 2396, "shelves": 4, "capacity": 700, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/v/v6903779a99ff1-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerny-pravy-15070304700black1.jpeg", "seoUrl": "regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerny"},
-    {"height": 150, "width": 70, "depth": 30, "color": "Červená", "price": 599, "priceOrig": 2396, "shelves": 4, "capacity": 700, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/9/e/9eef5f9f2ad8880b75926a3eae58485b-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny-pravy-15070304700red1.jpeg", "seoUrl": "regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny"},
-    {"height": 150, "width": 70, "depth": 30, "color": "Bílá", "price": 599, "priceOrig": 2396, "shelves": 4, "capacity": 700, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg", "seoUrl": "regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-bily"},
-    {"height": 150, "width": 70, "depth": 30, "color": "Zinkovaný", "price": 549, "priceOrig": 2196, "shelves": 4, "capacity": 700, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg", "seoUrl": "regal-1500x700x300-mm-zinkovany-4-policovy-nosnost-700-kg"},
-    {"height": 180, "width": 90, "depth": 40, "color": "Černá", "price": 739, "priceOrig": 2956, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg", "seoUrl": "regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny", "bestseller": True},
-    {"height": 180, "width": 90, "depth": 40, "color": "Bílá", "price": 739, "priceOrig": 2956, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg", "seoUrl": "regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-bily"},
-    {"height": 180, "width": 90, "depth": 40, "color": "Zinkovaný", "price": 649, "priceOrig": 2596, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg", "seoUrl": "regal-1800x900x400-mm-zinkovany-5-policovy-nosnost-875-kg"},
-    {"height": 180, "width": 90, "depth": 40, "color": "Červená", "price": 759, "priceOrig": 3036, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/9/e/9eef5f9f2ad8880b75926a3eae58485b-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny-pravy-15070304700red1.jpeg", "seoUrl": "regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerveny"},
-    {"height": 180, "width": 90, "depth": 40, "color": "Modrá", "price": 759, "priceOrig": 3036, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/1/c/1c64831c1231f5847cf9e7a36f6cdf6f-1-15070304700blue1.jpeg", "seoUrl": "regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-modry"},
-    {"height": 180, "width": 60, "depth": 40, "color": "Černá", "price": 689, "priceOrig": 2756, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/j/j690377a5dc94d-1-regal-1800x600x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18060405875black1.jpeg", "seoUrl": "regal-1800x600x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny"},
-    {"height": 180, "width": 60, "depth": 40, "color": "Bílá", "price": 689, "priceOrig": 2756, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg", "seoUrl": "regal-1800x600x400-mm-lakovany-5-policovy-nosnost-875-kg-bily"},
-    {"height": 180, "width": 40, "depth": 40, "color": "Černá", "price": 629, "priceOrig": 2516, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/2/2690377a330269-1-regal-1800x400x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18040405875black1.jpeg", "seoUrl": "regal-1800x400x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny"},
-    {"height": 180, "width": 40, "depth": 40, "color": "Zinkovaný", "price": 579, "priceOrig": 2316, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg", "seoUrl": "regal-1800x400x400-mm-zinkovany-5-policovy-nosnost-875-kg"},
-    {"height": 180, "width": 40, "depth": 30, "color": "Zinkovaný", "price": 549, "priceOrig": 2196, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg", "seoUrl": "regal-1800x400x300-mm-zinkovany-5-policovy-nosnost-875-kg"},
-    {"height": 200, "width": 90, "depth": 40, "color": "Černá", "price": 849, "priceOrig": 3396, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg", "seoUrl": "regal-2000x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny"},
-    {"height": 220, "width": 90, "depth": 45, "color": "Černá", "price": 899, "priceOrig": 3596, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg", "seoUrl": "regal-2200x900x450-mm-lakovany-5-policovy-nosnost-875-kg-cerny"},
-    {"height": 180, "width": 120, "depth": 50, "color": "Černá", "price": 1149, "priceOrig": 4596, "shelves": 5, "capacity": 875, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg", "seoUrl": "regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-875-kg-cerny"},
-    {"height": 180, "width": 120, "depth": 50, "color": "Profesionální", "price": 1249, "priceOrig": 4996, "shelves": 5, "capacity": 1050, "image": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/b/1/b17ce5b491bdb73a0df3160b51fbcf7e-1-regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-1050-kg-modro-oranzovy-pravy-18120501050orangeblue1.jpeg", "seoUrl": "regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-1050-kg-modro-oranzovy"},
-]
-
-# Additional generated products
-colors = ["Černá", "Bílá", "Červená", "Modrá", "Zinkovaný"]
-heights = [150, 180, 200, 220]
-widths = [40, 60, 70, 90, 120]
-depths = [30, 40, 45, 50]
-
-color_images = {
-    "Černá": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg",
-    "Bílá": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg",
-    "Červená": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/9/e/9eef5f9f2ad8880b75926a3eae58485b-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny-pravy-15070304700red1.jpeg",
-    "Modrá": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/1/c/1c64831c1231f5847cf9e7a36f6cdf6f-1-15070304700blue1.jpeg",
-    "Zinkovaný": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg",
-    "Profesionální": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/b/1/b17ce5b491bdb73a0df3160b51fbcf7e-1-regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-1050-kg-modro-oranzovy-pravy-18120501050orangeblue1.jpeg"
-}
-
-color_czech_map = {
-    'Černá': 'černá',
-    'Bílá': 'bílá',
-    'Červená': 'červená',
-    'Modrá': 'modrá',
-    'Zinkovaný': 'zinkovaný',
-    'Profesionální': 'profesionální'
-}
-
-color_slug_map = {
-    'Černá': 'cerna',
-    'Bílá': 'bila',
-    'Červená': 'cervena',
-    'Modrá': 'modra',
-    'Zinkovaný': 'zinkovany',
-    'Profesionální': 'profesionalni'
-}
-
-# Generate more products to match existing files
-import random
-random.seed(42)
-
-existing_files = [
-    "regal-150x70x30-cerna", "regal-150x70x30-cervena", "regal-150x70x30-zinkovany", "regal-180x90x40-bila", "regal-180x90x40-zinkovany",
-    "regal-180x60x40-cerna", "regal-180x40x40-cerna", "regal-200x90x40-cerna", "regal-220x90x45-cerna",
-    "regal-180x120x50-cerna", "regal-180x90x40-modra", "regal-180x40x30-zinkovany", "regal-180x90x45-cerna",
-    "regal-220x70x45-bila", "regal-200x40x30-modra", "regal-200x70x45-cerna", "regal-200x120x40-cerna",
-    "regal-220x70x50-cervena", "regal-150x120x40-zinkovany", "regal-180x90x50-cervena", "regal-180x70x30-bila",
-    "regal-200x60x50-modra", "regal-220x60x45-bila", "regal-200x120x50-zinkovany", "regal-200x60x40-zinkovany",
-    "regal-150x40x30-bila", "regal-150x120x45-cervena", "regal-200x90x40-modra", "regal-200x120x40-zinkovany",
-    "regal-220x40x30-cervena", "regal-180x40x40-zinkovany", "regal-150x90x30-zinkovany", "regal-180x90x40-cervena",
-    "regal-200x90x50-cerna", "regal-180x40x45-cerna", "regal-180x120x40-cerna", "regal-150x60x30-cerna",
-    "regal-150x120x40-cervena", "regal-220x60x40-zinkovany", "regal-220x60x50-modra", "regal-150x40x50-cervena",
-    "regal-220x90x30-cerna", "regal-220x70x30-bila", "regal-180x120x50-bila", "regal-180x70x50-bila",
-    "regal-150x40x40-bila", "regal-220x90x40-modra", "regal-180x90x30-modra", "regal-220x70x50-zinkovany",
-    "regal-220x60x40-cervena", "regal-150x120x30-cervena", "regal-150x120x50-zinkovany", "regal-180x40x30-bila",
-    "regal-150x60x50-cerna", "regal-180x120x30-zinkovany", "regal-220x120x45-cervena", "regal-200x60x45-modra",
-    "regal-200x90x45-cerna", "regal-180x120x45-bila", "regal-150x60x45-cervena", "regal-220x120x45-zinkovany",
-    "regal-150x120x45-cerna", "regal-200x70x40-cervena", "regal-200x120x50-cervena", "regal-150x90x45-cerna",
-    "regal-200x60x45-bila", "regal-220x120x30-cerna", "regal-180x120x30-cervena", "regal-180x90x40-cerna",
-    "regal-200x40x45-bila", "regal-180x40x45-zinkovany", "regal-180x60x40-bila", "regal-150x60x45-modra",
-    "regal-180x70x40-cerna", "regal-150x90x40-bila", "regal-200x70x40-bila", "regal-180x90x45-cervena",
-    "regal-150x40x45-bila", "regal-200x40x30-zinkovany", "regal-200x70x50-zinkovany", "regal-150x90x40-cervena",
-    "regal-220x40x40-cervena", "regal-150x70x45-cerna", "regal-200x90x45-modra", "regal-200x120x40-bila",
-    "regal-150x70x30-bila", "regal-180x120x50-profesionalni"
-]
-
-# Parse existing files and generate product data
-all_products = []
-for filename in existing_files:
-    parts = filename.replace("regal-", "").split("-")
-    dims = parts[0].split("x")
-    height = int(dims[0])
-    width = int(dims[1])
-    depth = int(dims[2])
-    color_slug = parts[1]
-
-    color_reverse_map = {v: k for k, v in color_slug_map.items()}
-    color = color_reverse_map.get(color_slug, "Černá")
-
-    surface = "Pozinkovaný" if color == "Zinkovaný" else "Lakovaný"
-    shelves = 5 if height >= 180 else 4
-    capacity_per_shelf = 175 if color != "Profesionální" else 210
-    capacity = shelves * capacity_per_shelf
-
-    base_price = 400 + (height // 10) * 15 + (width // 10) * 10 + (depth // 10) * 5
-    if color == "Zinkovaný":
-        base_price -= 50
-    elif color == "Profesionální":
-        base_price += 200
-    price = (base_price // 10) * 10 - 1
-    priceOrig = price * 4
-
-    image = color_images.get(color, color_images["Černá"])
-
-    all_products.append({
-        "height": height,
-        "width": width,
-        "depth": depth,
-        "color": color,
-        "price": price,
-        "priceOrig": priceOrig,
-        "shelves": shelves,
-        "capacity": capacity,
-        "image": image,
-        "surface": surface,
-        "filename": filename
-    })
-
-def get_filename(p):
-    if "filename" in p:
-        return p["filename"]
-    color_slug = color_slug_map.get(p["color"], p["color"].lower())
-    return f"regal-{p['height']}x{p['width']}x{p['depth']}-{color_slug}"
-
-def get_seo_url(p):
-    """Generate SEO URL for vyprodej-regalu.cz"""
-    surface_text = "zinkovany" if p.get("surface") == "Pozinkovaný" or p["color"] == "Zinkovaný" else "lakovany"
-    color_seo = {
-        "Černá": "cerny",
-        "Bílá": "bily",
-        "Červená": "cerveny",
-        "Modrá": "modry",
-        "Zinkovaný": "",
-        "Profesionální": "modro-oranzovy"
-    }.get(p["color"], "")
-
-    if p["color"] == "Zinkovaný":
-        return f"regal-{p['height']*10}x{p['width']*10}x{p['depth']*10}-mm-{surface_text}-{p['shelves']}-policovy-nosnost-{p['capacity']}-kg"
-    else:
-        return f"regal-{p['height']*10}x{p['width']*10}x{p['depth']*10}-mm-{surface_text}-{p['shelves']}-policovy-nosnost-{p['capacity']}-kg-{color_seo}"
 
 def generate_html(p):
-    filename = get_filename(p)
-    height = p["height"]
-    width = p["width"]
-    depth = p["depth"]
-    color = p["color"]
-    color_czech = color_czech_map.get(color, color.lower())
-    price = p["price"]
-    priceOrig = p["priceOrig"]
-    shelves = p["shelves"]
-    capacity = p["capacity"]
-    capacity_per_shelf = capacity // shelves
-    image = p["image"]
-    surface = p.get("surface", "Pozinkovaný" if color == "Zinkovaný" else "Lakovaný")
-    discount = round((1 - price / priceOrig) * 100)
+    filename = p.slug
+    height = p.height
+    width = p.width
+    depth = p.depth
+    color = p.color
+    price = p.price
+    priceOrig = p.price_orig
+    shelves = p.shelves
+    capacity = p.capacity
+    capacity_per_shelf = p.shelf_load
+    image = p.image
+    surface = p.surface
+    discount = p.discount
     savings = priceOrig - price
-    price_no_vat = round(price / 1.21)
+    price_no_vat = p.price_no_vat
 
-    seo_url = get_seo_url(p)
+    seo_url = p.seo_url
 
     # Product name
-    if color == "Profesionální":
-        name = f"Regál {height}×{width}×{depth} cm profesionální"
-        full_name = f"Regál {height*10}x{width*10}x{depth*10} mm lakovaný {shelves}-policový, nosnost {capacity} kg - profesionální"
-    elif color == "Zinkovaný":
-        name = f"Regál {height}×{width}×{depth} cm zinkovaný"
+    name = p.name
+    if p.color_slug == "zinkovany":
         full_name = f"Regál {height*10}x{width*10}x{depth*10} mm pozinkovaný {shelves}-policový, nosnost {capacity} kg"
     else:
-        name = f"Regál {height}×{width}×{depth} cm {color_czech}"
-        full_name = f"Regál {height*10}x{width*10}x{depth*10} mm lakovaný {shelves}-policový, nosnost {capacity} kg - {color_czech}"
+        full_name = f"Regál {height*10}x{width*10}x{depth*10} mm lakovaný {shelves}-policový, nosnost {capacity} kg - {p.color_adjective}"
 
-    # Related products
-    related = []
-    for rp in all_products:
-        if rp != p and len(related) < 4:
-            if (rp["height"] == height and rp["width"] == width) or (rp["color"] == color):
-                related.append(rp)
+    # Related products: same height and width, or same color
+    similar = INDEX.union(INDEX.where(height=height, width=width), INDEX.lookup("color", p.color_slug))
+    related = [rp for rp in similar if rp.slug != p.slug][:4]
 
-    # Fill up with random products if needed
-    for rp in all_products:
-        if rp != p and rp not in related and len(related) < 4:
+    # Fill up with other products if needed
+    for rp in PRODUCTS:
+        if len(related) >= 4:
+            break
+        if rp.slug != p.slug and rp not in related:
             related.append(rp)
 
-    html = f'''<!DOCTYPE html>
-<html lang="cs">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{full_name} | Bazarovyregal.cz</title>
-  <meta name="description" content="Profesionální kovový regál {height}×{width}×{depth} cm s nosností {capacity} kg. {shelves} nastavitelných polic, bezšroubová montáž za 10 minut. Záruka 7 let. Skladem.">
-
-  <!-- OpenGraph Meta Tags -->
-  <meta property="og:title" content="{full_name} | Bazarovyregal.cz">
-  <meta property="og:description" content="🔥 SLEVA {discount}%! Kovový regál {height}×{width}×{depth} cm s nosností {capacity} kg. Pouze {price} Kč místo {priceOrig} Kč. Záruka 7 let, montáž za 10 min.">
-  <meta property="og:image" content="{image}">
-  <meta property="og:url" content="https://bazarovyregal.cz/{filename}.html">
-  <meta property="og:type" content="product">
-  <meta property="og:site_name" content="Bazarovyregal.cz">
-  <meta property="og:locale" content="cs_CZ">
-  <meta property="product:price:amount" content="{price}">
-  <meta property="product:price:currency" content="CZK">
-  <meta property="product:availability" content="in stock">
-
-  <!-- Twitter Card -->
-  <meta name="twitter:card" content="summary_large_image">
-  <meta name="twitter:title" content="{full_name}">
-  <meta name="twitter:description" content="🔥 SLEVA {discount}%! Pouze {price} Kč. Záruka 7 let, montáž za 10 min.">
-  <meta name="twitter:image" content="{image}">
-
-  <script src="https://cdn.tailwindcss.com"></script>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-  <script>
-    tailwind.config = {{
-      theme: {{
-        extend: {{
-          fontFamily: {{ sans: ['Inter', 'sans-serif'] }},
-          colors: {{
-            primary: {{ 50: '#fff7ed', 100: '#ffedd5', 200: '#fed7aa', 300: '#fdba74', 400: '#fb923c', 500: '#f97316', 600: '#ea580c', 700: '#c2410c', 800: '#9a3412', 900: '#7c2d12' }}
-          }}
-        }}
-      }}
-    }}
-  </script>
-  <style>
-    .product-image {{ aspect-ratio: 1; object-fit: contain; background: #f8fafc; }}
-    .thumbnail {{ aspect-ratio: 1; object-fit: contain; }}
-    .spec-row:nth-child(odd) {{ background: #f8fafc; }}
-    .tab-active {{ border-bottom: 3px solid #f97316; color: #f97316; }}
-    .sticky-bar {{ transform: translateY(-100%); transition: transform 0.3s; }}
-    .sticky-bar.visible {{ transform: translateY(0); }}
-    .pulse-badge {{ animation: pulse 2s infinite; }}
-    @keyframes pulse {{ 0%, 100% {{ opacity: 1; }} 50% {{ opacity: 0.7; }} }}
-    .faq-answer {{ max-height: 0; overflow: hidden; transition: max-height 0.3s ease; }}
-    .faq-item.open .faq-answer {{ max-height: 500px; }}
-    .faq-item.open .faq-icon {{ transform: rotate(180deg); }}
-    .video-wrapper {{ position: relative; padding-bottom: 56.25%; height: 0; overflow: hidden; border-radius: 12px; }}
-    .video-wrapper iframe {{ position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: 0; }}
-    .product-card {{ transition: all 0.3s; }}
-    .product-card:hover {{ transform: translateY(-4px); box-shadow: 0 12px 30px rgba(0,0,0,0.12); }}
-  </style>
-</head>
-<body class="bg-gray-50 font-sans">
-
-<!-- Sticky Add to Cart Bar -->
-<div id="stickyBar" class="sticky-bar fixed top-0 left-0 right-0 bg-white shadow-lg z-50 py-3 border-b">
+    og_url = f"https://bazarovyregal.cz/{filename}.html"
+    head = head_meta(
+        f"{full_name} | Bazarovyregal.cz",
+        f"Profesionální kovový regál {height}×{width}×{depth} cm s nosností {capacity} kg. {shelves} nastavitelných polic, bezšroubová montáž za 10 minut. Záruka 7 let. Skladem.",
+        og_url,
+        image,
+        og_type="product",
+        og_description=f"🔥 SLEVA {discount}%! Kovový regál {height}×{width}×{depth} cm s nosností {capacity} kg. Pouze {price} Kč místo {priceOrig} Kč. Záruka 7 let, montáž za 10 min.",
+        twitter_title=full_name,
+        twitter_description=f"🔥 SLEVA {discount}%! Pouze {price} Kč. Záruka 7 let, montáž za 10 min.",
+        extra=f'''    <meta property="product:price:amount" content="{price}">
+    <meta property="product:price:currency" content="CZK">
+    <meta property="product:availability" content="in stock">
+''',
+    )
+
+    sticky_bar = f'''<div id="stickyBar" class="sticky-bar fixed top-0 left-0 right-0 bg-white shadow-lg z-[60] py-3 border-b">
   <div class="container mx-auto px-4 flex items-center justify-between gap-4">
     <div class="flex items-center gap-4">
       <img src="{image}" alt="" class="w-12 h-12 object-contain bg-gray-100 rounded">
@@ -289,58 +115,9 @@ def generate_html(p):
   </div>
 </div>
 
-<!-- Top Bar -->
-<div class="bg-gray-900 text-white text-sm py-2">
-  <div class="container mx-auto px-4 flex justify-between items-center">
-    <div class="flex items-center gap-6">
-      <span>✉️ info@bazarovyregal.cz</span>
-    </div>
-    <div class="flex items-center gap-4">
-      <span>🚚 Doprava od 99 Kč</span>
-      <span>⭐ 4.9/5 (2847 recenzí)</span>
-    </div>
-  </div>
-</div>
-
-<!-- Header -->
-<header class="bg-white shadow-sm">
-  <div class="container mx-auto px-4 py-4 flex items-center justify-between">
-    <a href="index.html" class="flex items-center gap-2">
-      <div class="w-10 h-10 bg-primary-500 rounded-lg flex items-center justify-center">
-        <span class="text-white text-xl font-bold">🏭</span>
-      </div>
-      <div>
-        <div class="text-xl font-bold text-gray-900">Bazarovyregal<span class="text-primary-500">.cz</span></div>
-        <div class="text-xs text-red-600 font-medium">Největší slevy na regály</div>
-      </div>
-    </a>
-    <nav class="hidden md:flex gap-4 text-sm font-medium text-gray-600">
-      <a href="index.html" class="hover:text-primary-500">🏠 Úvod</a>
-      <a href="katalog.html" class="hover:text-primary-500">📦 Všechny regály</a>
-      <a href="o-nas.html" class="hover:text-primary-500">ℹ️ O nás</a>
-      <a href="faq.html" class="hover:text-primary-500">❓ FAQ</a>
-      <a href="kontakt.html" class="hover:text-primary-500">📧 Kontakt</a>
-    </nav>
-    <button class="flex items-center gap-2 bg-primary-500 text-white px-4 py-2 rounded-lg">
-      🛒 Košík <span class="bg-white text-primary-600 text-xs font-bold px-2 py-0.5 rounded-full">0</span>
-    </button>
-  </div>
-</header>
-
-<!-- Breadcrumb -->
-<nav class="bg-white border-b">
-  <div class="container mx-auto px-4 py-3 text-sm">
-    <ol class="flex items-center gap-2 text-gray-500">
-      <li><a href="index.html" class="hover:text-primary-500">Úvod</a></li>
-      <span>›</span>
-      <li><a href="katalog.html" class="hover:text-primary-500">Kovové regály</a></li>
-      <span>›</span>
-      <li class="text-gray-900 font-medium truncate max-w-xs">{name}</li>
-    </ol>
-  </div>
-</nav>
+'''
 
-<main class="container mx-auto px-4 py-8">
+    main = f'''<main class="container mx-auto px-4 py-8">
 
   <!-- Product Info -->
   <div class="grid lg:grid-cols-2 gap-8 lg:gap-12 mb-12">
@@ -861,67 +638,29 @@ def generate_html(p):
 
     # Add related products
     for rp in related[:4]:
-        rp_filename = get_filename(rp)
-        rp_name = f"Regál {rp['height']}×{rp['width']}×{rp['depth']} cm {color_czech_map.get(rp['color'], rp['color'].lower())}"
-        rp_discount = round((1 - rp['price'] / rp['priceOrig']) * 100)
-        html += f'''      <a href="{rp_filename}.html" class="product-card bg-white rounded-xl shadow-sm overflow-hidden group hover:shadow-lg transition-all block">
+        main += f'''      <a href="{rp.url}" class="product-card bg-white rounded-xl shadow-sm overflow-hidden group hover:shadow-lg transition-all block">
         <div class="relative">
-          <img src="{rp['image']}" alt="{rp_name}" class="product-image w-full p-4">
-          <span class="absolute top-3 left-3 bg-red-500 text-white text-xs font-bold px-2 py-1 rounded-full">-{rp_discount}%</span>
+          <img src="{rp.image}" alt="{rp.name}" class="product-image w-full p-4">
+          <span class="absolute top-3 left-3 bg-red-500 text-white text-xs font-bold px-2 py-1 rounded-full">-{rp.discount}%</span>
         </div>
         <div class="p-4">
-          <h3 class="font-medium text-sm mb-2 group-hover:text-primary-500">{rp_name}</h3>
+          <h3 class="font-medium text-sm mb-2 group-hover:text-primary-500">{rp.name}</h3>
           <div class="flex items-baseline gap-2">
-            <span class="text-xl font-bold text-primary-600">{rp['price']} Kč</span>
-            <span class="text-sm text-gray-400 line-through">{rp['priceOrig']} Kč</span>
+            <span class="text-xl font-bold text-primary-600">{rp.price} Kč</span>
+            <span class="text-sm text-gray-400 line-through">{rp.price_orig} Kč</span>
           </div>
         </div>
       </a>
 '''
 
-    html += f'''    </div>
+    main += '''    </div>
   </section>
 
 </main>
 
-<!-- Footer -->
-<footer class="bg-gray-900 text-white py-12 mt-12">
-  <div class="container mx-auto px-4">
-    <div class="grid md:grid-cols-4 gap-8 mb-8">
-      <div>
-        <div class="text-xl font-bold mb-4">Bazarovyregal<span class="text-primary-500">.cz</span></div>
-        <p class="text-gray-400 text-sm">Největší slevy na regály. Pouze nové a nerozbalené zboží.</p>
-      </div>
-      <div>
-        <h4 class="font-bold mb-4">Kategorie</h4>
-        <ul class="space-y-2 text-gray-400 text-sm">
-          <li><a href="regaly-do-garaze.html" class="hover:text-primary-400">Regály do garáže</a></li>
-          <li><a href="regaly-do-sklepa.html" class="hover:text-primary-400">Regály do sklepa</a></li>
-          <li><a href="zinkove-regaly.html" class="hover:text-primary-400">Zinkové regály</a></li>
-        </ul>
-      </div>
-      <div>
-        <h4 class="font-bold mb-4">Informace</h4>
-        <ul class="space-y-2 text-gray-400 text-sm">
-          <li><a href="o-nas.html" class="hover:text-primary-400">O nás</a></li>
-          <li><a href="faq.html" class="hover:text-primary-400">FAQ</a></li>
-          <li><a href="kontakt.html" class="hover:text-primary-400">Kontakt</a></li>
-        </ul>
-      </div>
-      <div>
-        <h4 class="font-bold mb-4">Kontakt</h4>
-        <ul class="space-y-2 text-gray-400 text-sm">
-          <li>✉️ info@bazarovyregal.cz</li>
-        </ul>
-      </div>
-    </div>
-    <div class="border-t border-gray-800 pt-8 text-center text-gray-500 text-sm">
-      © 2026 Bazarovyregal.cz - Shoptet.cz - Budujeme regálové impérium
-    </div>
-  </div>
-</footer>
+'''
 
-<script>
+    scripts = f'''<script>
 // Sticky bar
 window.addEventListener('scroll', () => {{
   const stickyBar = document.getElementById('stickyBar');
@@ -959,68 +698,44 @@ function toggleFaq(btn) {{
 }}
 </script>
 
-<!-- AI CHAT WIDGET -->
-<div id="chatWidget" class="fixed bottom-6 right-4 z-40">
-  <button onclick="toggleChat()" class="bg-primary-500 hover:bg-primary-600 text-white w-14 h-14 rounded-full shadow-lg flex items-center justify-center text-2xl transition-transform hover:scale-110">
-    💬
-  </button>
-
-  <div id="chatWindow" class="hidden absolute bottom-16 right-0 w-80 sm:w-96 bg-white rounded-2xl shadow-2xl overflow-hidden">
-    <div class="bg-gradient-to-r from-primary-500 to-orange-500 text-white p-4">
-      <div class="flex items-center justify-between">
-        <div class="flex items-center gap-3">
-          <div class="w-10 h-10 bg-white/20 rounded-full flex items-center justify-center">🤖</div>
-          <div>
-            <div class="font-bold">RegálBot</div>
-            <div class="text-xs text-white/80 flex items-center gap-1">
-              <span class="w-2 h-2 bg-green-400 rounded-full"></span> Online
-            </div>
-          </div>
-        </div>
-        <button onclick="toggleChat()" class="text-white/80 hover:text-white text-xl">✕</button>
-      </div>
-    </div>
-
-    <div id="chatMessages" class="h-80 overflow-y-auto p-4 space-y-4">
-      <div class="flex gap-3">
-        <div class="w-8 h-8 bg-primary-100 rounded-full flex items-center justify-center flex-shrink-0">🤖</div>
-        <div class="bg-gray-100 rounded-2xl rounded-tl-none p-3 text-sm max-w-[80%]">
-          Ahoj! 👋 Jsem RegálBot a pomohu vám vybrat ideální regál. Na co se chcete zeptat?
-        </div>
-      </div>
-    </div>
-
-    <div class="border-t p-4">
-      <div class="flex gap-2">
-        <input type="text" id="chatInput" placeholder="Napište zprávu..." class="flex-1 border rounded-lg px-3 py-2 text-sm focus:outline-none focus:border-primary-500" onkeypress="if(event.key==='Enter')sendMessage()">
-        <button onclick="sendMessage()" class="bg-primary-500 hover:bg-primary-600 text-white px-4 py-2 rounded-lg transition">➤</button>
-      </div>
-      <div class="flex flex-wrap gap-1 mt-2">
-        <button onclick="quickQuestion('Jaký regál do garáže?')" class="text-xs bg-gray-100 hover:bg-gray-200 px-2 py-1 rounded-full">🚗 Do garáže</button>
-        <button onclick="quickQuestion('Regál do vlhka?')" class="text-xs bg-gray-100 hover:bg-gray-200 px-2 py-1 rounded-full">💧 Do vlhka</button>
-        <button onclick="quickQuestion('Nejlevnější regál?')" class="text-xs bg-gray-100 hover:bg-gray-200 px-2 py-1 rounded-full">💰 Nejlevnější</button>
-      </div>
-    </div>
-  </div>
-</div>
-
-<script src="chatbot.js"></script>
-
-</body>
-</html>'''
-
-    return html
-
-# Generate all product pages
-output_dir = os.path.dirname(os.path.abspath(__file__))
-print(f"Generating product pages in: {output_dir}")
-
-for p in all_products:
-    filename = get_filename(p)
-    filepath = os.path.join(output_dir, f"{filename}.html")
-    html = generate_html(p)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html)
-    print(f"Generated: {filename}.html")
+'''
 
-print(f"\nDone! Generated {len(all_products)} product pages.")
+    return render_document(
+        "product",
+        head_meta=head,
+        head_extra=PRODUCT_STYLE,
+        body_top=sticky_bar,
+        breadcrumb=breadcrumb("Kovové regály", name),
+        main=main,
+        body_end=scripts,
+    )
+
+
+def main():
+    output_dir = os.path.dirname(os.path.abspath(__file__))
+    profiler = BuildProfiler("product_pages", enabled="--profile" in sys.argv)
+    writer = OutputWriter(output_dir, dry_run="--dry-run" in sys.argv, minify="--minify" in sys.argv)
+    print(f"Generating product pages in: {output_dir}")
+    if writer.dry_run:
+        print("DRY RUN: rendering in memory, nothing will be written")
+
+    for p in PRODUCTS:
+        filename = p.slug
+        start_us = now_us()
+        t0 = time.perf_counter()
+        html = generate_html(p).encode('utf-8')
+        t1 = time.perf_counter()
+        status = writer.write(f"{filename}.html", html)
+        profiler.record_page(filename, "products", t1 - t0, time.perf_counter() - t1, len(html), start_us)
+        print(f"Generated: {filename}.html ({status})")
+
+    print(f"products.json ({write_products_json(writer)})")
+    print(f"\nDone! Generated {len(PRODUCTS)} product pages.")
+    writer.minify_report()
+    if writer.dry_run:
+        writer.report("Product pages output")
+    profiler.write(output_dir, writer)
+
+
+if __name__ == "__main__":
+    main()
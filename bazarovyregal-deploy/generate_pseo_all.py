@@ -1,29 +1,48 @@
 #!/usr/bin/env python3
 """
 Master pSEO generator for Bazarovyregal.cz
-Combines all 12 playbook modules, generates HTML files, and updates sitemap.
+Combines all 12 registered playbooks (pseo_registry.py), generates HTML files, and updates sitemap.
+
+Usage:
+    python3 generate_pseo_all.py                 # full rebuild
+    python3 generate_pseo_all.py --incremental   # skip pages whose inputs are unchanged
+    python3 generate_pseo_all.py --jobs 8        # render in 8 processes (0 = all cores)
+    python3 generate_pseo_all.py --profile       # write pseo_build_profile.json + Chrome trace
+    python3 generate_pseo_all.py --only glossary,comparisons   # rebuild selected playbooks,
+                                                 # merge into the existing manifest/sitemap
+    python3 generate_pseo_all.py --dry-run       # render in memory, write nothing, report the diff
+    python3 generate_pseo_all.py --minify        # strip whitespace/comments from the HTML (also in the
+                                                 # SEO and product page generators)
 """
 
 import os
 import sys
 import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
 
-from pseo_config import BASE_URL, EXISTING_PAGES, PRODUCTS
-from pseo_html_template import wrap_page, build_schema_json
+from pseo_config import BASE_URL, EXISTING_PAGES, PRODUCTS, SITEMAP_SHARD_THRESHOLD
+from pseo_html_template import wrap_page, build_schema_json, LAYOUT_VERSION
 
-# Import all playbook generators
-from pseo_playbooks_part1 import generate_location_pages, generate_persona_pages, generate_glossary_pages
-from pseo_playbooks_part2 import generate_comparison_pages, generate_curation_pages, generate_template_pages
-from pseo_playbooks_part3 import generate_example_pages, generate_directory_pages, generate_profile_pages
-from pseo_playbooks_part4 import generate_conversion_pages, generate_translation_pages, generate_integration_pages
+from pseo_registry import PLAYBOOKS, select_playbooks
+from build_profiler import BuildProfiler, now_us
+from sitemap_writer import read_sitemap_records, write_sitemap
+from lastmod_store import LastmodStore
+from build_output import OutputWriter, write_output, minify_output
+from fragment_cache import print_cache_stats, clear_caches
+from pseo_link_graph import set_link_pages, link_targets
 
 
-def validate_pages(pages):
-    """Validate generated pages: no duplicate slugs, no thin content, minimum links."""
+def iter_valid_pages(pages, skipped):
+    """Stream-validate pages: no duplicate slugs, no thin content, required fields.
+
+    Yields valid pages one at a time and appends (slug, reason) for rejected
+    ones to skipped, so the page set never has to be held in memory.
+    """
     seen_slugs = set()
-    valid = []
-    skipped = []
 
     for p in pages:
         slug = p["slug"]
@@ -48,88 +67,269 @@ def validate_pages(pages):
             skipped.append((slug, "MISSING_FIELDS"))
             continue
 
-        valid.append(p)
+        yield p
+
 
+def validate_pages(pages):
+    """Validate generated pages: no duplicate slugs, no thin content, minimum links."""
+    skipped = []
+    valid = list(iter_valid_pages(pages, skipped))
     return valid, skipped
 
 
-def generate_html_files(pages, output_dir):
-    """Generate HTML files from page data with JSON-LD schema."""
-    generated = []
+def summarize_pages(pages, summaries):
+    """Pass pages through, keeping only the light fields the hub, report and manifest need."""
     for p in pages:
-        # Auto-generate schema markup
-        schema = build_schema_json(
-            slug=p["slug"],
-            title=p["title"],
-            meta_desc=p["meta_desc"],
-            h1=p["h1"],
-            breadcrumb_category=p.get("breadcrumb_category", "Regaly"),
-            playbook_type=p.get("playbook_type", ""),
-            products=PRODUCTS if p.get("playbook_type") == "conversions" else None,
-        )
-        html = wrap_page(
-            slug=p["slug"],
-            title=p["title"],
-            meta_desc=p["meta_desc"],
-            h1=p["h1"],
-            body_html=p["body_html"],
-            breadcrumb_category=p.get("breadcrumb_category", "Regaly"),
-            schema_json=schema,
-            canonical_url=p.get("canonical_url", ""),
-        )
-        filepath = os.path.join(output_dir, f"{p['slug']}.html")
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html)
-        generated.append(p["slug"])
-    return generated
-
-
-def update_sitemap(new_slugs, output_dir):
-    """Read existing sitemap, add new URLs, write updated sitemap."""
-    sitemap_path = os.path.join(output_dir, "sitemap.xml")
-    now = datetime.now().strftime("%Y-%m-%d")
-
-    # Read existing sitemap to get existing URLs
-    existing_urls = set()
-    if os.path.exists(sitemap_path):
-        with open(sitemap_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            import re
-            for m in re.finditer(r"<loc>(.*?)</loc>", content):
-                existing_urls.add(m.group(1))
-
-    # Build new sitemap
-    sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-
-    # Keep all existing URLs
-    for url in sorted(existing_urls):
-        sitemap += f"  <url>\n"
-        sitemap += f"    <loc>{url}</loc>\n"
-        sitemap += f"    <lastmod>{now}</lastmod>\n"
-        sitemap += f"    <changefreq>weekly</changefreq>\n"
-        sitemap += f"    <priority>0.7</priority>\n"
-        sitemap += f"  </url>\n"
-
-    # Add new pSEO URLs
-    added = 0
-    for slug in sorted(new_slugs):
-        url = f"{BASE_URL}/{slug}.html"
-        if url not in existing_urls:
-            sitemap += f"  <url>\n"
-            sitemap += f"    <loc>{url}</loc>\n"
-            sitemap += f"    <lastmod>{now}</lastmod>\n"
-            sitemap += f"    <changefreq>weekly</changefreq>\n"
-            sitemap += f"    <priority>0.7</priority>\n"
-            sitemap += f"  </url>\n"
-            added += 1
-
-    sitemap += "</urlset>\n"
-
-    with open(sitemap_path, "w", encoding="utf-8") as f:
-        f.write(sitemap)
-
-    return len(existing_urls), added
+        summaries.append({
+            "slug": p["slug"],
+            "playbook_type": p.get("playbook_type", ""),
+            "title": p["title"],
+            "h1": p["h1"],
+        })
+        yield p
+
+
+def collect_summaries(playbooks, skipped):
+    """Summaries of the valid pages of playbooks, generated without internal links.
+
+    Only needed when no earlier manifest records the page set (see
+    persisted_links()). Links only add words, so every page valid here is
+    valid with its links.
+    """
+    set_link_pages(None)
+    summaries = []
+    pages = (page for pb in playbooks for page in pb["generator"]())
+    for _ in summarize_pages(iter_valid_pages(pages, skipped), summaries):
+        pass
+    return summaries
+
+
+def page_hash(page, schema, minify=False):
+    """Hash every input of a rendered page: page data, layout version, JSON-LD and minification."""
+    h = hashlib.sha256()
+    h.update(LAYOUT_VERSION.encode("utf-8"))
+    h.update(b"minify" if minify else b"plain")
+    h.update(json.dumps(page, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    h.update(schema.encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_manifest(output_dir):
+    """Load the previous pseo_manifest.json (empty dict if missing or unreadable)."""
+    manifest_path = os.path.join(output_dir, "pseo_manifest.json")
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def persisted_links(manifest):
+    """(summaries, neighbour lists) of the pages of the previous build, as stored in pseo_manifest.json.
+
+    Summaries are empty without a (complete) manifest; neighbour lists are None
+    when the manifest predates them.
+    """
+    entries = manifest.get("pages", [])
+    if not entries or not all("h1" in e for e in entries):
+        return [], None
+    summaries = [{"slug": e["slug"], "playbook_type": e["type"], "title": e["title"], "h1": e["h1"]}
+                 for e in entries]
+    if not all("links" in e for e in entries):
+        return summaries, None
+    return summaries, {e["slug"]: [tuple(link) for link in e["links"]] for e in entries}
+
+
+def _link_key(summary):
+    """The summary fields a link to the page is built from."""
+    return summary["slug"], summary["playbook_type"], summary["title"], summary["h1"]
+
+
+def final_links(summaries, site):
+    """Neighbour lists of every page in summaries; the link graph is rebuilt only if they differ from site."""
+    if [_link_key(s) for s in summaries] != [_link_key(s) for s in site]:
+        set_link_pages(summaries)
+    return {s["slug"]: link_targets(s["slug"]) for s in summaries}
+
+
+def merge_records(writer, rewrites):
+    """Fold the records of a second render pass into writer, keeping one record per file.
+
+    The first record holds the size on disk before the build; in a real run
+    its created/changed status stands, since the first pass already wrote the file.
+    """
+    index = {record[0]: i for i, record in enumerate(writer.records)}
+    for record in rewrites.records:
+        filename, status, _, new_size = record
+        if filename not in index:
+            writer.records.append(record)
+            continue
+        _, first_status, old_size, _ = writer.records[index[filename]]
+        if not writer.dry_run and first_status in ("created", "changed"):
+            status = first_status
+        writer.records[index[filename]] = (filename, status, old_size, new_size)
+    writer.saved.update(rewrites.saved)
+
+
+def previous_page_hashes(manifest):
+    """Map slug -> content hash from a previous manifest."""
+    return {p["slug"]: p["hash"] for p in manifest.get("pages", []) if p.get("hash")}
+
+
+def render_page(p, output_dir, previous_hash=None, dry_run=False, minify=False):
+    """Render and write one page. Returns (slug, hash, output record, timing stats).
+
+    The output record is (filename, status, old_size, new_size) as kept by
+    OutputWriter; stats["saved"] is the number of bytes removed by minify.
+    Module-level so it can run in a worker process.
+    """
+    start_us = now_us()
+    t0 = time.perf_counter()
+    # Auto-generate schema markup
+    schema = build_schema_json(
+        slug=p["slug"],
+        title=p["title"],
+        meta_desc=p["meta_desc"],
+        h1=p["h1"],
+        breadcrumb_category=p.get("breadcrumb_category", "Regaly"),
+        playbook_type=p.get("playbook_type", ""),
+        products=PRODUCTS if p.get("playbook_type") == "conversions" else None,
+    )
+    digest = page_hash(p, schema, minify)
+    stats = {"start_us": start_us, "pid": os.getpid(), "render_seconds": 0.0, "write_seconds": 0.0, "bytes": 0,
+             "saved": 0}
+
+    filename = f"{p['slug']}.html"
+    filepath = os.path.join(output_dir, filename)
+    if previous_hash == digest and os.path.exists(filepath):
+        stats["render_seconds"] = time.perf_counter() - t0
+        size = os.path.getsize(filepath)
+        return p["slug"], digest, (filename, "unchanged", size, size), stats
+
+    html = wrap_page(
+        slug=p["slug"],
+        title=p["title"],
+        meta_desc=p["meta_desc"],
+        h1=p["h1"],
+        body_html=p["body_html"],
+        breadcrumb_category=p.get("breadcrumb_category", "Regaly"),
+        schema_json=schema,
+        canonical_url=p.get("canonical_url", ""),
+    ).encode("utf-8")
+    if minify:
+        html, stats["saved"] = minify_output(filename, html)
+    t1 = time.perf_counter()
+    status, old_size, new_size = write_output(filepath, html, dry_run)
+    stats.update(render_seconds=t1 - t0, write_seconds=time.perf_counter() - t1, bytes=len(html))
+    return p["slug"], digest, (filename, status, old_size, new_size), stats
+
+
+def generate_html_files(pages, output_dir, previous_hashes=None, jobs=1, batch_size=64, profiler=None,
+                        writer=None):
+    """Generate HTML files from page data with JSON-LD schema.
+
+    pages may be any iterable (including a generator); it is consumed in
+    batches so only batch_size pages per worker are in memory at a time.
+    When previous_hashes is given (incremental mode), pages whose input hash
+    matches and whose file still exists are neither rendered nor written.
+    With jobs > 1 pages are rendered in a process pool; results keep page order.
+    Every output is recorded in writer (an OutputWriter, which writes nothing in dry-run mode).
+    Returns (generated slugs, created/changed slugs, slug -> hash).
+    """
+    previous_hashes = previous_hashes or {}
+    profiler = profiler or BuildProfiler("pseo")
+    writer = writer or OutputWriter(output_dir)
+    generated = []
+    written = []
+    hashes = {}
+    playbook_of = {}
+
+    def collect(results):
+        for slug, digest, output, stats in results:
+            generated.append(slug)
+            hashes[slug] = digest
+            if writer.record(*output, saved=stats["saved"]) in ("created", "changed"):
+                written.append(slug)
+            profiler.record_page(slug, playbook_of.pop(slug, None), stats["render_seconds"],
+                                 stats["write_seconds"], stats["bytes"], stats["start_us"], stats["pid"])
+
+    pages = iter(pages)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            while True:
+                batch = list(islice(pages, batch_size * jobs))
+                if not batch:
+                    break
+                playbook_of.update((p["slug"], p.get("playbook_type")) for p in batch)
+                collect(pool.map(
+                    render_page,
+                    batch,
+                    [output_dir] * len(batch),
+                    [previous_hashes.get(p["slug"]) for p in batch],
+                    [writer.dry_run] * len(batch),
+                    [writer.minify] * len(batch),
+                    chunksize=batch_size,
+                ))
+    else:
+        for p in pages:
+            playbook_of[p["slug"]] = p.get("playbook_type")
+            collect([render_page(p, output_dir, previous_hashes.get(p["slug"]), writer.dry_run, writer.minify)])
+
+    return generated, written, hashes
+
+
+def _parse_jobs(argv):
+    """Read --jobs N from argv (0 = all cores, default 1)."""
+    if "--jobs" not in argv:
+        return 1
+    idx = argv.index("--jobs")
+    if idx + 1 >= len(argv) or not argv[idx + 1].isdigit():
+        sys.exit("--jobs expects a number (0 = all cores)")
+    jobs = int(argv[idx + 1])
+    return jobs or os.cpu_count() or 1
+
+
+def update_sitemap(new_slugs, output_dir, shard_threshold=SITEMAP_SHARD_THRESHOLD, writer=None):
+    """Merge new pSEO URLs into the existing sitemap and write it in a single streamed pass.
+
+    lastmod comes from the LastmodStore and only advances when a page's bytes change.
+    """
+    lastmods = LastmodStore(output_dir)
+
+    # Read existing sitemap (plain or sharded) to get existing URLs
+    existing = {r["loc"]: r for r in read_sitemap_records(output_dir)}
+    new_urls = sorted({f"{BASE_URL}/{slug}.html" for slug in new_slugs} - existing.keys())
+
+    def records():
+        # Keep all existing URLs, then add new pSEO URLs
+        for url in sorted(existing):
+            r = existing[url]
+            yield {"loc": url, "lastmod": lastmods.lastmod_for(url, BASE_URL, output_dir, r.get("lastmod")),
+                   "changefreq": r.get("changefreq", "weekly"), "priority": r.get("priority", "0.7")}
+        for url in new_urls:
+            yield {"loc": url, "lastmod": lastmods.lastmod_for(url, BASE_URL, output_dir),
+                   "changefreq": "weekly", "priority": "0.7"}
+
+    result = write_sitemap(records(), output_dir, BASE_URL, shard_threshold=shard_threshold, writer=writer)
+    lastmods.save(writer)
+    if len(result["files"]) > 1:
+        print(f"  Sharded into {len(result['files']) - 1} gzipped sitemap(s)")
+    print(f"  lastmod advanced for {lastmods.changed} URL(s)")
+    return len(existing), len(new_urls)
+
+
+def is_content_output(filename):
+    """Pages, sitemaps and robots.txt: what crawlers see (state files, manifests and profiles are not content)."""
+    if filename == "robots.txt" or filename.endswith(".html"):
+        return True
+    return filename.startswith("sitemap") and filename.endswith((".xml", ".xml.gz"))
+
+
+def content_written(records):
+    """Whether OutputWriter records include a created, changed or deleted content output."""
+    return any(status != "unchanged" and is_content_output(filename) for filename, status, _, _ in records)
 
 
 def generate_report(valid, skipped, generated, existing_count, added_count):
@@ -163,8 +363,11 @@ def generate_report(valid, skipped, generated, existing_count, added_count):
     print("\n" + "=" * 60)
 
 
-def _generate_hub_page(valid_pages, output_dir):
-    """Generate vsechny-regaly.html - a hub page linking to all pSEO pages for crawling."""
+def _generate_hub_page(valid_pages, output_dir, previous_hash=None, writer=None):
+    """Generate vsechny-regaly.html - a hub page linking to all pSEO pages for crawling.
+
+    Returns the hub input hash; the file is not rewritten when it matches previous_hash.
+    """
     # Group pages by playbook type
     by_type = {}
     type_labels = {
@@ -226,6 +429,14 @@ def _generate_hub_page(valid_pages, output_dir):
         playbook_type="directory",
     )
 
+    writer = writer or OutputWriter(output_dir)
+    hub_page = {"slug": "vsechny-regaly", "body_html": body_html}
+    digest = page_hash(hub_page, schema, writer.minify)
+    filepath = os.path.join(output_dir, "vsechny-regaly.html")
+    if previous_hash == digest and os.path.exists(filepath):
+        print("  Unchanged: vsechny-regaly.html")
+        return digest
+
     html = wrap_page(
         slug="vsechny-regaly",
         title="Všechny regály – kompletní přehled | Bazarovyregal.cz",
@@ -234,123 +445,188 @@ def _generate_hub_page(valid_pages, output_dir):
         body_html=body_html,
         breadcrumb_category="Přehled",
         schema_json=schema,
+        family="catalog",
     )
 
-    filepath = os.path.join(output_dir, "vsechny-regaly.html")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(html)
-    print("  Written: vsechny-regaly.html")
+    print(f"  {writer.write('vsechny-regaly.html', html).capitalize()}: vsechny-regaly.html")
+    return digest
+
+
+def iter_playbook_pages(playbooks=PLAYBOOKS, profiler=None):
+    """Lazily chain the pages of the given registry playbooks, printing per-playbook counts."""
+    profiler = profiler or BuildProfiler("pseo")
+    for i, pb in enumerate(playbooks, 1):
+        print(f"[{i}/{len(playbooks)}] Generating {pb['label']} pages...")
+        count = 0
+        for page in profiler.timed(pb["generator"](), "generate", pb["name"]):
+            count += 1
+            yield page
+        print(f"        -> {count} pages")
+
+
+def _parse_only(argv):
+    """Read --only name1,name2 from argv (empty list = all playbooks)."""
+    if "--only" not in argv:
+        return []
+    idx = argv.index("--only")
+    if idx + 1 >= len(argv):
+        sys.exit("--only expects a comma separated list of playbook names")
+    return [n.strip() for n in argv[idx + 1].split(",") if n.strip()]
+
+
+def merge_summaries(previous_manifest, summaries, rebuilt_names):
+    """Combine fresh summaries of rebuilt playbooks with the previous manifest entries of the rest.
+
+    Keeps registry order so the manifest, hub and sitemap stay deterministic.
+    """
+    by_type = {}
+    for entry in previous_manifest.get("pages", []):
+        if entry.get("type") not in rebuilt_names:
+            by_type.setdefault(entry["type"], []).append({
+                "slug": entry["slug"],
+                "playbook_type": entry["type"],
+                "title": entry["title"],
+                "h1": entry["h1"],
+                "hash": entry.get("hash"),
+            })
+    for summary in summaries:
+        by_type.setdefault(summary["playbook_type"], []).append(summary)
+    return [s for pb in PLAYBOOKS for s in by_type.get(pb["name"], [])]
 
 
 def main():
     output_dir = os.path.dirname(os.path.abspath(__file__))
+    incremental = "--incremental" in sys.argv
+    writer = OutputWriter(output_dir, dry_run="--dry-run" in sys.argv, minify="--minify" in sys.argv)
+    jobs = _parse_jobs(sys.argv)
+    profiler = BuildProfiler("pseo", enabled="--profile" in sys.argv)
+    try:
+        playbooks = select_playbooks(_parse_only(sys.argv))
+    except ValueError as e:
+        sys.exit(str(e))
 
     print("Generating pSEO pages for Bazarovyregal.cz...")
+    if writer.dry_run:
+        print("DRY RUN: rendering in memory, nothing will be written")
     print("=" * 50)
 
-    # Collect all pages from all playbooks
-    all_pages = []
-
-    print("\n[1/12] Generating Location pages...")
-    pages = generate_location_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[2/12] Generating Persona pages...")
-    pages = generate_persona_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[3/12] Generating Glossary pages...")
-    pages = generate_glossary_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[4/12] Generating Comparison pages...")
-    pages = generate_comparison_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[5/12] Generating Curation pages...")
-    pages = generate_curation_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[6/12] Generating Template pages...")
-    pages = generate_template_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[7/12] Generating Example pages...")
-    pages = generate_example_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[8/12] Generating Directory pages...")
-    pages = generate_directory_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[9/12] Generating Profile pages...")
-    pages = generate_profile_pages()
-    print(f"       -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[10/12] Generating Conversion pages...")
-    pages = generate_conversion_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[11/12] Generating Translation pages...")
-    pages = generate_translation_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print("[12/12] Generating Integration pages...")
-    pages = generate_integration_pages()
-    print(f"        -> {len(pages)} pages")
-    all_pages.extend(pages)
-
-    print(f"\nTotal raw pages: {len(all_pages)}")
-
-    # Validate
-    print("\nValidating pages...")
-    valid, skipped = validate_pages(all_pages)
-    print(f"  Valid: {len(valid)}, Skipped: {len(skipped)}")
-
-    # Generate HTML files
-    print("\nGenerating HTML files...")
-    generated = generate_html_files(valid, output_dir)
-    print(f"  Written: {len(generated)} files")
-
-    # Update sitemap
-    print("\nUpdating sitemap.xml...")
-    existing_count, added_count = update_sitemap(generated, output_dir)
+    previous_manifest = load_manifest(output_dir)
+    layout_changed = previous_manifest.get("layout_version") != LAYOUT_VERSION
+
+    # Selective rebuild: playbooks without complete manifest entries must be rebuilt too
+    if len(playbooks) < len(PLAYBOOKS):
+        known = {}
+        for entry in previous_manifest.get("pages", []):
+            known.setdefault(entry.get("type"), []).append(entry)
+        missing = [pb["name"] for pb in PLAYBOOKS
+                   if pb not in playbooks and (pb["name"] not in known or not all("h1" in e for e in known[pb["name"]]))]
+        if missing:
+            print(f"No manifest entries for: {', '.join(missing)} - rebuilding them too")
+            playbooks = select_playbooks([pb["name"] for pb in playbooks] + missing)
+        print(f"Selective rebuild: {', '.join(pb['name'] for pb in playbooks)}")
+
+    # Incremental mode compares page input hashes against the previous manifest
+    previous_hashes = None
+    if incremental and not layout_changed:
+        previous_hashes = previous_page_hashes(previous_manifest)
+        print(f"Incremental build ({len(previous_hashes)} cached page hashes)")
+
+    # Link graph: page summaries and neighbour lists of the previous build, read back from the manifest.
+    # Only without them (first build) is the page set collected in an extra generation pass.
+    skipped = []
+    site, neighbours = persisted_links(previous_manifest)
+    with profiler.stage("link_graph"):
+        if not site:
+            site = collect_summaries(PLAYBOOKS, [])
+            # Cache stats cover the render pass only, measured as in builds without this pass
+            clear_caches()
+        set_link_pages(site, neighbours)
+    rendered_links = dict(neighbours or {})
+
+    # Stream pages: playbooks -> validate -> render -> write, one page at a time
+    summaries = []
+    valid_pages = summarize_pages(
+        profiler.timed(iter_valid_pages(iter_playbook_pages(playbooks, profiler), skipped), "validate"),
+        summaries,
+    )
 
-    # Report
-    generate_report(valid, skipped, generated, existing_count, added_count)
+    print(f"\nGenerating HTML files ({jobs} job{'s' if jobs > 1 else ''}, streaming)...")
+    with profiler.stage("pipeline", parent=True):
+        generated, written, hashes = generate_html_files(
+            valid_pages, output_dir, previous_hashes, jobs, profiler=profiler, writer=writer
+        )
+    print(f"\nValid: {len(generated)}, Skipped: {len(skipped)}")
+    print(f"  {'Would write' if writer.dry_run else 'Written'}: {len(written)} files, "
+          f"unchanged: {len(generated) - len(written)}")
+
+    for summary in summaries:
+        summary["hash"] = hashes[summary["slug"]]
+        rendered_links[summary["slug"]] = link_targets(summary["slug"])
+    summaries = merge_summaries(previous_manifest, summaries, {pb["name"] for pb in playbooks})
+    generated = [s["slug"] for s in summaries]
+    selective = len(playbooks) < len(PLAYBOOKS)
+
+    # A page added, removed or retitled changes the links of the pages around it: those pages are
+    # rendered again with the final link graph, also in playbooks this build did not select
+    with profiler.stage("link_graph"):
+        links = final_links(summaries, site)
+    stale = [s for s in summaries if rendered_links.get(s["slug"]) != links[s["slug"]]]
+    if stale:
+        stale_slugs = {s["slug"] for s in stale}
+        print(f"\nRelinking {len(stale)} page(s) whose internal links changed...")
+        relink_writer = OutputWriter(output_dir, dry_run=writer.dry_run, minify=writer.minify)
+        relink_playbooks = select_playbooks([s["playbook_type"] for s in stale])
+        with profiler.stage("pipeline", parent=True):
+            _, _, relinked = generate_html_files(
+                (p for p in iter_playbook_pages(relink_playbooks, profiler) if p["slug"] in stale_slugs),
+                output_dir, None, jobs, profiler=profiler, writer=relink_writer,
+            )
+        merge_records(writer, relink_writer)
+        for summary in summaries:
+            summary["hash"] = relinked.get(summary["slug"], summary["hash"])
 
     # Generate hub page (vsechny-regaly) for crawling/indexing
     print("\nGenerating hub page (vsechny-regaly.html)...")
-    _generate_hub_page(valid, output_dir)
-    # Add hub page to sitemap
-    _, hub_added = update_sitemap(generated + ["vsechny-regaly"], output_dir)
-    if hub_added:
-        print(f"  Added {hub_added} hub URL(s) to sitemap")
+    # The hub only lists slugs and headings, so it is skipped when those did not change
+    reuse_hub = (incremental or selective) and not layout_changed
+    with profiler.stage("hub"):
+        hub_hash = _generate_hub_page(summaries, output_dir, previous_manifest.get("hub_hash") if reuse_hub else None,
+                                      writer)
+
+    # Update sitemap once with all pSEO pages plus the hub
+    print("\nUpdating sitemap.xml...")
+    with profiler.stage("sitemap"):
+        existing_count, added_count = update_sitemap(generated + ["vsechny-regaly"], output_dir, writer=writer)
 
-    # Write manifest JSON for tracking
+    # Report
+    generate_report(summaries, skipped, generated, existing_count, added_count)
+    print_cache_stats()
+
+    # Write manifest JSON for tracking; generated_at only advances when this build changed a page,
+    # sitemap or robots.txt, so a build without content changes leaves the manifest untouched
+    generated_at = previous_manifest.get("generated_at")
+    if not generated_at or content_written(writer.records):
+        generated_at = datetime.now().isoformat()
     manifest = {
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at,
         "total_pages": len(generated),
+        "layout_version": LAYOUT_VERSION,
+        "hub_hash": hub_hash,
         "pages": [
-            {"slug": p["slug"], "type": p.get("playbook_type", ""), "title": p["title"]}
-            for p in valid
+            {"slug": p["slug"], "type": p["playbook_type"], "title": p["title"], "h1": p["h1"], "hash": p["hash"],
+             "links": links[p["slug"]]}
+            for p in summaries
         ],
     }
-    manifest_path = os.path.join(output_dir, "pseo_manifest.json")
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
-    print(f"\nManifest written to: pseo_manifest.json")
+    with profiler.stage("manifest"):
+        writer.write("pseo_manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+    writer.minify_report()
+    if writer.dry_run:
+        writer.report("pSEO output")
+    else:
+        print(f"\nManifest written to: pseo_manifest.json")
+
+    profiler.write(output_dir, writer)
 
 
 if __name__ == "__main__":
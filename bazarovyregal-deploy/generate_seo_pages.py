@@ -5,35 +5,25 @@ With internal linking, OpenGraph tags, and product links
 """
 
 import os
+import sys
 import json
-from datetime import datetime
+import time
+
+from build_profiler import BuildProfiler, now_us
+from sitemap_writer import write_sitemap
+from lastmod_store import LastmodStore
+from build_output import OutputWriter
+from page_layout import render_document, head_meta, breadcrumb, article_main
+from fragment_cache import cached_fragment, print_cache_stats
+from catalog import IMAGES, CatalogIndex, featured_products
+from pseo_config import SITEMAP_SHARD_THRESHOLD
 
 # Base URL
 BASE_URL = "https://bazarovyregal.vercel.app"
 
-# Product images for visual content (correct URLs without _cache typos)
-IMAGES = {
-    "black": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg",
-    "white": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg",
-    "red": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/9/e/9eef5f9f2ad8880b75926a3eae58485b-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny-pravy-15070304700red1.jpeg",
-    "blue": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/1/c/1c64831c1231f5847cf9e7a36f6cdf6f-1-15070304700blue1.jpeg",
-    "zinc": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg",
-    "pro": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/b/1/b17ce5b491bdb73a0df3160b51fbcf7e-1-regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-1050-kg-modro-oranzovy-pravy-18120501050orangeblue1.jpeg"
-}
-
-# Featured products for linking
-PRODUCTS = [
-    {"name": "Regál 150×70×30 cm černý", "price": 599, "url": "regal-150x70x30-cerna.html", "img": IMAGES["black"]},
-    {"name": "Regál 150×70×30 cm zinkovaný", "price": 549, "url": "regal-150x70x30-zinkovany.html", "img": IMAGES["zinc"]},
-    {"name": "Regál 180×90×40 cm černý", "price": 739, "url": "regal-180x90x40-cerna.html", "img": IMAGES["black"], "bestseller": True},
-    {"name": "Regál 180×90×40 cm zinkovaný", "price": 649, "url": "regal-180x90x40-zinkovany.html", "img": IMAGES["zinc"]},
-    {"name": "Regál 180×90×40 cm bílý", "price": 739, "url": "regal-180x90x40-bila.html", "img": IMAGES["white"]},
-    {"name": "Regál 180×90×40 cm červený", "price": 759, "url": "regal-180x90x40-cervena.html", "img": IMAGES["red"]},
-    {"name": "Regál 180×90×40 cm modrý", "price": 759, "url": "regal-180x90x40-modra.html", "img": IMAGES["blue"]},
-    {"name": "Regál 200×90×40 cm černý", "price": 849, "url": "regal-200x90x40-cerna.html", "img": IMAGES["black"]},
-    {"name": "Regál 180×120×50 cm profesionální", "price": 1249, "url": "regal-180x120x50-profesionalni.html", "img": IMAGES["pro"]},
-    {"name": "Regál 180×40×40 cm zinkovaný", "price": 579, "url": "regal-180x40x40-zinkovany.html", "img": IMAGES["zinc"]},
-]
+# Featured products for linking (product data lives in catalog.py)
+PRODUCTS = featured_products()
+FEATURED_INDEX = CatalogIndex(PRODUCTS)
 
 # SEO Pages structure
 SEO_PAGES = [
@@ -778,32 +768,31 @@ def get_related_products(category, count=4):
     """Get related products based on category"""
     if category in ["sklep", "zink"]:
         # Prefer zinc products for cellar
-        prods = [p for p in PRODUCTS if "zink" in p["url"]]
-        prods += [p for p in PRODUCTS if "zink" not in p["url"]]
+        prods = FEATURED_INDEX.prefer("color", "zinkovany")
     elif category == "garaz":
         # Prefer black products for garage
-        prods = [p for p in PRODUCTS if "cerna" in p["url"]]
-        prods += [p for p in PRODUCTS if "cerna" not in p["url"]]
+        prods = FEATURED_INDEX.prefer("color", "cerna")
     else:
         prods = PRODUCTS.copy()
     return prods[:count]
 
+@cached_fragment("seo_product_cards",
+                 key=lambda products: tuple((p.url, p.image, p.name, p.price, p.price_orig, p.discount) for p in products))
 def generate_product_cards(products):
     """Generate HTML for product cards"""
     html = '<div class="grid sm:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">'
     for p in products:
-        discount = 75 if p.get("bestseller") else 70
         html += f'''
-        <a href="{p['url']}" class="bg-white rounded-xl shadow-sm overflow-hidden hover:shadow-lg transition-shadow group">
+        <a href="{p.url}" class="bg-white rounded-xl shadow-sm overflow-hidden hover:shadow-lg transition-shadow group">
             <div class="relative">
-                <img src="{p['img']}" alt="{p['name']}" class="w-full aspect-square object-contain p-4 bg-gray-50">
-                <span class="absolute top-2 left-2 bg-red-500 text-white text-xs font-bold px-2 py-1 rounded">-{discount}%</span>
+                <img src="{p.image}" alt="{p.name}" class="w-full aspect-square object-contain p-4 bg-gray-50">
+                <span class="absolute top-2 left-2 bg-red-500 text-white text-xs font-bold px-2 py-1 rounded">-{p.discount}%</span>
             </div>
             <div class="p-4">
-                <h3 class="font-medium text-sm group-hover:text-primary-500 mb-2">{p['name']}</h3>
+                <h3 class="font-medium text-sm group-hover:text-primary-500 mb-2">{p.name}</h3>
                 <div class="flex items-baseline gap-2">
-                    <span class="text-xl font-bold text-primary-600">{p['price']} Kč</span>
-                    <span class="text-sm text-gray-400 line-through">{p['price'] * 4} Kč</span>
+                    <span class="text-xl font-bold text-primary-600">{p.price} Kč</span>
+                    <span class="text-sm text-gray-400 line-through">{p.price_orig} Kč</span>
                 </div>
                 <div class="text-xs text-green-600 mt-1">✓ Skladem</div>
             </div>
@@ -812,6 +801,7 @@ def generate_product_cards(products):
     html += '</div>'
     return html
 
+@cached_fragment("related_links", key=lambda pages: tuple((p["slug"], p["h1"], p["description"]) for p in pages))
 def generate_related_links(pages):
     """Generate HTML for related page links"""
     html = '<div class="grid sm:grid-cols-2 lg:grid-cols-3 gap-4">'
@@ -873,205 +863,21 @@ def generate_page_html(page):
     }
 
     category_name = category_names.get(page["category"], "Regály")
-    og_image = IMAGES["black"]
-
-    html = f'''<!DOCTYPE html>
-<html lang="cs">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{page['title']}</title>
-    <meta name="description" content="{page['description']}">
-
-    <!-- OpenGraph -->
-    <meta property="og:title" content="{page['title']}">
-    <meta property="og:description" content="{page['description']}">
-    <meta property="og:image" content="{og_image}">
-    <meta property="og:url" content="{BASE_URL}/{page['slug']}.html">
-    <meta property="og:type" content="article">
-    <meta property="og:site_name" content="Bazarovyregal.cz">
-    <meta property="og:locale" content="cs_CZ">
-
-    <!-- Twitter Card -->
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{page['title']}">
-    <meta name="twitter:description" content="{page['description']}">
-    <meta name="twitter:image" content="{og_image}">
-
-    <!-- Canonical -->
-    <link rel="canonical" href="{BASE_URL}/{page['slug']}.html">
-
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
-    <script>
-        tailwind.config = {{
-            theme: {{
-                extend: {{
-                    fontFamily: {{ sans: ['Inter', 'sans-serif'] }},
-                    colors: {{
-                        primary: {{ 50: '#fff7ed', 100: '#ffedd5', 200: '#fed7aa', 300: '#fdba74', 400: '#fb923c', 500: '#f97316', 600: '#ea580c', 700: '#c2410c', 800: '#9a3412', 900: '#7c2d12' }}
-                    }}
-                }}
-            }}
-        }}
-    </script>
-</head>
-<body class="bg-gray-50 font-sans">
-
-<!-- Top Bar -->
-<div class="bg-gray-900 text-white text-sm py-2">
-    <div class="container mx-auto px-4 flex justify-between items-center">
-        <span>✉️ info@bazarovyregal.cz</span>
-        <div class="flex items-center gap-4">
-            <span>🚚 Doprava od 99 Kč</span>
-            <span>⭐ 4.9/5 (2847 recenzí)</span>
-        </div>
-    </div>
-</div>
-
-<!-- Header -->
-<header class="bg-white shadow-sm sticky top-0 z-50">
-    <div class="container mx-auto px-4 py-4 flex items-center justify-between">
-        <a href="index.html" class="flex items-center gap-3">
-            <div class="w-12 h-12 bg-primary-500 rounded-xl flex items-center justify-center shadow-lg">
-                <span class="text-white text-3xl font-black">B</span>
-            </div>
-            <div>
-                <div class="text-2xl font-black text-gray-900">Bazarovyregal<span class="text-primary-500">.cz</span></div>
-                <div class="text-xs text-red-600 font-bold uppercase">Likvidace skladu</div>
-            </div>
-        </a>
-        <nav class="hidden md:flex gap-4 text-sm font-medium">
-            <a href="index.html" class="text-gray-600 hover:text-primary-500">🏠 Úvod</a>
-            <a href="katalog.html" class="text-gray-600 hover:text-primary-500">📦 Katalog</a>
-            <a href="likvidace-skladu-regaly.html" class="text-gray-600 hover:text-primary-500">🔥 Likvidace</a>
-            <a href="kontakt.html" class="text-gray-600 hover:text-primary-500">📧 Kontakt</a>
-        </nav>
-        <a href="katalog.html" class="bg-primary-500 hover:bg-primary-600 text-white px-5 py-2 rounded-lg font-bold">
-            🛒 Katalog
-        </a>
-    </div>
-</header>
-
-<!-- Breadcrumb -->
-<nav class="bg-white border-b">
-    <div class="container mx-auto px-4 py-3">
-        <ol class="flex items-center gap-2 text-sm text-gray-500">
-            <li><a href="index.html" class="hover:text-primary-500">Úvod</a></li>
-            <span>›</span>
-            <li><a href="katalog.html" class="hover:text-primary-500">{category_name}</a></li>
-            <span>›</span>
-            <li class="text-gray-900 font-medium truncate max-w-xs">{page['h1']}</li>
-        </ol>
-    </div>
-</nav>
-
-<!-- Main Content -->
-<main class="container mx-auto px-4 py-8">
-    <article class="max-w-4xl mx-auto">
-        <h1 class="text-3xl md:text-4xl font-bold text-gray-900 mb-6">{page['h1']}</h1>
-
-        <div class="prose prose-lg max-w-none">
-            {content}
-        </div>
-
-        <!-- CTA Section -->
-        <div class="bg-gradient-to-r from-primary-500 to-orange-500 rounded-2xl p-8 mt-12 text-white text-center">
-            <h2 class="text-2xl font-bold mb-2">Připraveni nakoupit?</h2>
-            <p class="mb-6 text-white/90">Prohlédněte si náš kompletní katalog regálů se slevami až 75%</p>
-            <a href="katalog.html" class="inline-block bg-white text-primary-600 px-8 py-3 rounded-xl font-bold hover:bg-gray-100 transition">
-                Zobrazit katalog →
-            </a>
-        </div>
-    </article>
-</main>
-
-<!-- Footer -->
-<footer class="bg-gray-900 text-white py-12 mt-12">
-    <div class="container mx-auto px-4">
-        <div class="grid md:grid-cols-4 gap-8 mb-8">
-            <div>
-                <div class="text-xl font-bold mb-4">Bazarovyregal<span class="text-primary-500">.cz</span></div>
-                <p class="text-gray-400 text-sm">Největší slevy na kovové regály. Likvidace skladu - nové zboží za ceny bazaru.</p>
-            </div>
-            <div>
-                <h4 class="font-bold mb-4">Kategorie</h4>
-                <ul class="space-y-2 text-gray-400 text-sm">
-                    <li><a href="likvidace-skladu-regaly.html" class="hover:text-primary-400">Likvidace skladu</a></li>
-                    <li><a href="bazarove-regaly.html" class="hover:text-primary-400">Bazarové regály</a></li>
-                    <li><a href="slevy-na-regaly.html" class="hover:text-primary-400">Slevy na regály</a></li>
-                    <li><a href="regaly-do-garaze.html" class="hover:text-primary-400">Regály do garáže</a></li>
-                </ul>
-            </div>
-            <div>
-                <h4 class="font-bold mb-4">Informace</h4>
-                <ul class="space-y-2 text-gray-400 text-sm">
-                    <li><a href="montaz-regalu.html" class="hover:text-primary-400">Montáž regálu</a></li>
-                    <li><a href="nosnost-regalu.html" class="hover:text-primary-400">Nosnost regálů</a></li>
-                    <li><a href="faq.html" class="hover:text-primary-400">FAQ</a></li>
-                    <li><a href="kontakt.html" class="hover:text-primary-400">Kontakt</a></li>
-                </ul>
-            </div>
-            <div>
-                <h4 class="font-bold mb-4">Kontakt</h4>
-                <ul class="space-y-2 text-gray-400 text-sm">
-                    <li>✉️ info@bazarovyregal.cz</li>
-                    <li>🚚 Doprava od 99 Kč</li>
-                    <li>🛡️ Záruka 7 let</li>
-                </ul>
-            </div>
-        </div>
-        <div class="border-t border-gray-800 pt-8 text-center text-gray-500 text-sm">
-            © 2026 Bazarovyregal.cz - Shoptet.cz - Budujeme regálové impérium
-        </div>
-    </div>
-</footer>
-
-<!-- Chatbot -->
-<div id="chatWidget" class="fixed bottom-6 right-4 z-40">
-    <button onclick="toggleChat()" class="bg-primary-500 hover:bg-primary-600 text-white w-14 h-14 rounded-full shadow-lg flex items-center justify-center text-2xl transition-transform hover:scale-110">💬</button>
-    <div id="chatWindow" class="hidden absolute bottom-16 right-0 w-80 sm:w-96 bg-white rounded-2xl shadow-2xl overflow-hidden">
-        <div class="bg-gradient-to-r from-primary-500 to-orange-500 text-white p-4">
-            <div class="flex items-center justify-between">
-                <div class="flex items-center gap-3">
-                    <div class="w-10 h-10 bg-white/20 rounded-full flex items-center justify-center">🤖</div>
-                    <div>
-                        <div class="font-bold">RegálBot</div>
-                        <div class="text-xs text-white/80">Online</div>
-                    </div>
-                </div>
-                <button onclick="toggleChat()" class="text-white/80 hover:text-white">✕</button>
-            </div>
-        </div>
-        <div id="chatMessages" class="h-80 overflow-y-auto p-4 space-y-4">
-            <div class="flex gap-3">
-                <div class="w-8 h-8 bg-primary-100 rounded-full flex items-center justify-center flex-shrink-0">🤖</div>
-                <div class="bg-gray-100 rounded-2xl rounded-tl-none p-3 text-sm max-w-[80%]">Ahoj! 👋 Pomohu vám vybrat ideální regál.</div>
-            </div>
-        </div>
-        <div class="border-t p-4">
-            <div class="flex gap-2">
-                <input type="text" id="chatInput" placeholder="Napište zprávu..." class="flex-1 border rounded-lg px-3 py-2 text-sm" onkeypress="if(event.key==='Enter')sendMessage()">
-                <button onclick="sendMessage()" class="bg-primary-500 text-white px-4 py-2 rounded-lg">➤</button>
-            </div>
-        </div>
-    </div>
-</div>
-<script src="chatbot.js"></script>
-
-</body>
-</html>'''
-
-    return html
-
-def generate_sitemap():
-    """Generate sitemap.xml"""
-    now = datetime.now().strftime("%Y-%m-%d")
-
-    sitemap = '''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-'''
+    canonical_url = f"{BASE_URL}/{page['slug']}.html"
+
+    return render_document(
+        "landing",
+        head_meta=head_meta(page['title'], page['description'], canonical_url, IMAGES["black"],
+                            canonical_url=canonical_url),
+        breadcrumb=breadcrumb(category_name, page['h1']),
+        main=article_main(page['h1'], content),
+    )
+
+def sitemap_records(lastmods, output_dir):
+    """Yield sitemap URL records for main, SEO and product pages"""
+    def now(url):
+        # lastmod advances only when the page bytes change
+        return lastmods.lastmod_for(url, BASE_URL, output_dir)
 
     # Main pages
     main_pages = [
@@ -1083,24 +889,13 @@ def generate_sitemap():
     ]
 
     for url, priority, changefreq in main_pages:
-        sitemap += f'''    <url>
-        <loc>{BASE_URL}/{url}</loc>
-        <lastmod>{now}</lastmod>
-        <changefreq>{changefreq}</changefreq>
-        <priority>{priority}</priority>
-    </url>
-'''
+        yield {"loc": f"{BASE_URL}/{url}", "lastmod": now(f"{BASE_URL}/{url}"), "changefreq": changefreq, "priority": priority}
 
     # SEO pages
     for page in SEO_PAGES:
         priority = "0.8" if page["category"] in ["likvidace", "slevy", "bazar"] else "0.7"
-        sitemap += f'''    <url>
-        <loc>{BASE_URL}/{page['slug']}.html</loc>
-        <lastmod>{now}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>{priority}</priority>
-    </url>
-'''
+        loc = f"{BASE_URL}/{page['slug']}.html"
+        yield {"loc": loc, "lastmod": now(loc), "changefreq": "weekly", "priority": priority}
 
     # All 87 product pages
     product_files = [
@@ -1129,16 +924,8 @@ def generate_sitemap():
     ]
 
     for pf in product_files:
-        sitemap += f'''    <url>
-        <loc>{BASE_URL}/{pf}.html</loc>
-        <lastmod>{now}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.9</priority>
-    </url>
-'''
-
-    sitemap += '</urlset>'
-    return sitemap
+        loc = f"{BASE_URL}/{pf}.html"
+        yield {"loc": loc, "lastmod": now(loc), "changefreq": "weekly", "priority": "0.9"}
 
 def generate_robots_txt():
     """Generate robots.txt"""
@@ -1151,26 +938,41 @@ Sitemap: {BASE_URL}/sitemap.xml
 # Main execution
 if __name__ == "__main__":
     output_dir = os.path.dirname(os.path.abspath(__file__))
+    profiler = BuildProfiler("seo_pages", enabled="--profile" in sys.argv)
+    writer = OutputWriter(output_dir, dry_run="--dry-run" in sys.argv, minify="--minify" in sys.argv)
 
     print(f"Generating {len(SEO_PAGES)} SEO pages...")
+    if writer.dry_run:
+        print("DRY RUN: rendering in memory, nothing will be written")
 
     for page in SEO_PAGES:
-        html = generate_page_html(page)
-        filepath = os.path.join(output_dir, f"{page['slug']}.html")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html)
-        print(f"Generated: {page['slug']}.html")
+        start_us = now_us()
+        t0 = time.perf_counter()
+        html = generate_page_html(page).encode('utf-8')
+        t1 = time.perf_counter()
+        status = writer.write(f"{page['slug']}.html", html)
+        profiler.record_page(page['slug'], page['category'], t1 - t0, time.perf_counter() - t1, len(html), start_us)
+        print(f"Generated: {page['slug']}.html ({status})")
 
     # Generate sitemap
-    sitemap = generate_sitemap()
-    with open(os.path.join(output_dir, "sitemap.xml"), 'w', encoding='utf-8') as f:
-        f.write(sitemap)
+    with profiler.stage("sitemap"):
+        lastmods = LastmodStore(output_dir)
+        result = write_sitemap(sitemap_records(lastmods, output_dir), output_dir, BASE_URL,
+                               shard_threshold=SITEMAP_SHARD_THRESHOLD, writer=writer)
+        lastmods.save(writer)
     print("Generated: sitemap.xml")
+    if len(result["files"]) > 1:
+        print(f"  Sharded into {len(result['files']) - 1} gzipped sitemap(s)")
 
     # Generate robots.txt
-    robots = generate_robots_txt()
-    with open(os.path.join(output_dir, "robots.txt"), 'w', encoding='utf-8') as f:
-        f.write(robots)
+    with profiler.stage("robots"):
+        robots = generate_robots_txt()
+        writer.write("robots.txt", robots)
     print("Generated: robots.txt")
 
     print(f"\nDone! Generated {len(SEO_PAGES)} SEO pages + sitemap.xml + robots.txt")
+    print_cache_stats()
+    writer.minify_report()
+    if writer.dry_run:
+        writer.report("SEO pages output")
+    profiler.write(output_dir, writer)
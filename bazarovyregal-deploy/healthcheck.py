@@ -9,6 +9,7 @@ Usage:
 """
 
 import sys
+import gzip
 import urllib.request
 import urllib.error
 import xml.etree.ElementTree as ET
@@ -49,16 +50,23 @@ def check_url(url):
         return 0, str(e)
 
 
-def check_sitemap():
-    """Download and parse sitemap, return list of URLs."""
-    url = f"{DOMAIN}/sitemap.xml"
+def check_sitemap(url=None):
+    """Download and parse sitemap, return list of URLs (follows sitemap indexes and .gz shards)."""
+    url = url or f"{DOMAIN}/sitemap.xml"
     try:
         req = urllib.request.Request(url)
         req.add_header("User-Agent", "BazarovyregalHealthCheck/1.0")
         resp = urllib.request.urlopen(req, timeout=15)
-        content = resp.read().decode("utf-8")
-        root = ET.fromstring(content)
+        data = resp.read()
+        if url.endswith(".gz"):
+            data = gzip.decompress(data)
+        root = ET.fromstring(data.decode("utf-8"))
         ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+        if root.tag.endswith("sitemapindex"):
+            urls = []
+            for loc in root.findall("sm:sitemap/sm:loc", ns):
+                urls.extend(check_sitemap(loc.text.strip()))
+            return urls
         urls = [loc.text for loc in root.findall(".//sm:loc", ns)]
         return urls
     except Exception as e:
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Conservative HTML minifier for generated pages (--minify in every generator).
+
+- whitespace runs in text collapse to one space, and are dropped next to
+  block-level tags and anywhere inside <head>, where they never render
+- <pre>, <script> and <textarea> contents are kept byte for byte
+- comments are dropped (conditional comments <!--[if ...]> are kept)
+- whitespace between attributes and inside class="..." is collapsed
+- boolean attributes are shortened: defer="defer" / defer="" -> defer
+
+Usage:
+    python3 html_minify.py page.html [...]     # prints bytes saved, writes nothing
+"""
+
+import re
+import sys
+
+# One tag, allowing ">" inside quoted attribute values
+_TAG = r"<[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>"
+_TOKEN_RE = re.compile(
+    r"(?P<comment><!--.*?-->)"
+    r"|(?P<raw>(?P<open><(?P<rawname>pre|script|textarea)\b[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>)"
+    r".*?</(?P=rawname)\s*>)"
+    r"|(?P<tag>" + _TAG + r")"
+    r"|(?P<text>[^<]+|<)",
+    re.S | re.I,
+)
+_TAG_NAME_RE = re.compile(r"</?([a-zA-Z][\w:-]*)")
+_QUOTED_RE = re.compile(r"(\"[^\"]*\"|'[^']*')")
+_CLASS_RE = re.compile(r"(\sclass=)(\"[^\"]*\"|'[^']*')", re.I)
+_WS_RE = re.compile(r"\s+")
+
+BOOLEAN_ATTRIBUTES = ("allowfullscreen", "async", "autofocus", "checked", "defer", "disabled", "hidden",
+                      "multiple", "nomodule", "novalidate", "open", "readonly", "required", "selected")
+_BOOLEAN_RE = re.compile(
+    r"\s(" + "|".join(BOOLEAN_ATTRIBUTES) + r")=(?:\"\"|''|\"\1\"|'\1'|\1)(?=[\s/>])", re.I)
+
+# Whitespace next to these tags never renders (they start or end a block, or live in <head>)
+BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "body", "dd", "details", "dialog", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "head",
+    "header", "hr", "html", "li", "link", "main", "meta", "nav", "ol", "p", "pre", "section", "summary",
+    "table", "tbody", "td", "tfoot", "th", "thead", "title", "tr", "ul", "!doctype",
+))
+
+
+def _tag_name(tag):
+    if tag.startswith("<!"):
+        return tag[1:9].lower() if tag[2:9].lower() == "doctype" else ""
+    m = _TAG_NAME_RE.match(tag)
+    return m.group(1).lower() if m else ""
+
+
+def minify_tag(tag):
+    """Collapse whitespace between attributes and in class values; shorten boolean attributes."""
+    pieces = _QUOTED_RE.split(tag)
+    for i in range(0, len(pieces), 2):
+        pieces[i] = _WS_RE.sub(" ", pieces[i])
+    tag = "".join(pieces)
+    tag = _CLASS_RE.sub(lambda m: m.group(1) + m.group(2)[0] + " ".join(m.group(2)[1:-1].split()) + m.group(2)[0], tag)
+    tag = _BOOLEAN_RE.sub(r" \1", tag)
+    if tag.endswith(" />"):
+        tag = tag[:-3] + "/>"
+    elif tag.endswith(" >"):
+        tag = tag[:-2] + ">"
+    return tag
+
+
+def minify_html(html):
+    """Minified copy of an HTML document (str)."""
+    # Tokens: [kind, text, tag name]; comments are dropped and neighbouring text merged
+    tokens = []
+    for m in _TOKEN_RE.finditer(html):
+        kind = m.lastgroup
+        value = m.group(0)
+        if kind == "comment":
+            if value.startswith("<!--[if"):
+                tokens.append(["raw", value, ""])
+            continue
+        if kind == "raw":
+            opening = m.group("open")
+            tokens.append(["raw", minify_tag(opening) + value[len(opening):], m.group("rawname").lower()])
+        elif kind == "tag":
+            tokens.append(["tag", minify_tag(value), _tag_name(value)])
+        elif tokens and tokens[-1][0] == "text":
+            tokens[-1][1] += value
+        else:
+            tokens.append(["text", value, ""])
+
+    out = []
+    in_head = False
+    for i, (kind, value, name) in enumerate(tokens):
+        if kind != "text":
+            if name == "head":
+                in_head = not value.startswith("</")
+            out.append(value)
+            continue
+        value = _WS_RE.sub(" ", value)
+        if in_head and not value.strip():
+            continue
+        if i > 0 and tokens[i - 1][2] in BLOCK_TAGS:
+            value = value.lstrip(" ")
+        if i + 1 < len(tokens) and tokens[i + 1][2] in BLOCK_TAGS:
+            value = value.rstrip(" ")
+        if value:
+            out.append(value)
+    return "".join(out)
+
+
+def minify_bytes(data):
+    """minify_html() for UTF-8 encoded bytes."""
+    return minify_html(data.decode("utf-8")).encode("utf-8")
+
+
+if __name__ == "__main__":
+    total_before = total_after = 0
+    for path in sys.argv[1:]:
+        with open(path, "rb") as f:
+            data = f.read()
+        minified = minify_bytes(data)
+        total_before += len(data)
+        total_after += len(minified)
+        print(f"  {path:<55} {len(data):>9,} -> {len(minified):>9,} B (-{len(data) - len(minified):,})")
+    if total_before:
+        print(f"  Total: {total_before:,} -> {total_after:,} B "
+              f"(-{total_before - total_after:,}, -{(total_before - total_after) / total_before:.1%})")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Per-URL lastmod store for sitemaps.
+
+Keeps {url: {"hash", "lastmod"}} in sitemap_lastmod.json. lastmod only
+advances when the SHA-256 of the page bytes changes, so crawlers are not
+told that every page changed on every build.
+
+sitemap_lastmod.json is committed with the pages and must persist between
+builds: without it every URL falls back to the lastmod of the previous
+sitemap, even when its page changed. The size and mtime of each hashed file
+are cached separately in .sitemap_lastmod_stat.json (local to a checkout,
+not committed), so files whose size and mtime are unchanged are not re-hashed.
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+
+STORE_FILENAME = "sitemap_lastmod.json"
+STAT_FILENAME = ".sitemap_lastmod_stat.json"
+
+
+def url_to_path(url, base_url, output_dir):
+    """Map a site URL to its file in output_dir (None for foreign URLs)."""
+    if not url.startswith(base_url):
+        return None
+    rel = url[len(base_url):].lstrip("/").split("?", 1)[0].split("#", 1)[0]
+    if not rel or rel.endswith("/"):
+        rel += "index.html"
+    elif "." not in os.path.basename(rel):
+        rel += ".html"  # cleanUrls
+    return os.path.join(output_dir, rel)
+
+
+def _load_json(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class LastmodStore:
+    def __init__(self, output_dir, filename=STORE_FILENAME, stat_filename=STAT_FILENAME):
+        self.path = os.path.join(output_dir, filename)
+        self.stat_path = os.path.join(output_dir, stat_filename)
+        self.today = datetime.now().strftime("%Y-%m-%d")
+        self.entries = _load_json(self.path)
+        self.stats = _load_json(self.stat_path)  # url -> [size, mtime_ns] of the file last hashed
+        self.changed = 0
+
+    def touch(self, url, content, fallback=None):
+        """Record content (bytes) for url; returns its lastmod.
+
+        A new URL gets fallback (e.g. the lastmod of the previous sitemap) or today.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        entry = self.entries.get(url)
+        if entry and entry.get("hash") == digest:
+            return entry["lastmod"]
+        lastmod = self.today if entry else (fallback or self.today)
+        self.entries[url] = {"hash": digest, "lastmod": lastmod}
+        self.changed += 1
+        return lastmod
+
+    def touch_file(self, url, filepath, fallback=None):
+        """Like touch(), reading the page from disk; skips hashing when size and mtime are unchanged."""
+        entry = self.entries.get(url)
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return entry["lastmod"] if entry else (fallback or self.today)
+        if entry and self.stats.get(url) == [st.st_size, st.st_mtime_ns]:
+            return entry["lastmod"]
+        with open(filepath, "rb") as f:
+            lastmod = self.touch(url, f.read(), fallback)
+        self.stats[url] = [st.st_size, st.st_mtime_ns]
+        return lastmod
+
+    def lastmod_for(self, url, base_url, output_dir, fallback=None):
+        """lastmod for a site URL based on the bytes of its file in output_dir."""
+        filepath = url_to_path(url, base_url, output_dir)
+        if filepath is None:
+            return fallback or self.today
+        return self.touch_file(url, filepath, fallback)
+
+    def save(self, writer=None):
+        """Persist the store and stat cache, through writer (an OutputWriter) when given so --dry-run writes nothing."""
+        # Only content fields are committed (older stores also kept size/mtime per entry)
+        entries = {url: {"hash": e["hash"], "lastmod": e["lastmod"]} for url, e in self.entries.items()}
+        for path, data in ((self.path, entries), (self.stat_path, self.stats)):
+            data = json.dumps(data, indent=1, sort_keys=True)
+            if writer is not None:
+                writer.write(os.path.basename(path), data)
+                continue
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Shared page layout engine for all Bazarovyregal.cz generators.
+
+The site chrome (head boilerplate, stylesheet, fonts, analytics, top bar,
+header, footer, chat launcher) is rendered once into cached fragments. The
+stylesheet is the static Tailwind build from build_css.py (asset_manifest.json),
+or the Tailwind CDN runtime and inline config if it has not been built.
+Inter is the self-hosted subset from build_fonts.py, or Google Fonts.
+The document layout is compiled at import into constant chunks and a few
+per-page slots:
+    head_meta   - title, description, OpenGraph/Twitter tags, canonical
+    head_extra  - JSON-LD, page styles
+    body_top    - e.g. the product sticky bar
+    breadcrumb  - breadcrumb nav
+    main        - the <main> element
+    body_end    - page scripts
+Pages are assembled by joining buffers, so a chrome change is one cheap
+re-assembly of every page. LAYOUT_HASH changes whenever a fragment or other
+constant part of the layout changes, and whenever the source of the per-page
+helpers head_meta, breadcrumb and article_main (whose markup lives in
+f-strings, outside the compiled chunks) changes.
+
+Used by pseo_html_template.wrap_page, generate_seo_pages.generate_page_html
+and generate_full_product_pages.generate_html.
+"""
+
+import inspect
+import hashlib
+from functools import lru_cache
+
+from asset_manifest import asset_path, asset_text
+
+FAMILIES = ("article", "landing", "product", "catalog")
+
+
+def _fragment_head():
+    tailwind_prefetch = ""
+    if not asset_path("tailwind.css"):
+        tailwind_prefetch = '    <link rel="dns-prefetch" href="https://cdn.tailwindcss.com">\n'
+    fonts_prefetch = ""
+    if not asset_path("inter.woff2"):
+        fonts_prefetch = ('    <link rel="dns-prefetch" href="https://fonts.googleapis.com">\n'
+                          '    <link rel="dns-prefetch" href="https://fonts.gstatic.com">\n')
+    return f'''    <meta name="seznam-wmt" content="gsVJMRIZ0wBQpM8lNS073cpS20Kruq25" />
+    <meta name="google-site-verification" content="tf9_fVpjoW3eTmTv--4Ut0Whqqg2kGXLQ64R5SSyCmE" />
+{tailwind_prefetch}{fonts_prefetch}'''
+
+
+def _fragment_tailwind():
+    # Static stylesheet from build_css.py; the CDN runtime until one has been built
+    stylesheet = asset_path("tailwind.css")
+    if stylesheet:
+        return stylesheet_tags(stylesheet)
+    return '''    <script src="https://cdn.tailwindcss.com"></script>
+    <script>
+        tailwind.config = {
+            theme: {
+                extend: {
+                    fontFamily: { sans: ['Inter', 'sans-serif'] },
+                    colors: {
+                        primary: { 50:'#fff7ed',100:'#ffedd5',200:'#fed7aa',300:'#fdba74',400:'#fb923c',500:'#f97316',600:'#ea580c',700:'#c2410c',800:'#9a3412',900:'#7c2d12' }
+                    }
+                }
+            }
+        }
+    </script>
+'''
+
+
+def stylesheet_tags(href, critical_css="", family=""):
+    """Link to the built stylesheet; with critical CSS, inline it and load the stylesheet without blocking render."""
+    if not critical_css:
+        return f'    <link rel="stylesheet" href="{href}">\n'
+    return (f'    <style data-critical="{family}">{critical_css}</style>\n'
+            f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{href}"></noscript>\n')
+
+
+def font_tags(href, font_face_css):
+    """Preload for the self-hosted font file and its inline @font-face rule."""
+    return (f'    <link rel="preload" href="{href}" as="font" type="font/woff2" crossorigin>\n'
+            f'    <style data-font-face>{font_face_css}</style>\n')
+
+
+def _fragment_fonts():
+    # Subset Inter from build_fonts.py; Google Fonts until it has been built
+    font = asset_path("inter.woff2")
+    font_face_css = asset_text("inter.css")
+    if font and font_face_css:
+        return font_tags(font, font_face_css)
+    return '''    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
+'''
+
+
+def _fragment_analytics():
+    return '''    <script async src="https://www.googletagmanager.com/gtag/js?id=AW-17952868610"></script>
+    <script>
+        window.dataLayer = window.dataLayer || [];
+        function gtag(){dataLayer.push(arguments);}
+        gtag('js', new Date());
+        gtag('config', 'AW-17952868610');
+    </script>
+'''
+
+
+def _fragment_header():
+    return '''<div class="bg-gray-900 text-white text-sm py-2">
+    <div class="container mx-auto px-4 flex justify-between items-center">
+        <span>✉️ info@bazarovyregal.cz</span>
+        <div class="flex items-center gap-4">
+            <span>🚚 Doprava od 99 Kč</span>
+            <span>⭐ 4.9/5 (2847 recenzí)</span>
+        </div>
+    </div>
+</div>
+
+<header class="bg-white shadow-sm sticky top-0 z-50">
+    <div class="container mx-auto px-4 py-4 flex items-center justify-between">
+        <a href="index.html" class="flex items-center gap-3">
+            <div class="w-12 h-12 bg-primary-500 rounded-xl flex items-center justify-center shadow-lg">
+                <span class="text-white text-3xl font-black">B</span>
+            </div>
+            <div>
+                <div class="text-2xl font-black text-gray-900">Bazarovyregal<span class="text-primary-500">.cz</span></div>
+                <div class="text-xs text-red-600 font-bold uppercase">Likvidace skladu</div>
+            </div>
+        </a>
+        <nav class="hidden md:flex gap-4 text-sm font-medium">
+            <a href="index.html" class="text-gray-600 hover:text-primary-500">🏠 Úvod</a>
+            <a href="katalog.html" class="text-gray-600 hover:text-primary-500">📦 Katalog</a>
+            <a href="likvidace-skladu-regaly.html" class="text-gray-600 hover:text-primary-500">🔥 Likvidace</a>
+            <a href="faq.html" class="text-gray-600 hover:text-primary-500">❓ FAQ</a>
+            <a href="kontakt.html" class="text-gray-600 hover:text-primary-500">📧 Kontakt</a>
+        </nav>
+        <a href="katalog.html" class="bg-primary-500 hover:bg-primary-600 text-white px-5 py-2 rounded-lg font-bold">🛒 Katalog</a>
+    </div>
+</header>
+
+'''
+
+
+def _fragment_footer():
+    return '''<footer class="bg-gray-900 text-white py-12 mt-12">
+    <div class="container mx-auto px-4">
+        <div class="grid md:grid-cols-4 gap-8 mb-8">
+            <div>
+                <div class="text-xl font-bold mb-4">Bazarovyregal<span class="text-primary-500">.cz</span></div>
+                <p class="text-gray-400 text-sm">Největší slevy na kovové regály. Likvidace skladu - nové zboží za ceny bazaru.</p>
+            </div>
+            <div>
+                <h4 class="font-bold mb-4">Kategorie</h4>
+                <ul class="space-y-2 text-gray-400 text-sm">
+                    <li><a href="likvidace-skladu-regaly.html" class="hover:text-primary-400">Likvidace skladu</a></li>
+                    <li><a href="bazarove-regaly.html" class="hover:text-primary-400">Bazarové regály</a></li>
+                    <li><a href="slevy-na-regaly.html" class="hover:text-primary-400">Slevy na regály</a></li>
+                    <li><a href="regaly-do-garaze.html" class="hover:text-primary-400">Regály do garáže</a></li>
+                    <li><a href="regaly-do-sklepa.html" class="hover:text-primary-400">Regály do sklepa</a></li>
+                    <li><a href="zinkove-regaly.html" class="hover:text-primary-400">Zinkové regály</a></li>
+                </ul>
+            </div>
+            <div>
+                <h4 class="font-bold mb-4">Informace</h4>
+                <ul class="space-y-2 text-gray-400 text-sm">
+                    <li><a href="montaz-regalu.html" class="hover:text-primary-400">Montáž regálu</a></li>
+                    <li><a href="nosnost-regalu.html" class="hover:text-primary-400">Nosnost regálů</a></li>
+                    <li><a href="o-nas.html" class="hover:text-primary-400">O nás</a></li>
+                    <li><a href="faq.html" class="hover:text-primary-400">FAQ</a></li>
+                    <li><a href="kontakt.html" class="hover:text-primary-400">Kontakt</a></li>
+                </ul>
+            </div>
+            <div>
+                <h4 class="font-bold mb-4">Kontakt</h4>
+                <ul class="space-y-2 text-gray-400 text-sm">
+                    <li>✉️ info@bazarovyregal.cz</li>
+                    <li>🚚 Doprava od 99 Kč</li>
+                    <li>🛡️ Záruka 7 let</li>
+                </ul>
+            </div>
+        </div>
+        <div class="border-t border-gray-800 pt-8 text-center text-gray-500 text-sm">
+            © 2026 Bazarovyregal.cz - Shoptet.cz - Budujeme regálové impérium
+        </div>
+    </div>
+</footer>
+
+'''
+
+
+def _fragment_chat():
+    # Launcher only: chatbot.js (which builds the chat window) loads on the first
+    # interaction (not scrolling) or when the page is idle; a click before that opens
+    # the chat once loaded
+    chatbot = asset_path("chatbot.js") or "chatbot.js"
+    return f'''<div id="chatWidget" class="fixed bottom-6 right-4 z-40">
+    <button id="chatButton" onclick="toggleChat()" aria-label="Otevřít chat" class="bg-primary-500 hover:bg-primary-600 text-white w-14 h-14 rounded-full shadow-lg flex items-center justify-center text-2xl transition-transform hover:scale-110">💬</button>
+</div>
+<script>
+(function(){{var done=false,events=['pointerdown','keydown','touchstart'];
+function load(){{if(done)return;done=true;events.forEach(function(e){{removeEventListener(e,load)}});
+var s=document.createElement('script');s.src='{chatbot}';document.body.appendChild(s)}}
+window.toggleChat=function(){{window.regalbotOpen=true;load()}};
+events.forEach(function(e){{addEventListener(e,load,{{passive:true}})}});
+addEventListener('load',function(){{(window.requestIdleCallback||function(f){{setTimeout(f,2000)}})(load,{{timeout:5000}})}})}})();
+</script>
+'''
+
+
+FRAGMENT_BUILDERS = {
+    "head": _fragment_head,
+    "tailwind": _fragment_tailwind,
+    "fonts": _fragment_fonts,
+    "analytics": _fragment_analytics,
+    "header": _fragment_header,
+    "footer": _fragment_footer,
+    "chat": _fragment_chat,
+}
+
+
+@lru_cache(maxsize=None)
+def fragment(name):
+    """Pre-rendered shared chrome fragment (rendered once per process)."""
+    return FRAGMENT_BUILDERS[name]()
+
+
+@lru_cache(maxsize=None)
+def stylesheet(family=None):
+    """Stylesheet markup for a layout family (the shared "tailwind" fragment if it has no critical CSS)."""
+    href = asset_path("tailwind.css")
+    critical_css = asset_text(f"critical-{family}.css") if href and family else None
+    if not critical_css:
+        return fragment("tailwind")
+    return stylesheet_tags(href, critical_css, family)
+
+
+class Slot:
+    """Placeholder for per-page content in a compiled layout."""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+def compile_layout(pieces):
+    """Merge adjacent constant strings of a layout; returns (parts, [(index, slot name)]).
+
+    parts holds the constant chunks with None at each slot position.
+    """
+    parts = []
+    slots = []
+    for piece in pieces:
+        if isinstance(piece, Slot):
+            slots.append((len(parts), piece.name))
+            parts.append(None)
+        elif piece:
+            if parts and parts[-1] is not None:
+                parts[-1] += piece
+            else:
+                parts.append(piece)
+    return parts, slots
+
+
+def document(family=None):
+    """Layout pieces of a full HTML document for a layout family (None: no critical CSS)."""
+    return [
+        '<!DOCTYPE html>\n<html lang="cs">\n<head>\n    <meta charset="UTF-8">\n'
+        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n',
+        Slot("head_meta"),
+        fragment("head"),
+        fragment("fonts"),
+        Slot("head_extra"),
+        # After page styles, where the CDN runtime injected its CSS, so utilities keep precedence
+        stylesheet(family),
+        fragment("analytics"),
+        '</head>\n<body class="bg-gray-50 font-sans">\n\n',
+        Slot("body_top"),
+        fragment("header"),
+        Slot("breadcrumb"),
+        Slot("main"),
+        fragment("footer"),
+        Slot("body_end"),
+        fragment("chat"),
+        '</body>\n</html>',
+    ]
+
+
+@lru_cache(maxsize=None)
+def compiled_document(family=None):
+    """(parts, slots) of the compiled document for a layout family."""
+    return compile_layout(document(family))
+
+
+DOCUMENT = document()
+DOCUMENT_SLOTS = sorted({name for _, name in compiled_document()[1]})
+
+
+def layout_template():
+    """The compiled document as an equivalent str.format template (for benchmarks and debugging)."""
+    template = []
+    for piece in DOCUMENT:
+        if isinstance(piece, Slot):
+            template.append("{" + piece.name + "}")
+        else:
+            template.append(piece.replace("{", "{{").replace("}", "}}"))
+    return "".join(template)
+
+
+def render_document(family=None, **values):
+    """Assemble a full HTML document; unspecified slots are empty."""
+    parts, slots = compiled_document(family)
+    parts = parts.copy()
+    for i, name in slots:
+        parts[i] = values.get(name, "")
+    return "".join(parts)
+
+
+def head_meta(title, meta_desc, og_url, og_image, og_type="article", canonical_url=None,
+              og_title=None, og_description=None, twitter_title=None, twitter_description=None, extra=""):
+    """Per-page <head> metadata: title, description, OpenGraph, Twitter card and canonical link."""
+    og_title = og_title or title
+    og_description = og_description or meta_desc
+    canonical = f'    <link rel="canonical" href="{canonical_url}">\n' if canonical_url else ""
+    return f'''    <title>{title}</title>
+    <meta name="description" content="{meta_desc}">
+    <meta property="og:title" content="{og_title}">
+    <meta property="og:description" content="{og_description}">
+    <meta property="og:image" content="{og_image}">
+    <meta property="og:url" content="{og_url}">
+    <meta property="og:type" content="{og_type}">
+    <meta property="og:site_name" content="Bazarovyregal.cz">
+    <meta property="og:locale" content="cs_CZ">
+{extra}    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{twitter_title or og_title}">
+    <meta name="twitter:description" content="{twitter_description or og_description}">
+    <meta name="twitter:image" content="{og_image}">
+{canonical}'''
+
+
+def breadcrumb(category, current):
+    """Breadcrumb nav: Úvod › category (katalog) › current page."""
+    return f'''<nav class="bg-white border-b">
+    <div class="container mx-auto px-4 py-3">
+        <ol class="flex items-center gap-2 text-sm text-gray-500">
+            <li><a href="index.html" class="hover:text-primary-500">Úvod</a></li>
+            <span>›</span>
+            <li><a href="katalog.html" class="hover:text-primary-500">{category}</a></li>
+            <span>›</span>
+            <li class="text-gray-900 font-medium truncate max-w-xs">{current}</li>
+        </ol>
+    </div>
+</nav>
+
+'''
+
+
+_ARTICLE_CTA = '''
+        <div class="bg-gradient-to-r from-primary-500 to-orange-500 rounded-2xl p-8 mt-12 text-white text-center">
+            <h2 class="text-2xl font-bold mb-2">Připraveni nakoupit?</h2>
+            <p class="mb-6 text-white/90">Prohlédněte si náš kompletní katalog regálů se slevami až 75%</p>
+            <a href="katalog.html" class="inline-block bg-white text-primary-600 px-8 py-3 rounded-xl font-bold hover:bg-gray-100 transition">Zobrazit katalog →</a>
+        </div>
+    </article>
+</main>
+
+'''
+
+
+def article_main(h1, body_html):
+    """<main> for article pages (pSEO and SEO landing pages): heading, prose body and catalog CTA."""
+    return f'''<main class="container mx-auto px-4 py-8">
+    <article class="max-w-4xl mx-auto">
+        <h1 class="text-3xl md:text-4xl font-bold text-gray-900 mb-6">{h1}</h1>
+        <div class="prose prose-lg max-w-none">
+            {body_html}
+        </div>
+{_ARTICLE_CTA}'''
+
+
+LAYOUT_HASH = hashlib.sha256("\0".join(
+    [part for family in (None,) + FAMILIES for part in compiled_document(family)[0] if part is not None]
+    + [_ARTICLE_CTA] + [inspect.getsource(helper) for helper in (head_meta, breadcrumb, article_main)]
+).encode("utf-8")).hexdigest()[:12]
@@ -4,31 +4,15 @@ Programmatic SEO Data Configuration for Bazarovyregal.cz
 All input datasets for 12 pSEO playbooks.
 """
 
+from catalog import IMAGES, featured_products
+
 BASE_URL = "https://www.bazarovyregal.cz"
 
-# Product images
-IMAGES = {
-    "black": "https://vyprodej-regalucz.s26.cdn-upgates.com/l/l690377af7480a-1-regal-1800x900x400-mm-lakovany-5-policovy-nosnost-875-kg-cerny-pravy-18090405875black1.jpeg",
-    "white": "https://vyprodej-regalucz.s26.cdn-upgates.com/6/6690a777ad6edc-1-18090405875white1.jpeg",
-    "red": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/9/e/9eef5f9f2ad8880b75926a3eae58485b-1-regal-1500x700x300-mm-lakovany-4-policovy-nosnost-700-kg-cerveny-pravy-15070304700red1.jpeg",
-    "blue": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/1/c/1c64831c1231f5847cf9e7a36f6cdf6f-1-15070304700blue1.jpeg",
-    "zinc": "https://vyprodej-regalucz.s26.cdn-upgates.com/z/z6914605330838-5-pol-pravy-zink.jpg",
-    "pro": "https://vyprodej-regalucz.s26.cdn-upgates.com/_cache/b/1/b17ce5b491bdb73a0df3160b51fbcf7e-1-regal-1800x1200x500-mm-lakovany-5-policovy-nosnost-1050-kg-modro-oranzovy-pravy-18120501050orangeblue1.jpeg"
-}
+# Above this many URLs sitemap.xml becomes an index of gzipped shards (protocol max 50,000)
+SITEMAP_SHARD_THRESHOLD = 50000
 
-# Featured products for linking on pSEO pages
-PRODUCTS = [
-    {"name": "Regal 150x70x30 cm cerny", "price": 599, "url": "regal-150x70x30-cerna.html", "img": IMAGES["black"], "dims": "150x70x30", "color": "cerny", "capacity": 700},
-    {"name": "Regal 150x70x30 cm zinkovany", "price": 549, "url": "regal-150x70x30-zinkovany.html", "img": IMAGES["zinc"], "dims": "150x70x30", "color": "zinkovany", "capacity": 700},
-    {"name": "Regal 180x90x40 cm cerny", "price": 739, "url": "regal-180x90x40-cerna.html", "img": IMAGES["black"], "bestseller": True, "dims": "180x90x40", "color": "cerny", "capacity": 875},
-    {"name": "Regal 180x90x40 cm zinkovany", "price": 649, "url": "regal-180x90x40-zinkovany.html", "img": IMAGES["zinc"], "dims": "180x90x40", "color": "zinkovany", "capacity": 875},
-    {"name": "Regal 180x90x40 cm bily", "price": 739, "url": "regal-180x90x40-bila.html", "img": IMAGES["white"], "dims": "180x90x40", "color": "bily", "capacity": 875},
-    {"name": "Regal 180x90x40 cm cerveny", "price": 759, "url": "regal-180x90x40-cervena.html", "img": IMAGES["red"], "dims": "180x90x40", "color": "cerveny", "capacity": 875},
-    {"name": "Regal 180x90x40 cm modry", "price": 759, "url": "regal-180x90x40-modra.html", "img": IMAGES["blue"], "dims": "180x90x40", "color": "modry", "capacity": 875},
-    {"name": "Regal 200x90x40 cm cerny", "price": 849, "url": "regal-200x90x40-cerna.html", "img": IMAGES["black"], "dims": "200x90x40", "color": "cerny", "capacity": 875},
-    {"name": "Regal 200x120x50 cm cerny", "price": 1149, "url": "regal-180x120x50-cerna.html", "img": IMAGES["black"], "dims": "180x120x50", "color": "cerny", "capacity": 875},
-    {"name": "Regal 180x120x50 cm profesionalni", "price": 1249, "url": "regal-180x120x50-profesionalni.html", "img": IMAGES["pro"], "dims": "180x120x50", "color": "profesionalni", "capacity": 1050},
-]
+# Featured products for linking on pSEO pages (product data lives in catalog.py)
+PRODUCTS = featured_products()
 
 # ============================================================
 # CATEGORIES - use cases / spaces where shelves are placed
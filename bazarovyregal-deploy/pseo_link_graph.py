@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Relevance-ranked internal links for pSEO pages.
+
+Builds a token/category index over every known page: EXISTING_PAGES plus
+the pSEO page summaries handed over with set_link_pages(). Tokens come from
+the slug and link text (diacritics stripped) and are weighted by IDF, so
+words that appear on every page ("regaly") count for little.
+
+For a page, candidates are gathered through the inverted index, scored by
+shared-token weight plus a bonus for the same playbook type, and the top k
+are picked with a heap (O(c log k) for c candidates), with at most half of
+them from a single playbook type. Ties are broken by a per-page hash so
+equally relevant targets are spread across the site instead of every page
+linking to the same ones.
+
+The neighbour lists of all pSEO pages are computed once in
+set_link_pages() (or passed in, as read back from pseo_manifest.json by
+generate_pseo_all.py), so rendering a page only looks its links up.
+"""
+
+import re
+import math
+import heapq
+import zlib
+import unicodedata
+
+from pseo_config import EXISTING_PAGES
+
+CATEGORY_WEIGHT = 1.0
+LINK_COUNT = 6
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase ASCII tokens of text (diacritics stripped, 1-char tokens dropped)."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return {t for t in _TOKEN_RE.findall(text) if len(t) > 1 and t != "html"}
+
+
+def _link_text(entry):
+    if entry.get("h1"):
+        return entry["h1"]
+    return entry["title"].split(" | ")[0]
+
+
+class LinkGraph:
+    def __init__(self, pages):
+        """pages: [{"slug", "text", "category"}], first occurrence of a slug wins."""
+        self.pages = []
+        self.by_slug = {}
+        for page in pages:
+            if page["slug"] in self.by_slug:
+                continue
+            page = dict(page, tokens=tokenize(page["slug"].replace("-", " ") + " " + page["text"]))
+            self.by_slug[page["slug"]] = len(self.pages)
+            self.pages.append(page)
+
+        self.postings = {}
+        for i, page in enumerate(self.pages):
+            for token in page["tokens"]:
+                self.postings.setdefault(token, []).append(i)
+        n = len(self.pages)
+        self.idf = {t: math.log((n + 1) / len(ids)) for t, ids in self.postings.items()}
+        self.by_category = {}
+        for i, page in enumerate(self.pages):
+            if page["category"]:
+                self.by_category.setdefault(page["category"], []).append(i)
+        self._cache = {}
+
+    def related(self, slug, k=6, category=None):
+        """Top-k most related pages for slug (excluding itself), as page dicts."""
+        cache_key = (slug, k, category)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        own = self.by_slug.get(slug)
+        if own is not None:
+            tokens = self.pages[own]["tokens"]
+            category = category or self.pages[own]["category"]
+        else:
+            tokens = tokenize(slug.replace("-", " "))
+
+        scores = {}
+        for token in tokens:
+            weight = self.idf.get(token, 0.0)
+            for i in self.postings.get(token, ()):
+                scores[i] = scores.get(i, 0.0) + weight
+        for i in self.by_category.get(category, ()):
+            scores[i] = scores.get(i, 0.0) + CATEGORY_WEIGHT
+        scores.pop(own, None)
+
+        # Fill with the rest of the site (score 0) so every page gets k links
+        if len(scores) < k:
+            for i in range(len(self.pages)):
+                if i != own:
+                    scores.setdefault(i, 0.0)
+
+        def rank(i):
+            # Deterministic per-page tie-break spreads equally scored targets
+            return scores[i], zlib.crc32(f"{slug}>{self.pages[i]['slug']}".encode("utf-8"))
+
+        # At most half the links go to one category, so clusters also link out of themselves
+        per_category = max(1, (k + 1) // 2)
+        picked, overflow, used = [], [], {}
+        same = [i for i in scores if category and self.pages[i]["category"] == category]
+        other = [i for i in scores if not (category and self.pages[i]["category"] == category)]
+        candidates = heapq.nlargest(per_category, same, key=rank) + heapq.nlargest(k * 3, other, key=rank)
+        for i in sorted(candidates, key=rank, reverse=True):
+            cat = self.pages[i]["category"]
+            if cat is not None and used.get(cat, 0) >= per_category:
+                overflow.append(i)
+                continue
+            used[cat] = used.get(cat, 0) + 1
+            picked.append(i)
+            if len(picked) == k:
+                break
+        picked += overflow[:k - len(picked)]
+        result = [self.pages[i] for i in picked]
+        self._cache[cache_key] = result
+        return result
+
+    def neighbours(self, k=LINK_COUNT):
+        """{slug: [(slug, link text), ...]} of the top-k links of every pSEO page (pages with a category)."""
+        return {page["slug"]: [(p["slug"], p["text"]) for p in self.related(page["slug"], k)]
+                for page in self.pages if page["category"]}
+
+
+def link_pages(summaries):
+    """Link targets: EXISTING_PAGES plus the given pSEO page summaries (slug, playbook_type, title, h1)."""
+    pages = [{"slug": p["slug"], "text": p["title"], "category": None} for p in EXISTING_PAGES]
+    for s in summaries:
+        pages.append({"slug": s["slug"], "text": _link_text(s), "category": s["playbook_type"]})
+    return pages
+
+
+_graph = None
+_neighbours = {}
+
+
+def set_link_pages(summaries, neighbours=None):
+    """Use the given pSEO pages as link targets (None: no targets, internal_links() renders nothing).
+
+    neighbours are precomputed lists as returned by LinkGraph.neighbours() for
+    exactly these summaries; without them they are computed here.
+    """
+    global _graph, _neighbours
+    _graph = LinkGraph(link_pages(summaries) if summaries is not None else [])
+    _neighbours = neighbours if neighbours is not None else _graph.neighbours()
+
+
+def get_link_graph():
+    """The link graph set by set_link_pages() (EXISTING_PAGES only until then)."""
+    global _graph
+    if _graph is None:
+        _graph = LinkGraph(link_pages([]))
+    return _graph
+
+
+def link_targets(slug):
+    """[(slug, link text)] of the page slug: its precomputed neighbours, ranked on demand for a page outside the set."""
+    if slug in _neighbours:
+        return _neighbours[slug]
+    return [(p["slug"], p["text"]) for p in get_link_graph().related(slug, LINK_COUNT)]
+
+
+def internal_links(exclude_slug, count=LINK_COUNT, category=None):
+    """<ul> of the count most relevant internal links for the page exclude_slug."""
+    if count == LINK_COUNT and category is None:
+        targets = link_targets(exclude_slug)
+    else:
+        targets = [(p["slug"], p["text"]) for p in get_link_graph().related(exclude_slug, count, category)]
+    links = [
+        f'<li><a href="{slug}.html" class="text-primary-600 hover:underline">{text}</a></li>'
+        for slug, text in targets
+    ]
+    if not links:
+        return ""
+    return '<ul class="grid sm:grid-cols-2 gap-2 mt-4 mb-8">' + "".join(links) + "</ul>"
+
+
+if __name__ == "__main__":
+    import sys
+    from pseo_registry import PLAYBOOKS
+    from generate_pseo_all import collect_summaries
+    graph = LinkGraph(link_pages(collect_summaries(PLAYBOOKS, [])))
+    slugs = sys.argv[1:] or [graph.pages[-1]["slug"]]
+    for slug in slugs:
+        print(slug)
+        for p in graph.related(slug):
+            print(f"    {p['slug']:<45} {p['text']}")
@@ -1,20 +1,12 @@
 #!/usr/bin/env python3
 """pSEO Playbooks Part 1: Locations, Personas, Glossary"""
 
-from pseo_config import LOCATIONS, PERSONAS, GLOSSARY_TERMS, PRODUCTS, IMAGES, CATEGORIES, EXISTING_PAGES
+from pseo_config import LOCATIONS, PERSONAS, GLOSSARY_TERMS, PRODUCTS, IMAGES, CATEGORIES
 from pseo_html_template import get_product_cards
-
-
-def _internal_links(exclude_slug, count=6):
-    links = []
-    for p in EXISTING_PAGES:
-        if p["slug"] != exclude_slug and len(links) < count:
-            links.append(f'<li><a href="{p["slug"]}.html" class="text-primary-600 hover:underline">{p["title"]}</a></li>')
-    return '<ul class="grid sm:grid-cols-2 gap-2 mt-4 mb-8">' + "".join(links) + "</ul>"
+from pseo_link_graph import internal_links
 
 
 def generate_location_pages():
-    pages = []
     for loc in LOCATIONS:
         slug = f"kovove-regaly-{loc['id']}"
         city = loc["name"]
@@ -91,10 +83,10 @@ def generate_location_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další užitečné stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": f"Kovové regály {city} | Doprava od 99 Kč | Bazarovyregal.cz",
             "meta_desc": f"Kovové regály v {city} se slevou až 75 %. Doprava od 99 Kč, záruka 7 let. Regály do garáže, sklepa, dílny. Expedice ihned.",
@@ -102,12 +94,10 @@ def generate_location_pages():
             "body_html": body,
             "breadcrumb_category": "Lokality",
             "playbook_type": "locations",
-        })
-    return pages
+        }
 
 
 def generate_persona_pages():
-    pages = []
     for persona in PERSONAS:
         slug = persona["slug"]
         title_text = persona["title"]
@@ -116,7 +106,7 @@ def generate_persona_pages():
         pain_items = "".join(f'<li class="flex items-start gap-2"><span class="text-red-500 text-lg">&#10007;</span> <span>{p}</span></li>' for p in persona["pain_points"])
         solution_items = "".join(f'<li class="flex items-start gap-2"><span class="text-green-500 text-lg">&#10003;</span> <span>{s}</span></li>' for s in persona["solutions"])
 
-        rec_products = [p for p in PRODUCTS if p["url"] in persona.get("recommended_products", [])]
+        rec_products = [p for p in PRODUCTS if p.url in persona.get("recommended_products", [])]
         if not rec_products:
             rec_products = PRODUCTS[:4]
 
@@ -185,10 +175,10 @@ def generate_persona_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Související stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": f"{title_text} | Bazarovyregal.cz",
             "meta_desc": f"{title_text}. Kovové regály se slevou až 75 %, záruka 7 let, montáž za 10 minut. Od 549 Kč.",
@@ -196,12 +186,10 @@ def generate_persona_pages():
             "body_html": body,
             "breadcrumb_category": "Pro koho",
             "playbook_type": "personas",
-        })
-    return pages
+        }
 
 
 def generate_glossary_pages():
-    pages = []
     for term in GLOSSARY_TERMS:
         slug = term["slug"]
         term_name = term["term"]
@@ -259,10 +247,10 @@ def generate_glossary_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": f"{term_name} – co to je a proč je důležitá | Bazarovyregal.cz",
             "meta_desc": f"{term_name}: {definition[:140]}",
@@ -270,12 +258,11 @@ def generate_glossary_pages():
             "body_html": body,
             "breadcrumb_category": "Slovník",
             "playbook_type": "glossary",
-        })
-    return pages
+        }
 
 
 if __name__ == "__main__":
-    pages = generate_location_pages() + generate_persona_pages() + generate_glossary_pages()
+    pages = [*generate_location_pages(), *generate_persona_pages(), *generate_glossary_pages()]
     print(f"Generated {len(pages)} pages")
     for p in pages:
         print(f"  {p['slug']}.html - {p['playbook_type']}")
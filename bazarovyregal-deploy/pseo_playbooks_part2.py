@@ -1,20 +1,15 @@
 #!/usr/bin/env python3
 """pSEO Playbooks Part 2: Comparisons, Curation, Templates"""
 
-from pseo_config import COMPARISONS, PRODUCTS, CATEGORIES, EXISTING_PAGES
+from pseo_config import COMPARISONS, PRODUCTS, CATEGORIES
+from catalog import CatalogIndex
 from pseo_html_template import get_product_cards
+from pseo_link_graph import internal_links
 
-
-def _internal_links(exclude_slug, count=6):
-    links = []
-    for p in EXISTING_PAGES:
-        if p["slug"] != exclude_slug and len(links) < count:
-            links.append(f'<li><a href="{p["slug"]}.html" class="text-primary-600 hover:underline">{p["title"]}</a></li>')
-    return '<ul class="grid sm:grid-cols-2 gap-2 mt-4 mb-8">' + "".join(links) + "</ul>"
+_INDEX = CatalogIndex(PRODUCTS)
 
 
 def generate_comparison_pages():
-    pages = []
     for comp in COMPARISONS:
         slug = comp["slug"]
         a = comp["item_a"]
@@ -110,10 +105,10 @@ def generate_comparison_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další srovnání a stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": comp["title"] + " | Bazarovyregal.cz",
             "meta_desc": f"Srovnání {a['name']} vs {b['name']}. Výhody, nevýhody, srovnávací tabulka a doporučení. {comp['verdict'][:80]}",
@@ -121,8 +116,7 @@ def generate_comparison_pages():
             "body_html": body,
             "breadcrumb_category": "Srovnání",
             "playbook_type": "comparisons",
-        })
-    return pages
+        }
 
 
 def generate_curation_pages():
@@ -134,15 +128,15 @@ def generate_curation_pages():
         {"slug": "nejlepsi-regaly-do-garaze", "title": "TOP regály do garáže 2026",
          "intro": "Garáž potřebuje odolné regály s vysokou nosností. Vybrali jsme nejlepší modely pro garážové podmínky.",
          "criteria": ["Odolnost vlhkosti", "Nosnost", "Rozměry vhodné do garáže", "Cena", "Snadnost montáže"],
-         "products": [p for p in PRODUCTS if "cerna" in p["url"] or "zinkovany" in p["url"]][:5], "cat": "Do garáže"},
+         "products": _INDEX.any_of("color", ("cerna", "zinkovany"))[:5], "cat": "Do garáže"},
         {"slug": "nejlepsi-regaly-do-sklepa", "title": "TOP regály do sklepa 2026 – odolné vlhkosti",
          "intro": "Sklep vyžaduje regály odolné vlhkosti. Jednoznačně doporučujeme zinkované varianty.",
          "criteria": ["Odolnost korozi", "Zinkovaný povrch", "Nosnost pro zavařeniny/víno", "Cena"],
-         "products": [p for p in PRODUCTS if "zinkovany" in p["url"]][:3] + PRODUCTS[:2], "cat": "Do sklepa"},
+         "products": _INDEX.lookup("color", "zinkovany")[:3] + PRODUCTS[:2], "cat": "Do sklepa"},
         {"slug": "nejlepsi-zinkovane-regaly", "title": "TOP zinkované regály – odolnost bez kompromisů",
          "intro": "Zinkované regály jsou nejlepší volbou do vlhkých prostor. Srovnáváme dostupné varianty.",
          "criteria": ["Kvalita zinkového povlaku", "Nosnost", "Dostupné rozměry", "Cena"],
-         "products": [p for p in PRODUCTS if "zinkovany" in p["url"]][:3] + PRODUCTS[:2], "cat": "Zinkované"},
+         "products": _INDEX.lookup("color", "zinkovany")[:3] + PRODUCTS[:2], "cat": "Zinkované"},
         {"slug": "nejlepsi-regaly-do-dilny", "title": "TOP regály do dílny 2026",
          "intro": "Dílna vyžaduje profesionální přístup. Tyto regály zvládnou i to nejtěžší nářadí.",
          "criteria": ["Maximální nosnost", "Profesionální povrch", "Šířka police", "Modularita"],
@@ -150,7 +144,7 @@ def generate_curation_pages():
         {"slug": "nejlevnejsi-regaly", "title": "Nejlevnější kovové regály – od 549 Kč",
          "intro": "Hledáte nejlevnější regály na trhu? Díky likvidaci skladu nabízíme nové regály za ceny bazaru.",
          "criteria": ["Absolutní cena", "Poměr cena/výkon", "Dostupnost skladem"],
-         "products": sorted(PRODUCTS, key=lambda x: x["price"])[:5], "cat": "Levné regály"},
+         "products": _INDEX.range("price")[:5], "cat": "Levné regály"},
         {"slug": "nejprodavanejsi-regaly", "title": "Nejprodávanější regály 2026 – co kupují ostatní",
          "intro": "Podívejte se, které regály naši zákazníci kupují nejčastěji a proč.",
          "criteria": ["Počet prodaných kusů", "Hodnocení zákazníků", "Opakované nákupy"],
@@ -161,7 +155,6 @@ def generate_curation_pages():
          "products": [PRODUCTS[9], PRODUCTS[8], PRODUCTS[7]] + PRODUCTS[:2], "cat": "Pro firmy"},
     ]
 
-    pages = []
     for cur in curations:
         slug = cur["slug"]
         criteria_items = "".join(f"<li class='flex items-center gap-2'><span class='w-6 h-6 bg-primary-100 rounded-full flex items-center justify-center text-xs font-bold text-primary-600'>{i+1}</span> {c}</li>"
@@ -173,10 +166,10 @@ def generate_curation_pages():
             product_rows += f'''
             <tr class="border-b hover:bg-gray-50">
                 <td class="py-4 px-4 font-bold text-lg text-primary-600">#{i+1}</td>
-                <td class="py-4 px-4"><div class="font-medium">{p["name"]}</div>{badge}</td>
-                <td class="py-4 px-4 text-right font-bold text-primary-600">{p["price"]} Kč</td>
-                <td class="py-4 px-4 text-right">{p.get("capacity", 875)} kg</td>
-                <td class="py-4 px-4 text-right"><a href="{p["url"]}" class="text-primary-600 hover:underline font-medium">Detail</a></td>
+                <td class="py-4 px-4"><div class="font-medium">{p.name}</div>{badge}</td>
+                <td class="py-4 px-4 text-right font-bold text-primary-600">{p.price} Kč</td>
+                <td class="py-4 px-4 text-right">{p.capacity} kg</td>
+                <td class="py-4 px-4 text-right"><a href="{p.url}" class="text-primary-600 hover:underline font-medium">Detail</a></td>
             </tr>'''
 
         body = f'''
@@ -221,10 +214,10 @@ def generate_curation_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": cur["title"] + " | Bazarovyregal.cz",
             "meta_desc": cur["intro"][:155],
@@ -232,8 +225,7 @@ def generate_curation_pages():
             "body_html": body,
             "breadcrumb_category": cur["cat"],
             "playbook_type": "curation",
-        })
-    return pages
+        }
 
 
 def generate_template_pages():
@@ -300,7 +292,6 @@ def generate_template_pages():
          "cat": "Kalkulačka"},
     ]
 
-    pages = []
     for tmpl in templates:
         slug = tmpl["slug"]
 
@@ -362,10 +353,10 @@ def generate_template_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další šablony a stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": tmpl["title"] + " | Bazarovyregal.cz",
             "meta_desc": f"{tmpl['title']}. Praktický návod krok za krokem s kontrolním seznamem. Doporučení od profesionálů.",
@@ -373,12 +364,11 @@ def generate_template_pages():
             "body_html": body,
             "breadcrumb_category": tmpl["cat"],
             "playbook_type": "templates",
-        })
-    return pages
+        }
 
 
 if __name__ == "__main__":
-    pages = generate_comparison_pages() + generate_curation_pages() + generate_template_pages()
+    pages = [*generate_comparison_pages(), *generate_curation_pages(), *generate_template_pages()]
     print(f"Generated {len(pages)} pages")
     for p in pages:
         print(f"  {p['slug']}.html - {p['playbook_type']}")
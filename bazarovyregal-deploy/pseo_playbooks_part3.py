@@ -1,16 +1,9 @@
 #!/usr/bin/env python3
 """pSEO Playbooks Part 3: Examples, Directory, Profiles"""
 
-from pseo_config import PRODUCTS, HEIGHTS, WIDTHS, USE_CASES, EXISTING_PAGES
+from pseo_config import PRODUCTS, HEIGHTS, WIDTHS, USE_CASES
 from pseo_html_template import get_product_cards
-
-
-def _internal_links(exclude_slug, count=6):
-    links = []
-    for p in EXISTING_PAGES:
-        if p["slug"] != exclude_slug and len(links) < count:
-            links.append(f'<li><a href="{p["slug"]}.html" class="text-primary-600 hover:underline">{p["title"]}</a></li>')
-    return '<ul class="grid sm:grid-cols-2 gap-2 mt-4 mb-8">' + "".join(links) + "</ul>"
+from pseo_link_graph import internal_links
 
 
 def generate_example_pages():
@@ -65,7 +58,6 @@ def generate_example_pages():
          "result": "Všech 800 knih přehledně na jednom místě. Industriální design jako z interiérového časopisu.", "cat": "Domácnost"},
     ]
 
-    pages = []
     for ex in examples:
         slug = ex["slug"]
         steps_html = "".join(f'<li class="flex gap-3"><span class="w-8 h-8 bg-primary-500 text-white rounded-full flex items-center justify-center font-bold flex-shrink-0 text-sm">{i+1}</span><span class="pt-1">{s}</span></li>'
@@ -112,10 +104,10 @@ def generate_example_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další příklady a stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": ex["title"] + " | Bazarovyregal.cz",
             "meta_desc": f"{ex['title']}. {ex['scenario'][:80]} Inspirujte se reálným příkladem.",
@@ -123,13 +115,10 @@ def generate_example_pages():
             "body_html": body,
             "breadcrumb_category": ex["cat"],
             "playbook_type": "examples",
-        })
-    return pages
+        }
 
 
 def generate_directory_pages():
-    pages = []
-
     # Height directory pages
     for h in HEIGHTS:
         shelves = 5 if h >= 180 else 4
@@ -183,10 +172,10 @@ def generate_directory_pages():
                 <p class="text-gray-600">Černá, bílá, červená, modrá a zinkovaný povrch.</p>
             </div>
         </div>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": f"Regály výška {h} cm – {shelves} police, nosnost {capacity} kg | Bazarovyregal.cz",
             "meta_desc": f"Kovové regály výšky {h} cm. {shelves} nastavitelných polic, nosnost {capacity} kg. Od 549 Kč. Všechny barvy skladem.",
@@ -194,7 +183,7 @@ def generate_directory_pages():
             "body_html": body,
             "breadcrumb_category": "Podle výšky",
             "playbook_type": "directory",
-        })
+        }
 
     # Width directory pages
     for w in WIDTHS:
@@ -227,10 +216,10 @@ def generate_directory_pages():
                 <p class="text-gray-600">Ceny regálů šířky {w} cm začínají od 549 Kč podle výšky a povrchu.</p>
             </div>
         </div>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": f"Regály šířka {w} cm – {desc} | Bazarovyregal.cz",
             "meta_desc": f"Kovové regály šířky {w} cm. {desc.capitalize()}. Všechny výšky a barvy. Od 549 Kč.",
@@ -238,7 +227,7 @@ def generate_directory_pages():
             "body_html": body,
             "breadcrumb_category": "Podle šířky",
             "playbook_type": "directory",
-        })
+        }
 
     # Use case directory pages
     for uc in USE_CASES:
@@ -279,10 +268,10 @@ def generate_directory_pages():
                 <p class="text-gray-600">Ceny začínají od 549 Kč za kompletní regál včetně všech polic.</p>
             </div>
         </div>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": f"Regály na {name.lower()} – pevné a levné | Bazarovyregal.cz",
             "meta_desc": f"Kovové regály na {name.lower()}. Nosnost až 175 kg/police, nastavitelné police. Od 549 Kč se zárukou 7 let.",
@@ -290,7 +279,7 @@ def generate_directory_pages():
             "body_html": body,
             "breadcrumb_category": "Podle využití",
             "playbook_type": "directory",
-        })
+        }
 
     # Special directory pages
     for spec in [
@@ -367,10 +356,10 @@ def generate_directory_pages():
                 <p class="text-gray-600">Ano, regály jsou modulární a lze je stavět vedle sebe.</p>
             </div>
         </div>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": spec["title"] + " | Bazarovyregal.cz",
             "meta_desc": spec["title"] + ". Kompletní přehled kovových regálů. Od 549 Kč se zárukou 7 let.",
@@ -378,9 +367,8 @@ def generate_directory_pages():
             "body_html": body,
             "breadcrumb_category": "Přehled",
             "playbook_type": "directory",
-        })
+        }
 
-    return pages
 
 
 def generate_profile_pages():
@@ -411,7 +399,6 @@ def generate_profile_pages():
          "ideal": "sklep, vlhká garáž, venkovní přístřešek, skleník"},
     ]
 
-    pages = []
     for prof in profiles:
         slug = prof["slug"]
 
@@ -481,10 +468,10 @@ def generate_profile_pages():
                 <p class="text-gray-600">Záleží na velikosti prostoru. Změřte dostupnou stěnu a vydělte šířkou regálu.</p>
             </div>
         </div>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": prof["title"] + " | Bazarovyregal.cz",
             "meta_desc": f"{prof['title']}. {prof['desc']} Od {prof['price_from']} Kč, záruka 7 let.",
@@ -492,12 +479,11 @@ def generate_profile_pages():
             "body_html": body,
             "breadcrumb_category": "Profil řady",
             "playbook_type": "profiles",
-        })
-    return pages
+        }
 
 
 if __name__ == "__main__":
-    pages = generate_example_pages() + generate_directory_pages() + generate_profile_pages()
+    pages = [*generate_example_pages(), *generate_directory_pages(), *generate_profile_pages()]
     print(f"Generated {len(pages)} pages")
     for p in pages:
         print(f"  {p['slug']}.html - {p['playbook_type']}")
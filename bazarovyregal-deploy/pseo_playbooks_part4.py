@@ -1,16 +1,12 @@
 #!/usr/bin/env python3
 """pSEO Playbooks Part 4: Conversions, Translations, Integrations"""
 
-from pseo_config import PRODUCTS, CATEGORIES, LOCATIONS, EXISTING_PAGES, IMAGES, BASE_URL
-from pseo_html_template import get_product_cards
+from pseo_config import PRODUCTS, CATEGORIES, LOCATIONS, IMAGES, BASE_URL
+from catalog import CatalogIndex
+from pseo_html_template import get_product_cards, faq_block
+from pseo_link_graph import internal_links
 
-
-def _internal_links(exclude_slug, count=6):
-    links = []
-    for p in EXISTING_PAGES:
-        if p["slug"] != exclude_slug and len(links) < count:
-            links.append(f'<li><a href="{p["slug"]}.html" class="text-primary-600 hover:underline">{p["title"]}</a></li>')
-    return '<ul class="grid sm:grid-cols-2 gap-2 mt-4 mb-8">' + "".join(links) + "</ul>"
+_INDEX = CatalogIndex(PRODUCTS)
 
 
 # ============================================================
@@ -126,7 +122,6 @@ def generate_conversion_pages():
         },
     ]
 
-    pages = []
     for conv in conversions:
         slug = conv["slug"]
 
@@ -142,14 +137,15 @@ def generate_conversion_pages():
         price_table = ""
         if conv["intent"] in ("price", "purchase", "deal"):
             rows = ""
-            for p in sorted(PRODUCTS, key=lambda x: x["price"])[:6]:
-                badge = ' <span class="bg-primary-500 text-white text-xs px-2 py-1 rounded ml-2">Nejlevnější</span>' if p["price"] == 549 else ""
+            cheapest = _INDEX.range("price")[:6]
+            for p in cheapest:
+                badge = ' <span class="bg-primary-500 text-white text-xs px-2 py-1 rounded ml-2">Nejlevnější</span>' if p.price == cheapest[0].price else ""
                 rows += f'''
                 <tr class="border-b hover:bg-gray-50">
-                    <td class="py-3 px-4"><a href="{p['url']}" class="text-primary-600 hover:underline font-medium">{p['name']}</a>{badge}</td>
-                    <td class="py-3 px-4 text-right"><span class="text-gray-400 line-through text-sm">{p['price']*4} Kč</span></td>
-                    <td class="py-3 px-4 text-right font-bold text-primary-600 text-lg">{p['price']} Kč</td>
-                    <td class="py-3 px-4 text-right text-green-600 font-medium">-{75 if p.get('bestseller') else 70}%</td>
+                    <td class="py-3 px-4"><a href="{p.url}" class="text-primary-600 hover:underline font-medium">{p.name}</a>{badge}</td>
+                    <td class="py-3 px-4 text-right"><span class="text-gray-400 line-through text-sm">{p.price_orig} Kč</span></td>
+                    <td class="py-3 px-4 text-right font-bold text-primary-600 text-lg">{p.price} Kč</td>
+                    <td class="py-3 px-4 text-right text-green-600 font-medium">-{p.discount}%</td>
                 </tr>'''
             price_table = f'''
             <h2 class="text-2xl font-bold mb-4">Přehled cen</h2>
@@ -230,10 +226,10 @@ def generate_conversion_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": conv["title"] + " | Bazarovyregal.cz",
             "meta_desc": conv["intro"][:155],
@@ -241,8 +237,7 @@ def generate_conversion_pages():
             "body_html": body,
             "breadcrumb_category": "Nákup",
             "playbook_type": "conversions",
-        })
-    return pages
+        }
 
 
 # ============================================================
@@ -406,17 +401,10 @@ def generate_translation_pages():
         },
     ]
 
-    pages = []
     for tr in translations:
         slug = tr["slug"]
 
-        faq_html = ""
-        for q, a in tr["faq"]:
-            faq_html += f'''
-            <div class="bg-white rounded-xl p-5 shadow-sm">
-                <h3 class="font-bold mb-2">{q}</h3>
-                <p class="text-gray-600">{a}</p>
-            </div>'''
+        faq_html = faq_block(tr["faq"])
 
         body = f'''
         <p class="text-xl text-gray-600 mb-8">{tr["intro"]}</p>
@@ -449,10 +437,10 @@ def generate_translation_pages():
         <div class="space-y-4 mb-8">{faq_html}</div>
 
         <h2 class="text-2xl font-bold mb-4">Ďalšie stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": tr["title"],
             "meta_desc": tr["intro"][:155],
@@ -460,8 +448,7 @@ def generate_translation_pages():
             "body_html": body,
             "breadcrumb_category": "Slovensko",
             "playbook_type": "translations",
-        })
-    return pages
+        }
 
 
 # ============================================================
@@ -716,7 +703,6 @@ def generate_integration_pages():
         },
     ]
 
-    pages = []
     for integ in integrations:
         slug = integ["slug"]
 
@@ -752,10 +738,10 @@ def generate_integration_pages():
         </div>
 
         <h2 class="text-2xl font-bold mb-4">Další stránky</h2>
-        {_internal_links(slug)}
+        {internal_links(slug)}
         '''
 
-        pages.append({
+        yield {
             "slug": slug,
             "title": integ["title"] + " | Bazarovyregal.cz",
             "meta_desc": integ["intro"][:155],
@@ -763,12 +749,11 @@ def generate_integration_pages():
             "body_html": body,
             "breadcrumb_category": "Integrace",
             "playbook_type": "integrations",
-        })
-    return pages
+        }
 
 
 if __name__ == "__main__":
-    pages = generate_conversion_pages() + generate_translation_pages() + generate_integration_pages()
+    pages = [*generate_conversion_pages(), *generate_translation_pages(), *generate_integration_pages()]
     print(f"Generated {len(pages)} pages")
     for p in pages:
         print(f"  {p['slug']}.html - {p['playbook_type']}")
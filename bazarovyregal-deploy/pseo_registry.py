@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Registry of all pSEO playbooks for Bazarovyregal.cz
+
+Each entry describes one playbook:
+    name      - registry key, identical to the playbook_type of its pages
+    label     - human readable name for build output
+    generator - function yielding page dicts
+    module    - module that defines the generator
+    depends   - pseo_config datasets the generator reads
+    output    - what the playbook produces ("pages" = one HTML file per page dict)
+"""
+
+from pseo_playbooks_part1 import generate_location_pages, generate_persona_pages, generate_glossary_pages
+from pseo_playbooks_part2 import generate_comparison_pages, generate_curation_pages, generate_template_pages
+from pseo_playbooks_part3 import generate_example_pages, generate_directory_pages, generate_profile_pages
+from pseo_playbooks_part4 import generate_conversion_pages, generate_translation_pages, generate_integration_pages
+
+PLAYBOOKS = [
+    {"name": "locations", "label": "Location", "generator": generate_location_pages,
+     "module": "pseo_playbooks_part1", "depends": ["LOCATIONS", "PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "personas", "label": "Persona", "generator": generate_persona_pages,
+     "module": "pseo_playbooks_part1", "depends": ["PERSONAS", "PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "glossary", "label": "Glossary", "generator": generate_glossary_pages,
+     "module": "pseo_playbooks_part1", "depends": ["GLOSSARY_TERMS", "PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "comparisons", "label": "Comparison", "generator": generate_comparison_pages,
+     "module": "pseo_playbooks_part2", "depends": ["COMPARISONS", "PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "curation", "label": "Curation", "generator": generate_curation_pages,
+     "module": "pseo_playbooks_part2", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "templates", "label": "Template", "generator": generate_template_pages,
+     "module": "pseo_playbooks_part2", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "examples", "label": "Example", "generator": generate_example_pages,
+     "module": "pseo_playbooks_part3", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "directory", "label": "Directory", "generator": generate_directory_pages,
+     "module": "pseo_playbooks_part3", "depends": ["HEIGHTS", "WIDTHS", "USE_CASES", "PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "profiles", "label": "Profile", "generator": generate_profile_pages,
+     "module": "pseo_playbooks_part3", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "conversions", "label": "Conversion", "generator": generate_conversion_pages,
+     "module": "pseo_playbooks_part4", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "translations", "label": "Translation", "generator": generate_translation_pages,
+     "module": "pseo_playbooks_part4", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+    {"name": "integrations", "label": "Integration", "generator": generate_integration_pages,
+     "module": "pseo_playbooks_part4", "depends": ["PRODUCTS", "EXISTING_PAGES"], "output": "pages"},
+]
+
+PLAYBOOKS_BY_NAME = {pb["name"]: pb for pb in PLAYBOOKS}
+
+
+def select_playbooks(names=None):
+    """Return registry entries for the given names (all playbooks if names is empty).
+
+    Entries keep registry order. Raises ValueError for unknown names.
+    """
+    if not names:
+        return list(PLAYBOOKS)
+    unknown = [n for n in names if n not in PLAYBOOKS_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown playbook(s): {', '.join(unknown)}. "
+                         f"Available: {', '.join(PLAYBOOKS_BY_NAME)}")
+    return [pb for pb in PLAYBOOKS if pb["name"] in names]
+
+
+def playbooks_for_module(module_name):
+    """Registry entries whose generator lives in module_name."""
+    return [pb for pb in PLAYBOOKS if pb["module"] == module_name]
+
+
+def playbooks_for_datasets(dataset_names):
+    """Registry entries that read any of the given pseo_config datasets."""
+    changed = set(dataset_names)
+    return [pb for pb in PLAYBOOKS if changed & set(pb["depends"])]
+
+
+if __name__ == "__main__":
+    for pb in PLAYBOOKS:
+        print(f"  {pb['name']:<14} {pb['module']:<22} -> {pb['output']:<6} depends: {', '.join(pb['depends'])}")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Sitemap writer for Bazarovyregal.cz
+
+Takes URL records in a single pass and streams them to disk. Up to the shard
+threshold a plain sitemap.xml <urlset> is written. Above it, sitemap.xml
+becomes a <sitemapindex> pointing at gzipped shards (sitemap-1.xml.gz, ...),
+each within the protocol limits of 50,000 URLs and 50 MB uncompressed.
+A shard's <lastmod> in the index is the newest lastmod of its URLs, so it
+only moves when one of them changed.
+
+A URL record is a dict: {"loc": ..., "lastmod": ..., "changefreq": ..., "priority": ...};
+only "loc" is required.
+"""
+
+import os
+import re
+import glob
+import gzip
+from contextlib import ExitStack
+from itertools import chain
+from xml.sax.saxutils import escape
+
+from build_output import OutputWriter
+
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_OPEN = f'<urlset xmlns="{SITEMAP_NS}">\n'
+URLSET_CLOSE = "</urlset>\n"
+INDEX_OPEN = f'<sitemapindex xmlns="{SITEMAP_NS}">\n'
+INDEX_CLOSE = "</sitemapindex>\n"
+
+_URL_RE = re.compile(r"<url>(.*?)</url>", re.S)
+_SITEMAP_RE = re.compile(r"<sitemap>\s*<loc>(.*?)</loc>", re.S)
+_TAG_RE = re.compile(r"<(loc|lastmod|changefreq|priority)>(.*?)</\1>", re.S)
+
+
+def url_entry(record):
+    """Serialize one URL record as a <url> element."""
+    parts = [f"  <url>\n    <loc>{escape(record['loc'])}</loc>\n"]
+    for tag in ("lastmod", "changefreq", "priority"):
+        if record.get(tag):
+            parts.append(f"    <{tag}>{record[tag]}</{tag}>\n")
+    parts.append("  </url>\n")
+    return "".join(parts)
+
+
+def _unescape(text):
+    return text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+
+
+def _read_text(path):
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def read_sitemap_records(output_dir, filename="sitemap.xml"):
+    """Yield URL records from an existing sitemap, following a sitemap index into its shards."""
+    path = os.path.join(output_dir, filename)
+    if not os.path.exists(path):
+        return
+    content = _read_text(path)
+    if "<sitemapindex" in content:
+        for loc in _SITEMAP_RE.findall(content):
+            shard = os.path.basename(_unescape(loc.strip()))
+            yield from read_sitemap_records(output_dir, shard)
+        return
+    for block in _URL_RE.findall(content):
+        record = {tag: _unescape(value.strip()) for tag, value in _TAG_RE.findall(block)}
+        if record.get("loc"):
+            yield record
+
+
+def _open_shard(writer, number):
+    name = f"sitemap-{number}.xml.gz"
+    stack = ExitStack()
+    raw = stack.enter_context(writer.open(name))
+    # mtime=0 keeps the gzip bytes reproducible for unchanged shards
+    f = stack.enter_context(gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0))
+    f.write((XML_HEADER + URLSET_OPEN).encode("utf-8"))
+    return name, stack, f
+
+
+def write_sitemap(records, output_dir, base_url, filename="sitemap.xml",
+                  shard_threshold=SITEMAP_MAX_URLS, max_urls=SITEMAP_MAX_URLS, max_bytes=SITEMAP_MAX_BYTES,
+                  writer=None):
+    """Stream URL records to filename, sharding into a gzipped sitemap index above shard_threshold.
+
+    Each shard holds at most shard_threshold URLs (never more than max_urls)
+    and max_bytes of uncompressed XML. Files go through writer (an
+    OutputWriter, so --dry-run writes nothing). Returns {"urls": count, "files": [file names]}.
+    """
+    writer = writer or OutputWriter(output_dir)
+    shard_threshold = max_urls = min(shard_threshold, max_urls)
+    envelope = len((XML_HEADER + URLSET_OPEN + URLSET_CLOSE).encode("utf-8"))
+    records = iter(records)
+
+    # Buffer up to the threshold: small sitemaps stay a single plain file
+    buffered = []
+    buffered_bytes = envelope
+    overflow = None
+    for record in records:
+        entry = url_entry(record).encode("utf-8")
+        if len(buffered) >= shard_threshold or buffered_bytes + len(entry) > max_bytes:
+            overflow = (entry, record.get("lastmod"))
+            break
+        buffered.append((entry, record.get("lastmod")))
+        buffered_bytes += len(entry)
+
+    stale_shards = {os.path.basename(p) for p in glob.glob(os.path.join(output_dir, "sitemap-*.xml.gz"))}
+
+    if overflow is None:
+        with writer.open(filename) as f:
+            f.write((XML_HEADER + URLSET_OPEN).encode("utf-8"))
+            f.writelines(entry for entry, _ in buffered)
+            f.write(URLSET_CLOSE.encode("utf-8"))
+        for shard in sorted(stale_shards):
+            writer.remove(shard)
+        return {"urls": len(buffered), "files": [filename]}
+
+    # Sharded mode: stream the buffer, the overflow entry and the rest into .xml.gz shards
+    shards = []  # [name, newest lastmod of its URLs]
+    count = 0
+    shard_urls = shard_bytes = 0
+    stack = shard = None
+    entries = chain(buffered, [overflow], ((url_entry(r).encode("utf-8"), r.get("lastmod")) for r in records))
+    for entry, lastmod in entries:
+        if shard is None or shard_urls >= max_urls or shard_bytes + len(entry) > max_bytes:
+            if shard is not None:
+                shard.write(URLSET_CLOSE.encode("utf-8"))
+                stack.close()
+            name, stack, shard = _open_shard(writer, len(shards) + 1)
+            shards.append([name, ""])
+            shard_urls, shard_bytes = 0, envelope
+        shard.write(entry)
+        shard_urls += 1
+        shard_bytes += len(entry)
+        count += 1
+        if lastmod and lastmod > shards[-1][1]:
+            shards[-1][1] = lastmod
+    shard.write(URLSET_CLOSE.encode("utf-8"))
+    stack.close()
+
+    index = [XML_HEADER, INDEX_OPEN]
+    for name, lastmod in shards:
+        lastmod_tag = f"    <lastmod>{lastmod}</lastmod>\n" if lastmod else ""
+        index.append(f"  <sitemap>\n    <loc>{escape(base_url)}/{name}</loc>\n{lastmod_tag}  </sitemap>\n")
+    index.append(INDEX_CLOSE)
+    writer.write(filename, "".join(index))
+    names = [name for name, _ in shards]
+    for stale in sorted(stale_shards - set(names)):
+        writer.remove(stale)
+    return {"urls": count, "files": [filename] + names}
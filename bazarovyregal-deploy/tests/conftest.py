@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The build scripts are flat modules in the deploy dir
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
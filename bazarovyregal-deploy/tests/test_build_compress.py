@@ -0,0 +1,39 @@
+import os
+
+import build_compress
+from build_output import OutputWriter
+from sitemap_writer import write_sitemap
+
+
+def _records(count):
+    return [{"loc": f"https://example.cz/page-{i}.html", "lastmod": "2026-01-01"} for i in range(count)]
+
+
+def test_compress_keeps_sitemap_shards(tmp_path):
+    out = str(tmp_path)
+    result = write_sitemap(_records(25), out, "https://example.cz", shard_threshold=10)
+    shards = result["files"][1:]
+    assert len(shards) == 3
+
+    build_compress.build(out, OutputWriter(out))
+    build_compress.build(out, OutputWriter(out))
+
+    for shard in shards:
+        assert os.path.exists(os.path.join(out, shard))
+    assert os.path.exists(os.path.join(out, "sitemap.xml.gz"))
+
+
+def test_compress_removes_siblings_of_deleted_sources(tmp_path):
+    out = str(tmp_path)
+    (tmp_path / "a.html").write_text("<p>a</p>")
+    (tmp_path / "b.html").write_text("<p>b</p>")
+    build_compress.build(out, OutputWriter(out))
+    assert (tmp_path / "b.html.gz").exists()
+
+    (tmp_path / "b.html").unlink()
+    (tmp_path / "orphan.xml.gz").write_bytes(b"not ours")
+    build_compress.build(out, OutputWriter(out))
+
+    assert not (tmp_path / "b.html.gz").exists()
+    assert (tmp_path / "a.html.gz").exists()
+    assert (tmp_path / "orphan.xml.gz").exists()
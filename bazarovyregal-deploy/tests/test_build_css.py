@@ -0,0 +1,45 @@
+import os
+
+import build_css
+from build_output import OutputWriter
+
+
+def _page(classes, stylesheet=None):
+    link = f'<link rel="stylesheet" href="{stylesheet}">' if stylesheet else ""
+    return f'<html><head>{link}</head><body><main class="{classes}"><p>x</p></main></body></html>'
+
+
+def test_prose_classes_generate_css():
+    css, generated = build_css.generate_css({"prose", "prose-lg", "prose-gray", "max-w-none"})
+    assert {"prose", "prose-lg", "prose-gray", "max-w-none"} <= generated
+    assert ".prose{" in css and "max-width:65ch" in css
+    assert '.prose :where(h2):not(:where([class~="not-prose"],[class~="not-prose"] *))' in css
+    assert ".prose-lg{font-size:1.125rem" in css
+    # max-w-none is a utility, so it comes after (and overrides) the prose max-width
+    assert css.index(".max-w-none{") > css.index(".prose{")
+
+
+def test_unknown_classes_are_reported(tmp_path):
+    (tmp_path / "a.html").write_text(_page("prose not-prose tab-btn no-such-utility-xyz flex"))
+    result = build_css.build(str(tmp_path), OutputWriter(str(tmp_path), dry_run=True))
+    unknown = result[4]
+    assert "flex" not in unknown and "prose" not in unknown and "tab-btn" not in unknown
+    assert "no-such-utility-xyz" in unknown
+
+
+def test_old_stylesheet_kept_while_linked(tmp_path):
+    (tmp_path / "tailwind.aaaaaaaaaa.css").write_text("/* linked */")
+    (tmp_path / "tailwind.bbbbbbbbbb.css").write_text("/* orphan */")
+    (tmp_path / "a.html").write_text(_page("flex", "tailwind.aaaaaaaaaa.css"))
+
+    filename, *_, kept = build_css.build(str(tmp_path), OutputWriter(str(tmp_path)))
+
+    assert os.path.exists(tmp_path / filename)
+    assert kept == ["tailwind.aaaaaaaaaa.css"]
+    assert os.path.exists(tmp_path / "tailwind.aaaaaaaaaa.css")
+    assert not os.path.exists(tmp_path / "tailwind.bbbbbbbbbb.css")
+
+    # Once the page links the new build, the next build removes the old file
+    (tmp_path / "a.html").write_text(_page("flex", filename))
+    build_css.build(str(tmp_path), OutputWriter(str(tmp_path)))
+    assert not os.path.exists(tmp_path / "tailwind.aaaaaaaaaa.css")
@@ -0,0 +1,48 @@
+import io
+import os
+
+import pytest
+
+import build_images
+from build_output import OutputWriter
+
+WEBP_JPEG = [f for f in build_images.FORMATS if f[0] != "avif"]
+ENTRY = {"source": "x", "width": 960, "height": 700, "variants": {
+    "webp": [[480, "home-480.aaaaaaaaaa.webp"], [960, "home-960.bbbbbbbbbb.webp"]],
+    "jpg": [[480, "home-480.cccccccccc.jpg"], [960, "home-960.dddddddddd.jpg"]],
+}}
+
+
+def test_picture_without_avif_variants():
+    tag = build_images.picture_tag("home.png", ENTRY, '<img src="home.png" alt="Domov">')
+    assert 'type="image/avif"' not in tag
+    assert '<source type="image/webp" srcset="home-480.aaaaaaaaaa.webp 480w, home-960.bbbbbbbbbb.webp 960w"' in tag
+    assert '<img src="home-960.dddddddddd.jpg"' in tag and 'alt="Domov"' in tag
+
+
+def test_without_encoder_pages_keep_original_images(tmp_path):
+    (tmp_path / "home.png").write_bytes(b"not really a png")
+    page = '<html><body><img src="home.png" alt="Domov"></body></html>'
+    (tmp_path / "index.html").write_text(page)
+
+    state, encoded, rewritten, skipped = build_images.build(str(tmp_path), OutputWriter(str(tmp_path)), formats=[])
+
+    assert (state, encoded, rewritten, skipped) == ({}, [], 0, ["home.png"])
+    assert (tmp_path / "index.html").read_text() == page
+
+
+def test_webp_and_jpeg_written_without_avif(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    buf = io.BytesIO()
+    Image.new("RGB", (600, 400), "orange").save(buf, format="PNG")
+    (tmp_path / "home.png").write_bytes(buf.getvalue())
+    (tmp_path / "index.html").write_text('<img src="home.png" alt="Domov">')
+
+    state, encoded, rewritten, _ = build_images.build(str(tmp_path), OutputWriter(str(tmp_path)), formats=WEBP_JPEG)
+
+    assert encoded == ["home.png"] and rewritten == 1
+    assert set(state["home.png"]["variants"]) == {"webp", "jpg"}
+    html = (tmp_path / "index.html").read_text()
+    assert 'type="image/webp"' in html and "image/avif" not in html
+    for items in state["home.png"]["variants"].values():
+        assert all(os.path.exists(tmp_path / filename) for _, filename in items)
@@ -0,0 +1,60 @@
+import re
+import json
+
+import catalog
+from catalog import PRODUCTS, PRICES, featured_products, products_json
+from generate_full_product_pages import generate_html
+from generate_seo_pages import generate_product_cards
+from pseo_html_template import build_schema_json, get_product_cards
+
+_PAGE_PRICE_RE = re.compile(r'text-4xl font-extrabold text-primary-600">(\d+) Kč</span>\s*'
+                            r'<span class="text-xl text-gray-400 line-through">(\d+) Kč</span>\s*'
+                            r'<span[^>]*>-(\d+)%</span>')
+_CARD_RE = re.compile(r'<a href="([^"]+)".*?-(\d+)%</span>.*?primary-600">(\d+) K[cč]</span>\s*'
+                      r'<span class="text-sm text-gray-400 line-through">(\d+) K[cč]</span>', re.S)
+
+
+def _shown(p):
+    return p.price, p.price_orig, p.discount
+
+
+def test_one_record_per_variant():
+    assert len({p.slug for p in PRODUCTS}) == len(catalog.VARIANTS) == len(PRODUCTS)
+    for p in featured_products():
+        assert p is catalog.BY_SLUG[p.slug]
+
+
+def test_supplier_rows_override_the_formula():
+    for p in PRODUCTS:
+        if p.slug in PRICES:
+            assert _shown(p) == PRICES[p.slug]
+        else:
+            assert p.price == catalog.formula_price(p.height, p.width, p.depth, p.color_slug)
+
+
+def test_product_page_shows_the_record():
+    for p in PRODUCTS:
+        m = _PAGE_PRICE_RE.search(generate_html(p))
+        assert m, p.slug
+        assert tuple(map(int, m.groups())) == _shown(p)
+
+
+def test_cards_show_the_record():
+    featured = featured_products()
+    for html in (generate_product_cards(featured), get_product_cards(featured, len(featured))):
+        cards = _CARD_RE.findall(html)
+        assert len(cards) == len(featured)
+        for url, discount, price, price_orig in cards:
+            p = catalog.BY_SLUG[url[:-len(".html")]]
+            assert (int(price), int(price_orig), int(discount)) == _shown(p)
+
+
+def test_json_and_offers_show_the_record():
+    data = json.loads(products_json())
+    rows = [dict(zip(data["fields"], row)) for row in data["rows"]]
+    assert [(r["price"], r["priceOrig"], r["discount"]) for r in rows] == [_shown(p) for p in PRODUCTS]
+
+    featured = featured_products()
+    tags = build_schema_json("x", "t", "d", "h", "c", playbook_type="conversions", products=featured)
+    offers = json.loads(re.findall(r'<script type="application/ld\+json">(.*?)</script>', tags)[-1])["itemListElement"]
+    assert [(o["url"].rsplit("/", 1)[1], o["price"]) for o in offers] == [(p.url, p.price) for p in featured[:6]]
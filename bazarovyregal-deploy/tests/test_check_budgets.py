@@ -0,0 +1,38 @@
+import json
+
+import check_budgets
+import dev_server
+import pseo_registry
+from catalog import PRODUCTS
+
+
+def test_families_come_from_manifest_without_generators(tmp_path, monkeypatch):
+    def fail():
+        raise AssertionError("a pSEO generator ran")
+    for playbook in pseo_registry.PLAYBOOKS:
+        monkeypatch.setitem(playbook, "generator", fail)
+
+    manifest = {"pages": [{"slug": "slovnik-koroze", "type": "glossary", "title": "t", "h1": "h"}]}
+    (tmp_path / "pseo_manifest.json").write_text(json.dumps(manifest))
+    for name in ("slovnik-koroze.html", PRODUCTS[0].url, "index.html", "o-nas.html", "vsechny-regaly.html"):
+        (tmp_path / name).write_text("<html></html>")
+
+    assert check_budgets.page_families(str(tmp_path)) == {
+        "slovnik-koroze.html": "article",
+        PRODUCTS[0].url: "product",
+        "vsechny-regaly.html": "catalog",
+        "index.html": "home",
+        "o-nas.html": "static",
+    }
+
+
+def test_over_budget_page_is_a_violation(tmp_path):
+    (tmp_path / "index.html").write_text("<html><body>" + "x" * 80_000 + "</body></html>")
+    _, violations = check_budgets.check(str(tmp_path))
+    assert [(name, key) for name, _, key, _, _ in violations] == [("index.html", "html")]
+
+
+def test_rebuilds_end_with_budget_check():
+    commands = dev_server.plan_rebuild({"generate_seo_pages.py"}, {}, {})
+    assert commands == [["generate_seo_pages.py"], ["check_budgets.py"]]
+    assert dev_server.plan_rebuild(set(), {}, {}) == []
@@ -0,0 +1,19 @@
+from fragment_cache import cached_fragment, cache_stats, clear_caches
+
+
+@cached_fragment("test_card")
+def card(name):
+    return f"<div>{name}</div>"
+
+
+def test_clear_caches_starts_a_new_count():
+    card("a")
+    card("a")
+    assert cache_stats()["test_card"]["hits"] >= 1
+
+    clear_caches()
+    assert cache_stats() == {}
+
+    card("a")
+    card("a")
+    assert cache_stats()["test_card"] == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
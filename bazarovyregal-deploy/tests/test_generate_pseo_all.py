@@ -0,0 +1,17 @@
+from generate_pseo_all import content_written, is_content_output
+
+
+def test_content_outputs():
+    for name in ("slovnik-koroze.html", "sitemap.xml", "sitemap-1.xml.gz", "robots.txt"):
+        assert is_content_output(name)
+    for name in (".sitemap_lastmod_stat.json", "sitemap_lastmod.json", "pseo_manifest.json",
+                 "pseo_build_profile.json", "sitemap.xml.br"):
+        assert not is_content_output(name)
+
+
+def test_state_file_writes_do_not_advance_generated_at():
+    records = [("slovnik-koroze.html", "unchanged", 10, 10), ("sitemap.xml", "unchanged", 5, 5),
+               (".sitemap_lastmod_stat.json", "changed", 100, 120), ("sitemap_lastmod.json", "created", 0, 50)]
+    assert not content_written(records)
+    assert content_written(records + [("sitemap-2.xml.gz", "changed", 40, 41)])
+    assert content_written(records + [("old-page.html", "deleted", 40, 0)])
@@ -0,0 +1,49 @@
+import json
+
+from generate_pseo_all import final_links, persisted_links
+from pseo_link_graph import link_targets, set_link_pages
+
+
+def _summaries():
+    pages = []
+    for playbook, words in (("glossary", ["police", "nosnost", "montaz", "rozmer"]),
+                            ("comparisons", ["police-nosnost", "montaz-rozmer", "regal-police"])):
+        for word in words:
+            slug = f"{playbook}-{word}"
+            pages.append({"slug": slug, "playbook_type": playbook, "title": f"{word} | Shop", "h1": word})
+    return pages
+
+
+def test_manifest_round_trip():
+    site = _summaries()
+    set_link_pages(site)
+    links = final_links(site, site)
+    manifest = {"pages": [{"slug": s["slug"], "type": s["playbook_type"], "title": s["title"], "h1": s["h1"],
+                           "hash": "x", "links": links[s["slug"]]} for s in site]}
+    summaries, neighbours = persisted_links(json.loads(json.dumps(manifest)))
+    assert summaries == site
+    assert neighbours == links
+
+
+def test_retitled_page_marks_its_neighbours_stale():
+    site = _summaries()
+    set_link_pages(site)
+    rendered = {s["slug"]: link_targets(s["slug"]) for s in site}
+
+    changed = [dict(s, h1="police a nosnost") if s["slug"] == "comparisons-police-nosnost" else s for s in site]
+    links = final_links(changed, site)
+    stale = {slug for slug in links if rendered[slug] != links[slug]}
+
+    linking = {slug for slug, targets in rendered.items() if "comparisons-police-nosnost" in dict(targets)}
+    assert linking
+    assert linking <= stale
+    # Pages of other playbooks (not rebuilt under --only) are affected too
+    assert any(slug.startswith("glossary-") for slug in linking)
+    assert ("comparisons-police-nosnost", "police a nosnost") in links[sorted(linking)[0]]
+
+
+def test_unchanged_page_set_keeps_precomputed_links():
+    site = _summaries()
+    neighbours = {s["slug"]: [("kontakt", "Kontakt")] for s in site}
+    set_link_pages(site, neighbours)
+    assert final_links(site, site) == neighbours